@@ -1,4 +1,4 @@
 # Mapping services
-from .airport_mapper import AirportMapper
+from app.services.airport_mapper import AirportMapper  # moved to app/services
 from .area_mapper import AreaMapper
 
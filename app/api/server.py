@@ -1,24 +1,39 @@
 """
 app/api/server.py — FastAPI application.
 /chat endpoint: injects GPS location into GraphState, invokes LangGraph.
+/chat/stream endpoint: same turn, streamed as Server-Sent Events.
+/metrics endpoint: Prometheus latency histograms and counters.
 /reverse-geocode endpoint: server-side Google Maps call (keeps API key private).
 """
 import asyncio
+import json
 import os
 import re
 import subprocess
 import sys
+import time
 from datetime import datetime
 from contextlib import asynccontextmanager
 
-import aiohttp
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
+from sse_starlette.sse import EventSourceResponse
 
 from app.api.schemas import ChatRequest, ChatResponse, ReverseGeocodeRequest
 from app.graph.builder import build_graph
+from app.services.http_client import init_http_session, close_http_session, http_session, http_pool_stats
+from app.services.redis_pool import init_redis_pool, close_redis_pool, redis_pool_stats
+from app.services.llm_gateway import llm_stats
+from app.services.area_cache import area_cache_stats
+from app.services.geocode_cache import geocode_cache_stats
+from app.services.job_scheduler import init_scheduler, drain_scheduler, job_scheduler_stats
+from app.services.stage_prefetch import prefetch_stats
+from app.services.reddit_client import init_reddit_client, close_reddit_client, reddit_client_stats
+from app.services.reddit_store import reddit_store_stats
+from app.services.stream_events import bind_stream, unbind_stream, emit
+from app.services.tracing import TURN_SECONDS, end_turn, render_metrics, span, start_turn, turn_summary
 from app.utils.conversation_logger import save_conversation
 from app.utils.logger import get_logger
 from app.utils.place_photos import fetch_place_photos
@@ -110,6 +125,15 @@ async def lifespan(app: FastAPI):
 
     await asyncio.sleep(2)  # give servers time to bind their ports
 
+    # Shared Redis pool — area_cache, planning and in_destination all borrow from it
+    await init_redis_pool()
+    # Shared HTTP session — Groq, Tavily, Nominatim, OSRM, Google and MCP reuse its connections
+    await init_http_session()
+    # Shared Reddit client — one OAuth session and one header-fed rate limiter per worker
+    await init_reddit_client()
+    # Background jobs — prefetches, cache refreshes, score persistence
+    await init_scheduler()
+
     compiled, checkpointer = await build_graph()
     app.state.graph = compiled
     app.state.checkpointer = checkpointer
@@ -118,6 +142,11 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("Server shutting down — terminating all subprocesses")
+    # Drain before closing the clients the jobs use
+    await drain_scheduler()
+    await close_reddit_client()
+    await close_http_session()
+    await close_redis_pool()
     for proc in procs:
         proc.terminate()
 
@@ -152,6 +181,106 @@ async def session():
     return {"thread_id": app.state.thread_id}
 
 
+def _build_state_input(request: ChatRequest) -> dict:
+    """
+    Per-turn graph input. Only the NEW user message is passed — LangGraph loads
+    the thread checkpoint and appends it via the add_messages reducer.
+    """
+    user_message = {"role": "user", "content": request.message}
+    # thread_id also rides in state (config alone doesn't reach stage_machine):
+    # speculative prefetch rounds are scoped per thread
+    state_input: dict = {"messages": [user_message], "tool_events": [], "thread_id": request.thread_id}
+
+    # Phase 0 fields — only injected when present; checkpointer persists them across turns
+    if request.trip_mode:
+        state_input["trip_mode"] = request.trip_mode
+    if request.trip_who:
+        state_input["trip_who"] = request.trip_who
+    if request.trip_season:
+        state_input["trip_season"] = request.trip_season
+
+    if request.location:
+        state_input["current_location"] = request.location.model_dump()
+
+    if request.card_action:
+        state_input["card_action"] = request.card_action
+        state_input["card_data"] = request.card_data or {}
+    return state_input
+
+
+async def _finalise_turn(
+    request: ChatRequest,
+    final_state: dict,
+    turn: tuple | None = None,
+) -> ChatResponse:
+    """
+    Photos, conversation log and response shaping shared by /chat and /chat/stream.
+    turn = (start_turn() token, perf_counter start, endpoint) adds a "[timing]"
+    breakdown of every node and external call to this turn's tool_events.
+    """
+    response_text = final_state.get("response", "I'm not sure how to help with that. Could you rephrase?")
+    messages = final_state.get("messages", [])
+    tool_events = list(final_state.get("tool_events") or [])
+
+    # Fetch place photos — ranked_places first, then bold-text extraction, then destination fallback
+    photo_names: list[str] = []
+    for p in (final_state.get("ranked_places") or [])[:5]:
+        name = p.get("name") if isinstance(p, dict) else getattr(p, "name", None)
+        if name:
+            photo_names.append(name)
+    if not photo_names and response_text:
+        photo_names = _extract_bold_places(response_text)
+    if not photo_names and final_state.get("destination"):
+        photo_names = [final_state["destination"]]
+    place_photos: list = []
+    if photo_names:
+        with span("google_photos", "response"):
+            place_photos = await fetch_place_photos(photo_names, GOOGLE_MAPS_KEY)
+
+    if turn is not None:
+        token, started, endpoint = turn
+        total = time.perf_counter() - started
+        TURN_SECONDS.observe(total, endpoint)
+        timing = turn_summary(end_turn(token), total)
+        logger.info(timing)
+        tool_events.append(timing)
+
+    # Attach tool_events to the last assistant message so they appear in the saved JSON
+    if tool_events and messages:
+        msgs_as_dicts = []
+        for m in messages:
+            if isinstance(m, dict):
+                msgs_as_dicts.append(m)
+            else:
+                msgs_as_dicts.append({"role": getattr(m, "type", "user"), "content": getattr(m, "content", "")})
+        # Find and annotate the last assistant message
+        for i in reversed(range(len(msgs_as_dicts))):
+            if msgs_as_dicts[i].get("role") in ("assistant", "ai"):
+                msgs_as_dicts[i]["tools_used"] = tool_events
+                break
+        save_conversation(request.thread_id, msgs_as_dicts)
+    else:
+        save_conversation(request.thread_id, messages)
+
+    hotel_data = final_state.get("hotel_data") or []
+    if not isinstance(hotel_data, list):
+        hotel_data = []
+    frontend_places = _build_frontend_places(
+        final_state.get("ranked_places") or [], place_photos
+    )
+
+    return ChatResponse(
+        response=response_text,
+        thread_id=request.thread_id,
+        phase=str(final_state.get("phase", "unknown")),
+        photos=place_photos,
+        hotels=hotel_data,
+        places=frontend_places,
+        action=final_state.get("action"),
+        payload=final_state.get("payload"),
+    )
+
+
 @app.post("/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     """
@@ -163,89 +292,67 @@ async def chat(request: ChatRequest):
     and runs the graph forward automatically.
     """
     config = {"configurable": {"thread_id": request.thread_id}}
-
     graph = app.state.graph
-    user_message = {"role": "user", "content": request.message}
 
+    turn = (start_turn(), time.perf_counter(), "chat")
     try:
-        # LangGraph automatically loads the matching thread checkpoint,
-        # applies the add_messages reducer to our new user_message,
-        # and starts execution from START to process the new turn.
-        state_input: dict = {"messages": [user_message], "tool_events": []}
-
-        # Phase 0 fields — only injected when present; checkpointer persists them across turns
-        if request.trip_mode:
-            state_input["trip_mode"] = request.trip_mode
-        if request.trip_who:
-            state_input["trip_who"] = request.trip_who
-        if request.trip_season:
-            state_input["trip_season"] = request.trip_season
-
-        # Don't pass thread_id inside state_input, it confuses Pregel
-        if request.location:
-            state_input["current_location"] = request.location.model_dump()
-
-        if request.card_action:
-            state_input["card_action"] = request.card_action
-            state_input["card_data"] = request.card_data or {}
-
-        final_state = await graph.ainvoke(state_input, config=config)
-
-        response_text = final_state.get("response", "I'm not sure how to help with that. Could you rephrase?")
-        messages = final_state.get("messages", [])
-        tool_events = final_state.get("tool_events", [])
-
-        # Fetch place photos — ranked_places first, then bold-text extraction, then destination fallback
-        photo_names: list[str] = []
-        for p in (final_state.get("ranked_places") or [])[:5]:
-            name = p.get("name") if isinstance(p, dict) else getattr(p, "name", None)
-            if name:
-                photo_names.append(name)
-        if not photo_names and response_text:
-            photo_names = _extract_bold_places(response_text)
-        if not photo_names and final_state.get("destination"):
-            photo_names = [final_state["destination"]]
-        place_photos = await fetch_place_photos(photo_names, GOOGLE_MAPS_KEY) if photo_names else []
-
-        # Attach tool_events to the last assistant message so they appear in the saved JSON
-        if tool_events and messages:
-            msgs_as_dicts = []
-            for m in messages:
-                if isinstance(m, dict):
-                    msgs_as_dicts.append(m)
-                else:
-                    msgs_as_dicts.append({"role": getattr(m, "type", "user"), "content": getattr(m, "content", "")})
-            # Find and annotate the last assistant message
-            for i in reversed(range(len(msgs_as_dicts))):
-                if msgs_as_dicts[i].get("role") in ("assistant", "ai"):
-                    msgs_as_dicts[i]["tools_used"] = tool_events
-                    break
-            save_conversation(request.thread_id, msgs_as_dicts)
-        else:
-            save_conversation(request.thread_id, messages)
-
-        hotel_data = final_state.get("hotel_data") or []
-        if not isinstance(hotel_data, list):
-            hotel_data = []
-        frontend_places = _build_frontend_places(
-            final_state.get("ranked_places") or [], place_photos
-        )
-
-        return ChatResponse(
-            response=response_text,
-            thread_id=request.thread_id,
-            phase=str(final_state.get("phase", "unknown")),
-            photos=place_photos,
-            hotels=hotel_data,
-            places=frontend_places,
-            action=final_state.get("action"),
-            payload=final_state.get("payload"),
-        )
+        final_state = await graph.ainvoke(_build_state_input(request), config=config)
+        return await _finalise_turn(request, final_state, turn)
     except Exception as e:
         logger.exception(f"/chat error for thread {request.thread_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Same turn as /chat, delivered progressively as Server-Sent Events.
+
+    Events (see app/services/stream_events.py): `node` as each LangGraph node
+    finishes, `action` as soon as determine_action resolves, `token` for
+    responder text, then `done` with the full ChatResponse (or `error`).
+    """
+    config = {"configurable": {"thread_id": request.thread_id}}
+    graph = app.state.graph
+    state_input = _build_state_input(request)
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def run_turn() -> None:
+        token = bind_stream(queue)
+        started = time.perf_counter()
+        turn = (start_turn(), started, "chat_stream")
+        try:
+            async for update in graph.astream(state_input, config=config, stream_mode="updates"):
+                for node, delta in update.items():
+                    emit("node", {
+                        "node": node,
+                        "keys": sorted(delta.keys()) if isinstance(delta, dict) else [],
+                        "ms": round((time.perf_counter() - started) * 1000),
+                    })
+            snapshot = await graph.aget_state(config)
+            result = await _finalise_turn(request, snapshot.values, turn)
+            emit("done", result.model_dump())
+        except Exception as e:
+            logger.exception(f"/chat/stream error for thread {request.thread_id}: {e}")
+            emit("error", {"detail": str(e)})
+        finally:
+            unbind_stream(token)
+            queue.put_nowait(None)
+
+    async def event_source():
+        task = asyncio.create_task(run_turn())
+        try:
+            while (item := await queue.get()) is not None:
+                event, data = item
+                yield {"event": event, "data": json.dumps(data, default=str)}
+        finally:
+            # Client went away mid-turn — stop the graph instead of finishing for nobody
+            if not task.done():
+                task.cancel()
+
+    return EventSourceResponse(event_source())
+
+
 @app.post("/reverse-geocode")
 async def reverse_geocode(request: ReverseGeocodeRequest):
     """Server-side reverse geocoding to keep GOOGLE_MAPS_KEY private."""
@@ -256,7 +363,7 @@ async def reverse_geocode(request: ReverseGeocodeRequest):
     params = {"latlng": f"{request.lat},{request.lng}", "key": GOOGLE_MAPS_KEY}
 
     try:
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.get(url, params=params) as r:
                 data = await r.json()
                 if data.get("results"):
@@ -270,7 +377,25 @@ async def reverse_geocode(request: ReverseGeocodeRequest):
 
 @app.get("/health")
 async def health():
-    return {"status": "ok", "version": "2.0.0"}
+    return {
+        "status": "ok",
+        "version": "2.0.0",
+        "redis_pool": redis_pool_stats(),
+        "http_pool": http_pool_stats(),
+        "llm": llm_stats(),
+        "area_cache": area_cache_stats(),
+        "geocode": geocode_cache_stats(),
+        "reddit_store": reddit_store_stats(),
+        "reddit_client": reddit_client_stats(),
+        "jobs": job_scheduler_stats(),
+        "prefetch": prefetch_stats(),
+    }
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus scrape target — per-node, per-external-call and per-turn latency."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
 
 
 if __name__ == "__main__":
@@ -18,6 +18,7 @@ from app.graph.nodes.in_destination import in_destination
 from app.graph.nodes.quick_setup import quick_setup, ask_vibe, vibe_or_location
 from app.graph.nodes.resolve_location import resolve_location, ask_for_location, location_resolved_or_ask
 from app.graph.nodes.responder import responder
+from app.services.tracing import traced_node
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -46,26 +47,26 @@ async def build_graph():
 
     workflow = StateGraph(GraphState)
 
-    # ── Register nodes ─────────────────────────────────────────────────────────
-    workflow.add_node("detect_intent", detect_intent)
-    workflow.add_node("clarify", clarify)
-    workflow.add_node("route_phase_fn", _noop)
+    # ── Register nodes (each wrapped for per-node latency metrics) ────────────
+    workflow.add_node("detect_intent", traced_node("detect_intent", detect_intent))
+    workflow.add_node("clarify", traced_node("clarify", clarify))
+    workflow.add_node("route_phase_fn", traced_node("route_phase_fn", _noop))
 
     # Phase 1
-    workflow.add_node("discovery", discovery)
+    workflow.add_node("discovery", traced_node("discovery", discovery))
 
     # Phase 2
-    workflow.add_node("planning", planning)
+    workflow.add_node("planning", traced_node("planning", planning))
 
     # Phase 3
-    workflow.add_node("quick_setup", quick_setup)
-    workflow.add_node("ask_vibe", ask_vibe)
-    workflow.add_node("resolve_location", resolve_location)
-    workflow.add_node("ask_for_location", ask_for_location)
-    workflow.add_node("in_destination", in_destination)
+    workflow.add_node("quick_setup", traced_node("quick_setup", quick_setup))
+    workflow.add_node("ask_vibe", traced_node("ask_vibe", ask_vibe))
+    workflow.add_node("resolve_location", traced_node("resolve_location", resolve_location))
+    workflow.add_node("ask_for_location", traced_node("ask_for_location", ask_for_location))
+    workflow.add_node("in_destination", traced_node("in_destination", in_destination))
 
     # Final response
-    workflow.add_node("responder", responder)
+    workflow.add_node("responder", traced_node("responder", responder))
 
     # ── Entry point ─────────────────────────────────────────────────────────────
     workflow.add_edge(START, "detect_intent")
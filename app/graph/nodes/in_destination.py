@@ -2,27 +2,24 @@
 nodes/in_destination.py — Phase 3: In-Destination
 Detects query type (food/events/sights), LLM generates 4 Maps queries,
 fires all 4 in parallel, builds mappings with score gap handling, ranks.
-Persists new scores in background via asyncio.create_task.
+Persists new scores in background via the job scheduler.
 """
 import asyncio
-import json
-import os
 from typing import List, Dict, Any
 
-import aiohttp
 
 from app.graph.state import GraphState
 from app.models import Place, PlaceAreaMapping, TravelIntent
-from app.services.ranker import Ranker
+from app.services.ranker import RANKED_PLACES_SHOWN, Ranker
+from app.services.redis_pool import get_redis
 from app.services.scoring_engine import ScoringEngine
+from app.services.job_scheduler import schedule
+from app.services.llm_gateway import complete_json
 from app.utils.logger import get_logger
 from app.utils.message_utils import last_user_content
 
 logger = get_logger(__name__)
 
-GROQ_API_KEY = os.getenv("GROQ_API", "")
-GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
-
 _ranker = Ranker()
 _scoring_engine = ScoringEngine()
 
@@ -47,21 +44,13 @@ async def _build_query_set(destination: str, query_type: str, intent: TravelInte
         f"Destination: {destination}\nQuery type: {query_type}\nUser vibe: {vibe}\nInterests: {interests}\n"
         "Generate 4 diverse, specific Maps search queries to find the best local options."
     )
-    headers = {"Authorization": f"Bearer {GROQ_API_KEY}", "Content-Type": "application/json"}
-    body = {
-        "model": "meta-llama/llama-4-scout-17b-16e-instruct",
-        "messages": [{"role": "system", "content": system}, {"role": "user", "content": prompt}],
-        "max_tokens": 200, "temperature": 0.3,
-    }
+    messages = [{"role": "system", "content": system}, {"role": "user", "content": prompt}]
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(GROQ_URL, headers=headers, json=body) as r:
-                result = await r.json()
-                content = result["choices"][0]["message"]["content"]
-                import re
-                match = re.search(r"\[.*?\]", content, re.DOTALL)
-                if match:
-                    return json.loads(match.group())
+        queries = await complete_json(
+            messages, expect=list, max_tokens=200, temperature=0.3, call_site="query_set",
+        )
+        if queries:
+            return [str(q) for q in queries]
     except Exception as e:
         logger.error(f"Query generation failed: {e}")
 
@@ -139,12 +128,12 @@ def _build_mappings(places: List[Dict], pre_scored: Dict[str, float]) -> List[Pl
 async def _persist_scores_bg(place_ids: List[str], scores: List[float]):
     """Background task to persist scores to Redis."""
     try:
-        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-        import redis.asyncio as aioredis
-        r = await aioredis.from_url(redis_url, decode_responses=True)
-        async with r.pipeline() as pipe:
+        r = await get_redis()
+        if not r:
+            return
+        async with r.pipeline(transaction=False) as pipe:
             for pid, score in zip(place_ids, scores):
-                await pipe.setex(f"place_score:{pid}", 86400, str(score))
+                pipe.setex(f"place_score:{pid}", 86400, str(score))
             await pipe.execute()
         logger.debug(f"Persisted {len(place_ids)} place scores")
     except Exception as e:
@@ -182,7 +171,12 @@ async def in_destination(state: GraphState) -> GraphState:
         return state
 
     # Override with generic weights if "surprise me"
-    ranked = _ranker.rank_places(mappings, intent if not state.get("is_generic_request") else TravelIntent(), area_scores)
+    ranked = _ranker.rank_places(
+        mappings,
+        intent if not state.get("is_generic_request") else TravelIntent(),
+        area_scores,
+        top_k=RANKED_PLACES_SHOWN,
+    )
 
     ranked_dicts = [
         {
@@ -202,10 +196,14 @@ async def in_destination(state: GraphState) -> GraphState:
     state["ranked_places"] = ranked_dicts
 
     # Background persist
-    asyncio.create_task(_persist_scores_bg(
-        [rp.place.place_id for rp in ranked],
-        [rp.rank_score for rp in ranked],
-    ))
+    place_ids = [rp.place.place_id for rp in ranked]
+    scores = [rp.rank_score for rp in ranked]
+    # Keyed per destination + query type: a repeat of the same search while the
+    # first write is still queued is the same ranked set, so it is deduped
+    schedule(
+        f"place_scores:{dest.lower()}:{query_type}",
+        lambda: _persist_scores_bg(place_ids, scores),
+    )
 
     logger.info(f"in_destination: {len(ranked_dicts)} places ranked")
     return state
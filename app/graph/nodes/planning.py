@@ -6,17 +6,15 @@ Caches scored results in Redis at scores:{dest}:{vibe_key} TTL 12hr.
 """
 import asyncio
 import json
-import os
 from typing import Optional
 
-import redis.asyncio as aioredis
-
 from app.graph.state import GraphState
 from app.models import Place, PlaceAreaMapping, TravelIntent
 from app.services.reddit_signals import get_reddit_place_signals
 from app.services.blog_signals import get_blog_signals
 from app.services.scoring_engine import ScoringEngine
-from app.services.ranker import Ranker
+from app.services.ranker import RANKED_PLACES_SHOWN, Ranker
+from app.services.redis_pool import get_redis
 from app.tools.fetchers.places import search_places
 from app.tools.fetchers.hotels_flights import search_hotels
 from app.utils.logger import get_logger
@@ -25,19 +23,11 @@ logger = get_logger(__name__)
 
 _scoring_engine = ScoringEngine()
 _ranker = Ranker()
-REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
-
-
-async def _get_redis():
-    try:
-        return await aioredis.from_url(REDIS_URL, decode_responses=True)
-    except Exception:
-        return None
 
 
 async def _get_or_fetch(cache_key: str, fetch_coro, ttl: int = 43200):
     """Return cached value or call fetch_coro and cache the result."""
-    r = await _get_redis()
+    r = await get_redis()
     if r:
         try:
             cached = await r.get(cache_key)
@@ -102,7 +92,7 @@ def _rank_places(raw_places: list, intent: TravelIntent, reddit_signals: dict, a
     if not mappings:
         return []
 
-    ranked = _ranker.rank_places(mappings, intent, area_scores)
+    ranked = _ranker.rank_places(mappings, intent, area_scores, top_k=RANKED_PLACES_SHOWN)
     return [
         {
             "name": rp.place.name,
@@ -7,12 +7,12 @@ import asyncio
 import os
 from typing import Literal
 
-import aiohttp
 
 from app.graph.state import GraphState
 from app.services.reddit_signals import get_reddit_place_signals, build_reddit_queries
 from app.services.scoring_engine import ScoringEngine
 from app.models import TravelIntent
+from app.services.http_client import http_session
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -29,7 +29,7 @@ async def _geocode_from_intent(intent: TravelIntent) -> dict:
         return {}
     url = "https://maps.googleapis.com/maps/api/geocode/json"
     try:
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.get(url, params={"address": dest, "key": GOOGLE_MAPS_KEY}) as r:
                 data = await r.json()
                 if data.get("results"):
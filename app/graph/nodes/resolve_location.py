@@ -10,17 +10,17 @@ import re
 import asyncio
 from typing import Optional, Literal
 
-import aiohttp
 import os
 
 from app.graph.state import GraphState
+from app.services.http_client import http_session
+from app.services.llm_gateway import complete
 from app.utils.logger import get_logger
 from app.utils.message_utils import last_user_content
 
 logger = get_logger(__name__)
 
 GROQ_API_KEY = os.getenv("GROQ_API", "")
-GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
 GOOGLE_MAPS_KEY = os.getenv("GOOGLE_MAPS_KEY", "")
 
 
@@ -31,7 +31,7 @@ async def _geocode(place: str) -> Optional[dict]:
     url = "https://maps.googleapis.com/maps/api/geocode/json"
     params = {"address": place, "key": GOOGLE_MAPS_KEY}
     try:
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.get(url, params=params) as r:
                 data = await r.json()
                 if data.get("results"):
@@ -46,22 +46,15 @@ async def _llm_extract_location(message: str) -> Optional[str]:
     """Use Groq to extract a location phrase from the message."""
     if not GROQ_API_KEY:
         return None
-    headers = {"Authorization": f"Bearer {GROQ_API_KEY}", "Content-Type": "application/json"}
-    body = {
-        "model": "meta-llama/llama-4-scout-17b-16e-instruct",
-        "messages": [
-            {"role": "system", "content": "Extract the specific location phrase from this message. Return ONLY the location name, nothing else. If no location is mentioned, return 'NONE'."},
-            {"role": "user", "content": message},
-        ],
-        "max_tokens": 50,
-        "temperature": 0,
-    }
+    messages = [
+        {"role": "system", "content": "Extract the specific location phrase from this message. Return ONLY the location name, nothing else. If no location is mentioned, return 'NONE'."},
+        {"role": "user", "content": message},
+    ]
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(GROQ_URL, headers=headers, json=body) as r:
-                result = await r.json()
-                phrase = result["choices"][0]["message"]["content"].strip()
-                return None if phrase == "NONE" else phrase
+        phrase = (await complete(
+            messages, max_tokens=50, temperature=0, call_site="resolve_location",
+        )).strip()
+        return None if phrase == "NONE" else phrase
     except Exception as e:
         logger.error(f"LLM location extract failed: {e}")
     return None
@@ -6,19 +6,17 @@ Never exposes raw scores to the LLM.
 """
 import asyncio
 import json
-import os
 from typing import List, Dict, Any
 
-import aiohttp
 
 from app.graph.state import GraphState, Phase
 from app.services.stage_machine import resolve_stage, determine_action as _stage_determine_action
+from app.services.llm_gateway import LLMError, complete, stream
+from app.services.stream_events import emit, is_streaming
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-GROQ_API_KEY = os.getenv("GROQ_API", "")
-GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
 MODEL = "meta-llama/llama-4-scout-17b-16e-instruct"
 
 # Human-readable translations for RankExplanation.top_factor
@@ -264,6 +262,56 @@ def _build_system_prompt(state: GraphState) -> str:
     return system
 
 
+async def _stream_response(llm_messages: list[dict]) -> str:
+    """
+    Streaming mode (/chat/stream): forward each Groq delta as a `token` event
+    and return the assembled text for `response` and the checkpointed messages.
+    A failure after the first chunk keeps the partial text rather than
+    replacing words the user has already seen.
+    """
+    parts: list[str] = []
+    try:
+        async for chunk in stream(
+            llm_messages, max_tokens=1000, temperature=0.7, call_site="responder", model=MODEL,
+        ):
+            parts.append(chunk)
+            emit("token", {"text": chunk})
+    except LLMError as e:
+        if not parts:
+            raise
+        logger.warning(f"[Groq/responder] stream cut off after {len(parts)} chunks: {e}")
+    return "".join(parts)
+
+
+async def _generate_text(state: GraphState, llm_messages: list[dict]) -> str:
+    """Responder text — streamed on /chat/stream, one request otherwise. Never raises."""
+    try:
+        if is_streaming():
+            response_text = await _stream_response(llm_messages)
+        else:
+            response_text = await complete(
+                llm_messages, max_tokens=1000, temperature=0.7, call_site="responder", model=MODEL,
+            )
+        logger.info(f"[Groq/responder] ✓ {len(response_text)} chars generated")
+        return response_text
+    except Exception as e:
+        logger.error(f"[Groq/responder] ✗ {e}")
+        dest = state.get("destination", "your destination")
+        return f"I found some great options in {dest}! Let me know if you'd like more specific recommendations."
+
+
+async def _resolve_action(stage: str, state: GraphState) -> tuple[str | None, dict | None]:
+    """Card pipeline for this turn. A failure drops the card, never the text reply."""
+    try:
+        action, payload = await _stage_determine_action(stage, state)
+    except Exception as e:
+        logger.error(f"[action] determine_action failed at stage={stage}: {e}")
+        action, payload = None, None
+    # /chat/stream: cards can render before the node (and the turn) completes
+    emit("action", {"action": action, "payload": payload, "stage": stage})
+    return action, payload
+
+
 async def responder(state: GraphState) -> GraphState:
     """Generate the final response using Groq Llama 4 Scout."""
     system = _build_system_prompt(state)
@@ -291,31 +339,20 @@ async def responder(state: GraphState) -> GraphState:
     phase = state.get("phase", "unknown")
     logger.info(f"[Groq/responder] → phase={phase} dest={dest} history={len(history)} msgs")
 
-    headers = {"Authorization": f"Bearer {GROQ_API_KEY}", "Content-Type": "application/json"}
-    body = {
-        "model": MODEL,
-        "messages": [{"role": "system", "content": system}] + history,
-        "max_tokens": 1000,
-        "temperature": 0.7,
-    }
+    llm_messages = [{"role": "system", "content": system}] + history
 
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(GROQ_URL, headers=headers, json=body) as r:
-                result = await r.json()
-                response_text = result["choices"][0]["message"]["content"]
-                logger.info(f"[Groq/responder] ✓ {len(response_text)} chars generated")
-    except Exception as e:
-        logger.error(f"[Groq/responder] ✗ {e}")
-        dest = state.get("destination", "your destination")
-        response_text = f"I found some great options in {dest}! Let me know if you'd like more specific recommendations."
+    # Text and cards are independent: the prompt is already built, and the card
+    # pipeline only reads state. Run both at once so the turn costs max(a, b).
+    # Each side handles its own errors; cancelling the node cancels both.
+    stage = resolve_stage(state)
+    response_text, (action, payload) = await asyncio.gather(
+        _generate_text(state, llm_messages),
+        _resolve_action(stage, state),
+    )
 
     logger.info("responder: response generated")
     events: list = state.get("tool_events") or []
     events.append(f"[Groq/responder] {len(response_text)} chars generated (phase={state.get('phase', 'unknown')})")
-
-    stage = resolve_stage(state)
-    action, payload = await _stage_determine_action(stage, state)
     events.append(f"[action] {action or 'none'} stage={stage}")
 
     # Update one-time flags when their card is sent — prevents re-sending same card next turn
@@ -4,19 +4,16 @@ app/services/activity_options.py — Build activity mini-cards for a selected pl
 Reads cached area Reddit signals (Sprint 4 prefetch), calls Groq to generate
 4–6 place-specific activities, caches result for 6 hours.
 """
-import json
-import os
 from typing import Any
 
-import aiohttp
 
 from app.services.area_cache import get_cached, set_cached
+from app.services.llm_gateway import complete_json
+from app.services.single_flight import coalesce
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-GROQ_API_KEY = os.getenv("GROQ_API", "")
-GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
 _MODEL = "meta-llama/llama-4-scout-17b-16e-instruct"
 
 DEFAULT_ACTIVITIES: list[dict] = [
@@ -26,6 +23,10 @@ DEFAULT_ACTIVITIES: list[dict] = [
 ]
 
 
+def activity_options_key(destination: str, place_id: str) -> str:
+    return f"activity_options:{destination.lower()}:{place_id.lower()}"
+
+
 async def build_activity_options(
     place_id: str,
     place_name: str,
@@ -37,15 +38,32 @@ async def build_activity_options(
     """
     Return 4–6 activity mini-cards for place_id.
     Reads area Reddit cache → calls Groq → caches result for 6h.
+    Concurrent misses for the same place are coalesced into one Groq call.
     Returns DEFAULT_ACTIVITIES on any failure.
     """
-    cache_key = f"activity_options:{destination.lower()}:{place_id.lower()}"
+    cache_key = activity_options_key(destination, place_id)
 
     cached = await get_cached(cache_key)
     if cached:
         logger.info(f"[activity_options] cache hit: {cache_key}")
         return cached
 
+    return await coalesce(
+        cache_key,
+        lambda: _compute_activity_options(place_name, destination, area_id, intent, trip_who, cache_key),
+        reread=lambda: get_cached(cache_key),
+    )
+
+
+async def _compute_activity_options(
+    place_name: str,
+    destination: str,
+    area_id: str,
+    intent: Any,
+    trip_who: str | None,
+    cache_key: str,
+) -> list[dict]:
+    """Cache-miss path of build_activity_options: Reddit cache → Groq → cache write."""
     # Step 1 — Read area Reddit signals (best-effort)
     reddit_context = ""
     try:
@@ -87,27 +105,17 @@ async def build_activity_options(
 
     activities = DEFAULT_ACTIVITIES
     try:
-        headers = {"Authorization": f"Bearer {GROQ_API_KEY}", "Content-Type": "application/json"}
-        body = {
-            "model": _MODEL,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": 500,
-            "temperature": 0.3,
-        }
-        async with aiohttp.ClientSession() as session:
-            async with session.post(GROQ_URL, headers=headers, json=body) as r:
-                result = await r.json()
-                text = result["choices"][0]["message"]["content"].strip()
-                if text.startswith("```"):
-                    parts = text.split("```")
-                    text = parts[1] if len(parts) > 1 else text
-                    if text.startswith("json"):
-                        text = text[4:]
-                    text = text.split("```")[0]
-                parsed = json.loads(text)
-                if isinstance(parsed, list) and parsed:
-                    activities = parsed
-                    logger.info(f"[activity_options] Groq ✓ {len(activities)} activities for {place_name}")
+        parsed = await complete_json(
+            [{"role": "user", "content": prompt}],
+            expect=list,
+            max_tokens=500,
+            temperature=0.3,
+            call_site="activity_options",
+            model=_MODEL,
+        )
+        if parsed:
+            activities = parsed
+            logger.info(f"[activity_options] Groq ✓ {len(activities)} activities for {place_name}")
     except Exception as e:
         logger.error(f"[activity_options] Groq failed for {place_name}: {e} — using defaults")
 
@@ -0,0 +1,278 @@
+"""
+app/services/airport_mapper.py — Nearest-airport lookup over world-airports.csv.
+
+AirportMapper.find_nearest: airports of the given types within their type radius
+AirportMapper.find_for_destination: large → medium → small → 300 km fallback
+AirportMapper.get_for_city: airports serving a municipality
+
+Airports are held as NumPy column arrays, bucketed into a 1° lat/lon grid
+(rows sorted by cell id, so every latitude row of cells is one contiguous
+slice). A query only computes haversine distances — vectorised — for the
+airports in the cells its radius touches, instead of scanning every row.
+
+The parsed arrays are written to a binary .npz snapshot next to the CSV
+(or AIRPORT_SNAPSHOT_PATH) and reused while it is newer than the CSV.
+"""
+import csv
+import math
+import os
+from typing import Optional
+
+import numpy as np
+
+from app.models import Airport, AirportResult, AirportType
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Default distance thresholds (km)
+LARGE_AIRPORT_MAX_DISTANCE = 150
+MEDIUM_AIRPORT_MAX_DISTANCE = 100
+SMALL_AIRPORT_MAX_DISTANCE = 50
+EXPANDED_SEARCH_DISTANCE = 300
+
+EARTH_RADIUS_KM = 6371
+_KM_PER_DEG_LAT = 111.0
+_CELL_DEG = 1
+_LAT_CELLS, _LON_CELLS = 180 // _CELL_DEG, 360 // _CELL_DEG
+
+_SNAPSHOT_VERSION = 1
+
+# Type code ↔ CSV type; the code doubles as the large → medium → small priority
+_TYPES = ("large_airport", "medium_airport", "small_airport")
+_TYPE_CODE = {t: i for i, t in enumerate(_TYPES)}
+_MAX_DISTANCE = np.array(
+    [LARGE_AIRPORT_MAX_DISTANCE, MEDIUM_AIRPORT_MAX_DISTANCE, SMALL_AIRPORT_MAX_DISTANCE], dtype=float
+)
+
+_STR_COLUMNS = ("iata_code", "name", "municipality", "country", "country_code")
+
+
+def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate distance between two coordinates in kilometers."""
+    return float(_haversine(lat1, lon1, np.array([lat2]), np.array([lon2]))[0])
+
+
+def _haversine(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    lat1 = math.radians(lat)
+    lat2 = np.radians(lats)
+    dlat = lat2 - lat1
+    dlon = np.radians(lons - lon)
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def _cell_ids(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    rows = np.clip(np.floor((lats + 90) / _CELL_DEG), 0, _LAT_CELLS - 1).astype(np.int64)
+    cols = np.floor((lons + 180) / _CELL_DEG).astype(np.int64) % _LON_CELLS
+    return rows * _LON_CELLS + cols
+
+
+class AirportMapper:
+    """Maps destinations to nearest airports using CSV data."""
+
+    def __init__(self, csv_path: str, snapshot_path: str | None = None):
+        """Load world-airports.csv (or its snapshot) and build the grid index."""
+        self._snapshot_path = snapshot_path or os.getenv("AIRPORT_SNAPSHOT_PATH") or f"{csv_path}.npz"
+        columns = self._load_snapshot(csv_path) or self._load_csv(csv_path)
+        self._build_index(columns)
+        self._by_city: dict[tuple[str, str], list[int]] | None = None
+        logger.info(f"Loaded {len(self)} airports")
+
+    def __len__(self) -> int:
+        return len(self._lat)
+
+    # ── Loading ──────────────────────────────────────────────────────────────
+
+    def _load_csv(self, csv_path: str) -> dict[str, np.ndarray]:
+        """Parse airports with coordinates and a recognised type; write the snapshot."""
+        rows: dict[str, list] = {k: [] for k in ("lat", "lon", "type", *_STR_COLUMNS)}
+        try:
+            with open(csv_path, 'r', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    try:
+                        lat = float(row.get('latitude_deg', 0))
+                        lon = float(row.get('longitude_deg', 0))
+                    except (ValueError, TypeError):
+                        continue
+                    airport_type = row.get('type', '')
+                    if not lat or not lon or airport_type not in _TYPE_CODE:
+                        continue
+                    rows["lat"].append(lat)
+                    rows["lon"].append(lon)
+                    rows["type"].append(_TYPE_CODE[airport_type])
+                    rows["iata_code"].append(row.get('iata_code', '').strip() or row.get('ident', ''))
+                    rows["name"].append(row.get('name', 'Unknown'))
+                    rows["municipality"].append(row.get('municipality', ''))
+                    rows["country"].append(row.get('country_name', ''))
+                    rows["country_code"].append(row.get('iso_country', ''))
+        except FileNotFoundError:
+            logger.error(f"Airport CSV not found: {csv_path}")
+        except Exception as e:
+            logger.error(f"Error loading airport CSV: {e}")
+
+        columns = {
+            "lat": np.array(rows["lat"], dtype=np.float64),
+            "lon": np.array(rows["lon"], dtype=np.float64),
+            "type": np.array(rows["type"], dtype=np.int8),
+            **{k: np.array(rows[k], dtype=str) for k in _STR_COLUMNS},
+        }
+        if len(columns["lat"]):
+            self._write_snapshot(columns)
+        return columns
+
+    def _load_snapshot(self, csv_path: str) -> dict[str, np.ndarray] | None:
+        """Snapshot columns when it exists, matches this version and is newer than the CSV."""
+        try:
+            if os.path.getmtime(self._snapshot_path) < os.path.getmtime(csv_path):
+                return None
+            with np.load(self._snapshot_path, allow_pickle=False) as data:
+                if int(data["version"]) != _SNAPSHOT_VERSION:
+                    return None
+                return {k: data[k] for k in ("lat", "lon", "type", *_STR_COLUMNS)}
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def _write_snapshot(self, columns: dict[str, np.ndarray]) -> None:
+        try:
+            tmp = f"{self._snapshot_path}.tmp.npz"
+            np.savez(tmp, version=np.array(_SNAPSHOT_VERSION), **columns)
+            os.replace(tmp, self._snapshot_path)
+        except Exception as e:
+            logger.warning(f"Could not write airport snapshot {self._snapshot_path}: {e}")
+
+    def _build_index(self, columns: dict[str, np.ndarray]) -> None:
+        """Sort every column by grid cell; _cell_start[c]:_cell_start[c + 1] is cell c."""
+        cells = _cell_ids(columns["lat"], columns["lon"])
+        order = np.argsort(cells, kind="stable")
+        self._row = order  # original CSV position — tie-breaker matching the old scan order
+        self._lat = columns["lat"][order]
+        self._lon = columns["lon"][order]
+        self._type = columns["type"][order]
+        self._str = {k: columns[k][order] for k in _STR_COLUMNS}
+        self._cell_start = np.searchsorted(cells[order], np.arange(_LAT_CELLS * _LON_CELLS + 1))
+
+    # ── Spatial queries ──────────────────────────────────────────────────────
+
+    def _candidates(self, lat: float, lon: float, radius_km: float) -> np.ndarray:
+        """Indices of airports in every grid cell within radius_km of (lat, lon)."""
+        if not len(self):
+            return np.empty(0, dtype=np.int64)
+        dlat = radius_km / _KM_PER_DEG_LAT
+        row_lo = max(int((lat - dlat + 90) // _CELL_DEG), 0)
+        row_hi = min(int((lat + dlat + 90) // _CELL_DEG), _LAT_CELLS - 1)
+        # Widest longitude span is at the band edge nearest a pole
+        max_abs_lat = min(max(abs(lat - dlat), abs(lat + dlat)), 89.9)
+        dlon = radius_km / (_KM_PER_DEG_LAT * math.cos(math.radians(max_abs_lat)))
+        if dlon >= 180:
+            col_ranges = [(0, _LON_CELLS - 1)]
+        else:
+            col_lo = int((lon - dlon + 180) // _CELL_DEG)
+            col_hi = int((lon + dlon + 180) // _CELL_DEG)
+            if col_lo < 0:
+                col_ranges = [(col_lo % _LON_CELLS, _LON_CELLS - 1), (0, col_hi)]
+            elif col_hi >= _LON_CELLS:
+                col_ranges = [(col_lo, _LON_CELLS - 1), (0, col_hi % _LON_CELLS)]
+            else:
+                col_ranges = [(col_lo, col_hi)]
+        slices = [
+            np.arange(self._cell_start[row * _LON_CELLS + lo], self._cell_start[row * _LON_CELLS + hi + 1])
+            for row in range(row_lo, row_hi + 1)
+            for lo, hi in col_ranges
+        ]
+        return np.concatenate(slices) if slices else np.empty(0, dtype=np.int64)
+
+    def _within(self, lat: float, lon: float, radius_km: float) -> tuple[np.ndarray, np.ndarray]:
+        """(indices, distances) of airports within radius_km."""
+        idx = self._candidates(lat, lon, radius_km)
+        dist = _haversine(lat, lon, self._lat[idx], self._lon[idx])
+        keep = dist <= radius_km
+        return idx[keep], dist[keep]
+
+    def _airport(self, i: int, distance_km: float) -> Airport:
+        return Airport(
+            iata_code=str(self._str["iata_code"][i]),
+            name=str(self._str["name"][i]),
+            airport_type=AirportType(_TYPES[self._type[i]]),
+            lat=float(self._lat[i]),
+            lon=float(self._lon[i]),
+            municipality=str(self._str["municipality"][i]),
+            country=str(self._str["country"][i]),
+            distance_km=distance_km,
+        )
+
+    def find_nearest(
+        self,
+        lat: float,
+        lon: float,
+        max_results: int = 3,
+        airport_types: Optional[list[str]] = None
+    ) -> list[Airport]:
+        """Find nearest airports to coordinates."""
+        if airport_types is None:
+            airport_types = ['large_airport', 'medium_airport']
+        codes = [_TYPE_CODE[t] for t in airport_types if t in _TYPE_CODE]
+        if not codes:
+            return []
+
+        idx, dist = self._within(lat, lon, float(_MAX_DISTANCE[codes].max()))
+        types = self._type[idx]
+        keep = np.isin(types, codes) & (dist <= _MAX_DISTANCE[types])
+        idx, rounded = idx[keep], np.round(dist[keep], 1)
+
+        order = np.lexsort((self._row[idx], rounded))[:max_results]
+        return [self._airport(idx[j], float(rounded[j])) for j in order]
+
+    def _get_max_distance(self, airport_type: str) -> float:
+        """Get maximum search distance for airport type."""
+        return float(_MAX_DISTANCE[_TYPE_CODE.get(airport_type, 2)])
+
+    def find_for_destination(
+        self,
+        lat: float,
+        lon: float,
+        max_results: int = 3
+    ) -> AirportResult:
+        """Find airports for a destination with fallback logic."""
+        # Try large airports first
+        airports = self.find_nearest(lat, lon, max_results, ['large_airport'])
+
+        # If no large airports, try medium
+        if not airports:
+            airports = self.find_nearest(lat, lon, max_results, ['medium_airport'])
+
+        # If still none, try small with expanded radius
+        if not airports:
+            airports = self.find_nearest(lat, lon, max_results, ['small_airport'])
+
+        # If still none, expand search radius
+        if not airports:
+            airports = self._expanded_search(lat, lon, max_results)
+
+        primary = airports[0].iata_code if airports else None
+
+        return AirportResult(
+            destination_lat=lat,
+            destination_lon=lon,
+            nearest_airports=airports,
+            primary_airport=primary
+        )
+
+    def _expanded_search(self, lat: float, lon: float, max_results: int) -> list[Airport]:
+        """Search with expanded radius (300km) for remote destinations."""
+        idx, dist = self._within(lat, lon, EXPANDED_SEARCH_DISTANCE)
+        rounded = np.round(dist, 1)
+        order = np.lexsort((self._row[idx], rounded, self._type[idx]))[:max_results]
+        return [self._airport(idx[j], float(rounded[j])) for j in order]
+
+    def get_for_city(self, city: str, country: str) -> list[Airport]:
+        """Get airports by city name (for cached lookups)."""
+        if self._by_city is None:
+            self._by_city = {}
+            for i in np.argsort(self._row, kind="stable"):
+                key = (str(self._str["municipality"][i]).lower(), str(self._str["country"][i]).lower())
+                self._by_city.setdefault(key, []).append(int(i))
+        matches = self._by_city.get((city.lower(), country.lower()), [])
+        # Sort by airport type priority
+        matches = sorted(matches, key=lambda i: self._type[i])
+        return [self._airport(i, 0.0) for i in matches[:3]]
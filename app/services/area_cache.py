@@ -4,52 +4,183 @@ app/services/area_cache.py — Redis cache for area cards and vibe cards.
 Key format:
   vibe_cards:{destination}          TTL 24h
   area_cards:{destination}:{exp_key}  TTL 24h
+
+All calls share the process-wide pool from redis_pool — no per-lookup connect.
+get_many_cached / set_many_cached batch several keys into one round trip.
+
+Stale-while-revalidate:
+  set_cached(key, data, ttl=soft, hard_ttl=hard) keeps the value for `hard`
+  seconds and writes a `{key}:fresh` marker that expires after `soft`.
+  get_cached(key, revalidate=builder) returns a value whose marker has
+  expired immediately and runs builder() in the background to rewrite it.
+  A failed refresh leaves the stale value in place until the hard TTL.
+  Refreshes run on the job scheduler, one per key at a time.
 """
 import json
-import os
-
-import redis.asyncio as aioredis
+from typing import Awaitable, Callable
 
+from app.services.job_scheduler import schedule
+from app.services.redis_pool import get_redis
+from app.services.single_flight import coalesce
+from app.services.tracing import record_cache
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
-REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+
+_stats = {"hits": 0, "misses": 0, "stale_hits": 0, "refreshes": 0, "refresh_failures": 0}
+
+
+def area_cache_stats() -> dict[str, int]:
+    """Counters for hits, misses, stale serves and background refresh outcomes."""
+    return dict(_stats)
 
 
 async def _get_redis():
+    return await get_redis()
+
+
+def _fresh_key(key: str) -> str:
+    return f"{key}:fresh"
+
+
+def _family(key: str) -> str:
+    """Metric label for a key: area_cards:goa:adv → area_cards."""
+    return key.split(":", 1)[0]
+
+
+async def _refresh(key: str, revalidate: Callable[[], Awaitable[list[dict] | None]]) -> None:
+    """Run the builder for a stale key. The builder writes the cache itself on success."""
+    _stats["refreshes"] += 1
     try:
-        return await aioredis.from_url(REDIS_URL, decode_responses=True)
-    except Exception:
-        return None
+        result = await coalesce(key, revalidate)
+        if result:
+            logger.info(f"[area_cache] refreshed: {key}")
+        else:
+            _stats["refresh_failures"] += 1
+            logger.warning(f"[area_cache] refresh empty, serving stale: {key}")
+    except Exception as e:
+        _stats["refresh_failures"] += 1
+        logger.warning(f"[area_cache] refresh failed, serving stale: {key}: {e}")
+
 
+def _schedule_refresh(key: str, revalidate: Callable[[], Awaitable[list[dict] | None]]) -> None:
+    schedule(f"refresh:{key}", lambda: _refresh(key, revalidate))
 
-async def get_cached(key: str) -> list[dict] | None:
-    """Return parsed list from Redis, or None on miss/error."""
+
+async def get_cached(
+    key: str,
+    revalidate: Callable[[], Awaitable[list[dict] | None]] | None = None,
+) -> list[dict] | None:
+    """Return parsed list from Redis, or None on miss/error.
+
+    With revalidate, a value past its soft TTL is still returned and
+    revalidate() is scheduled in the background to rebuild it.
+    """
     r = await _get_redis()
     if not r:
         return None
     try:
-        raw = await r.get(key)
+        if revalidate is None:
+            raw, fresh = await r.get(key), True
+        else:
+            raw, fresh = await r.mget([key, _fresh_key(key)])
         if raw:
-            logger.info(f"[area_cache] hit: {key}")
+            if fresh:
+                _stats["hits"] += 1
+                record_cache(_family(key), "hit")
+                logger.info(f"[area_cache] hit: {key}")
+            else:
+                _stats["stale_hits"] += 1
+                record_cache(_family(key), "stale")
+                logger.info(f"[area_cache] stale hit: {key} — refreshing in background")
+                _schedule_refresh(key, revalidate)
             return json.loads(raw)
+        _stats["misses"] += 1
+        record_cache(_family(key), "miss")
         return None
     except Exception as e:
         logger.warning(f"[area_cache] get error for {key}: {e}")
         return None
-    finally:
-        await r.aclose()
 
 
-async def set_cached(key: str, data: list[dict], ttl: int = 86400) -> None:
-    """Write JSON-serialised data to Redis with TTL. Silent on error."""
+async def is_cached(key: str) -> bool:
+    """True when key holds a value, fresh or stale. No hit/miss accounting."""
+    r = await _get_redis()
+    if not r:
+        return False
+    try:
+        return bool(await r.exists(key))
+    except Exception as e:
+        logger.warning(f"[area_cache] exists error for {key}: {e}")
+        return False
+
+
+async def set_cached(
+    key: str,
+    data: list[dict],
+    ttl: int = 86400,
+    hard_ttl: int | None = None,
+) -> None:
+    """Write JSON-serialised data to Redis with TTL. Silent on error.
+
+    With hard_ttl > ttl, ttl becomes the soft TTL: the value survives for
+    hard_ttl and get_cached(..., revalidate=...) treats it as stale after ttl.
+    """
     r = await _get_redis()
     if not r:
         return
     try:
-        await r.setex(key, ttl, json.dumps(data, default=str))
-        logger.info(f"[area_cache] set: {key} ttl={ttl}s")
+        payload = json.dumps(data, default=str)
+        if hard_ttl and hard_ttl > ttl:
+            async with r.pipeline(transaction=False) as pipe:
+                pipe.setex(key, hard_ttl, payload)
+                pipe.setex(_fresh_key(key), ttl, "1")
+                await pipe.execute()
+            logger.info(f"[area_cache] set: {key} soft={ttl}s hard={hard_ttl}s")
+        else:
+            await r.setex(key, ttl, payload)
+            logger.info(f"[area_cache] set: {key} ttl={ttl}s")
     except Exception as e:
         logger.warning(f"[area_cache] set error for {key}: {e}")
-    finally:
-        await r.aclose()
+
+
+async def get_many_cached(keys: list[str]) -> list[list[dict] | None]:
+    """MGET several keys in one round trip. Returns values in key order, None per miss."""
+    if not keys:
+        return []
+    r = await _get_redis()
+    if not r:
+        return [None] * len(keys)
+    try:
+        raws = await r.mget(keys)
+    except Exception as e:
+        logger.warning(f"[area_cache] mget error for {len(keys)} keys: {e}")
+        return [None] * len(keys)
+    results: list[list[dict] | None] = []
+    for key, raw in zip(keys, raws):
+        try:
+            results.append(json.loads(raw) if raw else None)
+        except Exception as e:
+            logger.warning(f"[area_cache] bad JSON for {key}: {e}")
+            results.append(None)
+        record_cache(_family(key), "miss" if results[-1] is None else "hit")
+    hits = sum(1 for v in results if v is not None)
+    logger.info(f"[area_cache] mget: {hits}/{len(keys)} hits")
+    return results
+
+
+async def set_many_cached(items: dict[str, list[dict]], ttl: int = 86400) -> None:
+    """Pipeline SETEX for several keys with a shared TTL. Silent on error."""
+    if not items:
+        return
+    r = await _get_redis()
+    if not r:
+        return
+    try:
+        async with r.pipeline(transaction=False) as pipe:
+            for key, data in items.items():
+                pipe.setex(key, ttl, json.dumps(data, default=str))
+            await pipe.execute()
+        logger.info(f"[area_cache] mset: {len(items)} keys ttl={ttl}s")
+    except Exception as e:
+        logger.warning(f"[area_cache] mset error for {len(items)} keys: {e}")
@@ -0,0 +1,335 @@
+"""
+app/services/cache_warmer.py — Offline cache warmer for popular destinations.
+
+Usage:
+  python -m app.services.cache_warmer --destinations Goa Gokarna Coorg \\
+      --experience-types beach_coast hills_nature \\
+      [--destinations-file popular.txt] [--areas 3] [--places 4] [--concurrency 2] \\
+      [--max-groq-calls 300] [--checkpoint logs/cache_warmer.json] [--fresh]
+
+warm: warm every destination × experience type, return a report dict
+synthetic_state: the state dict a unit's fetches run against
+main: CLI entry point — opens the shared clients like the server lifespan does
+
+Work is split into units, each checkpointed once it finishes:
+  vibe:{destination}          fetch_vibe_cards
+  {destination}|{experience}  fetch_area_cards → fetch_place_cards for the first
+                              --areas areas → build_activity_options for the
+                              first --places places of each area
+These are the functions /chat runs, so the keys written (vibe_cards:*,
+area_cards:*, place_cards:*, activity_options:*) are the ones real turns read.
+
+Rate limits: --concurrency units run at once. Every Groq call still waits on
+llm_gateway's GROQ_RPM / GROQ_TPM buckets and every Reddit request on
+reddit_slot. The buckets are per process, so a warmer next to a live server
+doubles the load on the shared quota — run it before traffic arrives.
+No new unit starts once --max-groq-calls Groq requests have been made.
+
+Checkpoint: {"units": {unit_id: [cache keys]}} rewritten atomically after each
+unit. A unit counts as done only once its vibe_cards / area_cards key is in
+Redis — the fetches return empty cards on Groq failure instead of raising.
+A rerun skips finished units and retries the rest; --fresh starts over.
+
+Report: units done / failed / skipped, per-family coverage (keys present in
+Redis out of keys targeted), Groq calls and tokens, Reddit requests,
+background jobs, external calls by service and wall time. Groq and Reddit
+counts are process-wide, so they include the reddit_area:* crawls that
+fetch_place_cards queues on the job scheduler. external_calls comes from the
+warmer's own spans and leaves those jobs out: scheduled jobs run in an empty
+context (see job_scheduler).
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter
+
+from dotenv import load_dotenv
+load_dotenv()  # Module-level env constants below are read at import
+
+from app.models import Destination, TravelIntent, Vibe
+from app.services.activity_options import activity_options_key, build_activity_options
+from app.services.area_cache import is_cached
+from app.services.http_client import close_http_session, init_http_session
+from app.services.job_scheduler import drain_scheduler, init_scheduler, job_scheduler_stats, wait_for_jobs
+from app.services.llm_gateway import llm_stats
+from app.services.reddit_client import close_reddit_client, init_reddit_client, reddit_client_stats
+from app.services.redis_pool import close_redis_pool, init_redis_pool
+from app.services.stage_machine import (
+    BASE_CHIPS, area_cards_key, fetch_area_cards, fetch_place_cards, fetch_vibe_cards, place_cards_key,
+    vibe_cards_key,
+)
+from app.services.tracing import end_turn, start_turn
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+WARM_AREAS_PER_DESTINATION = int(os.getenv("WARM_AREAS_PER_DESTINATION", "3"))
+WARM_PLACES_PER_AREA = int(os.getenv("WARM_PLACES_PER_AREA", "4"))
+WARM_CONCURRENCY = int(os.getenv("WARM_CONCURRENCY", "2"))
+WARM_MAX_GROQ_CALLS = int(os.getenv("WARM_MAX_GROQ_CALLS", "300"))
+WARM_CHECKPOINT = os.getenv("WARM_CHECKPOINT", "logs/cache_warmer.json")
+
+EXPERIENCE_TYPES = [c["id"] for c in BASE_CHIPS]
+
+# The ranker needs an intent; experience chips carry no vibe, so pick the closest
+_EXPERIENCE_VIBES = {
+    "beach_coast": Vibe.CHILL, "hills_nature": Vibe.ADVENTURE, "small_town": Vibe.CULTURAL,
+    "festival_events": Vibe.PARTY, "new_city": Vibe.CULTURAL, "retreat_rest": Vibe.CHILL,
+}
+
+_FAMILIES = ("vibe_cards", "area_cards", "place_cards", "activity_options")
+
+
+def synthetic_state(destination: str, experience_type: str | None = None) -> dict:
+    """State as it stands once a plan-mode user has picked an experience chip and a destination."""
+    experience_types = [experience_type] if experience_type else []
+    vibe = _EXPERIENCE_VIBES.get(experience_type or "")
+    return {
+        "trip_mode": "plan",
+        "destination": destination,
+        "experience_types": experience_types,
+        "travel_intent": TravelIntent(
+            destination=Destination(city=destination),
+            vibe=[vibe] if vibe else [],
+            interests=experience_types,
+        ),
+    }
+
+
+# ── Checkpoint ────────────────────────────────────────────────────────────────
+
+def _load_checkpoint(path: str) -> dict:
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        if isinstance(data.get("units"), dict):
+            return data
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"[cache_warmer] unreadable checkpoint {path}, starting over: {e}")
+    return {"units": {}}
+
+
+def _save_checkpoint(path: str, checkpoint: dict) -> None:
+    """Write to a temp file and rename, so an interrupted run never leaves half a checkpoint."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp, path)
+
+
+# ── Units ─────────────────────────────────────────────────────────────────────
+
+async def _warm_vibes(destination: str) -> list[str]:
+    await fetch_vibe_cards({"destination": destination})
+    return [vibe_cards_key(destination)]
+
+
+async def _warm_destination(destination: str, experience_type: str, areas: int, places: int) -> list[str]:
+    """Area cards → place cards → activity options. Returns every key it targeted."""
+    state = synthetic_state(destination, experience_type)
+    keys = [area_cards_key(state)]
+    area_cards = await fetch_area_cards(state)
+
+    area_ids = [a.get("id", "") for a in area_cards[:areas] if a.get("id")]
+    per_area = []
+    for area_id in area_ids:
+        keys.append(place_cards_key(state, area_id))
+        per_area.append((area_id, await fetch_place_cards(dict(state), area_id=area_id) or []))
+
+    # build_activity_options reads the reddit_area:* signals fetch_place_cards queued
+    await wait_for_jobs()
+    intent = state["travel_intent"]
+    for area_id, categories in per_area:
+        shown = [p for cat in categories for p in cat.get("places", []) if p.get("id")][:places]
+        for place in shown:
+            keys.append(activity_options_key(destination, place["id"]))
+            await build_activity_options(
+                place["id"], place.get("name", place["id"]), destination, area_id, intent, None,
+            )
+    return keys
+
+
+def _groq_totals() -> dict[str, int]:
+    totals = Counter()
+    for site in llm_stats().values():
+        for field in ("calls", "errors", "cache_hits", "prompt_tokens", "completion_tokens"):
+            totals[field] += int(site.get(field, 0))
+    return dict(totals)
+
+
+def _jobs_finished() -> int:
+    stats = job_scheduler_stats()
+    return stats["completed"] + stats["failed"]
+
+
+async def _coverage(keys: list[str]) -> dict[str, dict[str, int]]:
+    present = await asyncio.gather(*(is_cached(k) for k in keys))
+    coverage = {family: {"cached": 0, "targeted": 0} for family in _FAMILIES}
+    for key, hit in zip(keys, present):
+        family = coverage.setdefault(key.split(":", 1)[0], {"cached": 0, "targeted": 0})
+        family["targeted"] += 1
+        family["cached"] += int(hit)
+    return coverage
+
+
+async def warm(
+    destinations: list[str],
+    experience_types: list[str],
+    areas: int = WARM_AREAS_PER_DESTINATION,
+    places: int = WARM_PLACES_PER_AREA,
+    concurrency: int = WARM_CONCURRENCY,
+    max_groq_calls: int = WARM_MAX_GROQ_CALLS,
+    checkpoint_path: str = WARM_CHECKPOINT,
+    fresh: bool = False,
+) -> dict:
+    """Warm destinations × experience types. Expects the shared clients to be open (see main)."""
+    checkpoint = {"units": {}} if fresh else _load_checkpoint(checkpoint_path)
+    done: dict[str, list[str]] = checkpoint["units"]
+
+    plan: list[tuple[str, object]] = []
+    for dest in dict.fromkeys(d.strip() for d in destinations if d.strip()):
+        plan.append((f"vibe:{dest.lower()}", lambda d=dest: _warm_vibes(d)))
+        for exp in experience_types:
+            plan.append((
+                f"{dest.lower()}|{exp}",
+                lambda d=dest, e=exp: _warm_destination(d, e, areas, places),
+            ))
+
+    groq_before = _groq_totals()
+    reddit_before = reddit_client_stats()["requests"]
+    jobs_before = _jobs_finished()
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    result = Counter()
+    started = time.perf_counter()
+
+    async def run(unit_id: str, factory) -> None:
+        async with semaphore:
+            if _groq_totals().get("calls", 0) - groq_before.get("calls", 0) >= max_groq_calls:
+                result["skipped_budget"] += 1
+                return
+            try:
+                keys = await factory()
+            except Exception as e:
+                result["failed"] += 1
+                logger.warning(f"[cache_warmer] {unit_id} failed: {e}")
+                return
+            # The fetches swallow Groq / parse failures and return empty cards
+            # without caching them, so check the unit's first key actually landed
+            if not await is_cached(keys[0]):
+                result["failed"] += 1
+                logger.warning(f"[cache_warmer] {unit_id} failed: {keys[0]} not cached")
+                return
+            done[unit_id] = keys
+            _save_checkpoint(checkpoint_path, checkpoint)
+            result["done"] += 1
+            logger.info(f"[cache_warmer] {unit_id}: {len(keys)} key(s)")
+
+    token = start_turn()
+    try:
+        pending = [(unit_id, factory) for unit_id, factory in plan if unit_id not in done]
+        result["resumed"] = len(plan) - len(pending)
+        await asyncio.gather(*(run(unit_id, factory) for unit_id, factory in pending))
+        await wait_for_jobs()
+    finally:
+        spans = end_turn(token)
+
+    groq_after = _groq_totals()
+    planned_ids = {unit_id for unit_id, _ in plan}
+    keys = [k for unit_id, unit_keys in done.items() if unit_id in planned_ids for k in unit_keys]
+    return {
+        "units": {
+            "planned": len(plan),
+            "done": result["done"],
+            "resumed": result["resumed"],
+            "failed": result["failed"],
+            "skipped_budget": result["skipped_budget"],
+        },
+        "coverage": await _coverage(list(dict.fromkeys(keys))),
+        "cost": {
+            "groq": {k: groq_after.get(k, 0) - groq_before.get(k, 0) for k in groq_after},
+            "external_calls": dict(Counter(service for service, _, _ in spans if service != "node")),
+            "reddit_requests": reddit_client_stats()["requests"] - reddit_before,
+            "background_jobs": _jobs_finished() - jobs_before,
+            "wall_s": round(time.perf_counter() - started, 1),
+        },
+    }
+
+
+def format_report(report: dict) -> str:
+    units = report["units"]
+    lines = [
+        f"units: {units['done']} warmed, {units['resumed']} already done, "
+        f"{units['failed']} failed, {units['skipped_budget']} skipped (Groq budget) — of {units['planned']}",
+        "coverage:",
+    ]
+    for family, c in report["coverage"].items():
+        pct = 100 * c["cached"] / c["targeted"] if c["targeted"] else 0.0
+        lines.append(f"  {family:<18} {c['cached']:>4}/{c['targeted']:<4} {pct:5.1f}%")
+    cost = report["cost"]
+    groq = cost["groq"]
+    lines.append(
+        f"cost: groq calls={groq.get('calls', 0)} errors={groq.get('errors', 0)} "
+        f"cache_hits={groq.get('cache_hits', 0)} "
+        f"tokens={groq.get('prompt_tokens', 0)}+{groq.get('completion_tokens', 0)}"
+    )
+    external = ", ".join(f"{s}={n}" for s, n in sorted(cost["external_calls"].items())) or "none"
+    lines.append(
+        f"      external calls (warmer only): {external}; reddit requests={cost['reddit_requests']}; "
+        f"background jobs={cost['background_jobs']}"
+    )
+    lines.append(f"      wall time: {cost['wall_s']}s")
+    return "\n".join(lines)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pre-populate card caches for destinations × experience types.")
+    parser.add_argument("--destinations", nargs="*", default=[], help="destination names")
+    parser.add_argument("--destinations-file", help="file with one destination per line")
+    parser.add_argument("--experience-types", nargs="*", default=EXPERIENCE_TYPES, choices=EXPERIENCE_TYPES)
+    parser.add_argument("--areas", type=int, default=WARM_AREAS_PER_DESTINATION, help="areas per destination")
+    parser.add_argument("--places", type=int, default=WARM_PLACES_PER_AREA, help="places per area")
+    parser.add_argument("--concurrency", type=int, default=WARM_CONCURRENCY, help="units in flight")
+    parser.add_argument("--max-groq-calls", type=int, default=WARM_MAX_GROQ_CALLS)
+    parser.add_argument("--checkpoint", default=WARM_CHECKPOINT)
+    parser.add_argument("--fresh", action="store_true", help="ignore the checkpoint and start over")
+    args = parser.parse_args(argv)
+    if args.destinations_file:
+        with open(args.destinations_file) as f:
+            args.destinations += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    if not args.destinations:
+        parser.error("no destinations given")
+    return args
+
+
+async def _main(args: argparse.Namespace) -> dict:
+    await init_redis_pool()
+    await init_http_session()
+    await init_reddit_client()
+    await init_scheduler()
+    try:
+        return await warm(
+            args.destinations, args.experience_types,
+            areas=args.areas, places=args.places, concurrency=args.concurrency,
+            max_groq_calls=args.max_groq_calls, checkpoint_path=args.checkpoint, fresh=args.fresh,
+        )
+    finally:
+        await drain_scheduler()
+        await close_reddit_client()
+        await close_http_session()
+        await close_redis_pool()
+
+
+def main(argv: list[str] | None = None) -> int:
+    report = asyncio.run(_main(_parse_args(argv)))
+    print(format_report(report))
+    return 1 if report["units"]["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
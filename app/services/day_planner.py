@@ -3,51 +3,31 @@ app/services/day_planner.py — Sprint 6: route arcs, day plan, destination brie
 """
 import asyncio
 import json
-import os
 from datetime import datetime
 from typing import Any
 
-import aiohttp
 
-from app.services.area_cache import get_cached
+from app.services.area_cache import get_many_cached
 from app.services.tavily_client import tavily_search
+from app.services.llm_gateway import complete_json
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-GROQ_API_KEY = os.getenv("GROQ_API", "")
-GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
 _MODEL = "meta-llama/llama-4-scout-17b-16e-instruct"
 
 PACE_DENSITY: dict[str, int] = {"slow": 2, "mix": 3, "power": 5}
 
 
-def _strip_fences(text: str) -> str:
-    """Strip markdown code fences from Groq response."""
-    text = text.strip()
-    if text.startswith("```"):
-        parts = text.split("```")
-        text = parts[1] if len(parts) > 1 else text
-        if text.startswith("json"):
-            text = text[4:]
-        text = text.split("```")[0]
-    return text
-
-
 async def _groq_post(prompt: str, max_tokens: int) -> Any:
     """POST to Groq and return parsed JSON. Raises on any failure."""
-    headers = {"Authorization": f"Bearer {GROQ_API_KEY}", "Content-Type": "application/json"}
-    body = {
-        "model": _MODEL,
-        "messages": [{"role": "user", "content": prompt}],
-        "max_tokens": max_tokens,
-        "temperature": 0.3,
-    }
-    async with aiohttp.ClientSession() as session:
-        async with session.post(GROQ_URL, headers=headers, json=body) as r:
-            result = await r.json()
-            text = result["choices"][0]["message"]["content"]
-            return json.loads(_strip_fences(text))
+    return await complete_json(
+        [{"role": "user", "content": prompt}],
+        max_tokens=max_tokens,
+        temperature=0.3,
+        call_site="day_planner",
+        model=_MODEL,
+    )
 
 
 async def generate_route_arcs(state: dict) -> list[dict]:
@@ -119,10 +99,9 @@ async def generate_day_plan(state: dict) -> list[dict]:
         for p in cat.get("places", [])
         if p.get("id")
     ]
+    cache_keys = [f"activity_options:{destination.lower()}:{pid.lower()}" for pid in place_ids]
     all_cached: list[dict] = []
-    for pid in place_ids:
-        cache_key = f"activity_options:{destination.lower()}:{pid.lower()}"
-        cached = await get_cached(cache_key)
+    for cached in await get_many_cached(cache_keys):
         if cached:
             all_cached.extend(cached)
 
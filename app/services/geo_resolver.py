@@ -3,10 +3,12 @@ Geo Resolver - Converts place names to geographic coordinates using geocoding AP
 """
 import logging
 import os
-import aiohttp
 from typing import Optional
 from dataclasses import asdict
 
+from app.services.geocode_cache import nominatim_slot
+from app.services.http_client import http_session
+from app.services.tracing import traced
 from app.models import ResolvedArea, GeoLocation, BoundingBox
 
 logger = logging.getLogger(__name__)
@@ -81,6 +83,7 @@ class GeoResolver:
         
         return results
     
+    @traced("google_geocode", "geocode")
     async def _google_geocode(self, query: str) -> Optional[ResolvedArea]:
         """Use Google Geocoding API."""
         if not self.google_api_key:
@@ -93,7 +96,7 @@ class GeoResolver:
                 "key": self.google_api_key
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with http_session() as session:
                 async with session.get(GOOGLE_GEOCODING_URL, params=params) as r:
                     data = await r.json()
             
@@ -155,6 +158,7 @@ class GeoResolver:
             logger.error(f"Google geocoding error: {e}")
             return None
     
+    @traced("nominatim", "geocode")
     async def _nominatim_geocode(self, query: str) -> Optional[ResolvedArea]:
         """Use Nominatim (OpenStreetMap) as fallback."""
         try:
@@ -168,9 +172,10 @@ class GeoResolver:
                 "User-Agent": "RoamMate/1.0"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(NOMINATIM_URL, params=params, headers=headers) as r:
-                    data = await r.json()
+            async with nominatim_slot():
+                async with http_session() as session:
+                    async with session.get(NOMINATIM_URL, params=params, headers=headers) as r:
+                        data = await r.json()
             
             if not data:
                 return None
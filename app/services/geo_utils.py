@@ -2,20 +2,50 @@
 app/services/geo_utils.py — Geographic utilities for Sprint 2.
 
 get_origin: resolve origin coordinates or name from GraphState
-geocode: Nominatim city name → {lat, lng}
+geocode: city name → {lat, lng} via gazetteer, Redis cache, then queued Nominatim
 driving_time: OSRM road routing between two coordinate pairs
-batch_driving_times: parallel OSRM calls for multiple destinations
+batch_driving_times: OSRM /table matrix for many destinations, with a cell cache
+haversine_km / prefilter_reachable: vectorised great-circle screen before routing
 resolve_origin_coords: get_origin + geocode if only name available
 """
 import asyncio
+import json
+import os
+
 import aiohttp
+import numpy as np
 
+from app.services.geocode_cache import (
+    gazetteer_lookup,
+    get_cached_geocode,
+    nominatim_slot,
+    normalize_place_name,
+    set_cached_geocode,
+)
+from app.services.http_client import http_session
+from app.services.redis_pool import get_redis
+from app.services.single_flight import coalesce
+from app.services.tracing import traced
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
-OSRM_URL = "http://router.project-osrm.org/route/v1/driving"
+# Point OSRM_BASE_URL at a self-hosted osrm-routed (e.g. http://localhost:5000)
+OSRM_BASE_URL = os.getenv("OSRM_BASE_URL", "http://router.project-osrm.org").rstrip("/")
+OSRM_URL = f"{OSRM_BASE_URL}/route/v1/driving"
+OSRM_TABLE_URL = f"{OSRM_BASE_URL}/table/v1/driving"
+# osrm-routed rejects tables above --max-table-size (100 by default)
+OSRM_TABLE_CHUNK = int(os.getenv("OSRM_TABLE_CHUNK", "50"))
+# Route cache grid: 0.01° ≈ 1.1 km, so nearby GPS fixes share entries
+OSRM_CACHE_CELL_DEG = float(os.getenv("OSRM_CACHE_CELL_DEG", "0.01"))
+OSRM_CACHE_TTL = int(os.getenv("OSRM_CACHE_TTL", str(30 * 86400)))
+
+EARTH_RADIUS_KM = 6371.0088
+# Best-case road model for the pre-filter: road km = great-circle km × circuity,
+# driven at ROAD_MAX_SPEED_KMH. Generous on purpose — it only drops the hopeless.
+ROAD_CIRCUITY = float(os.getenv("ROAD_CIRCUITY", "1.2"))
+ROAD_MAX_SPEED_KMH = float(os.getenv("ROAD_MAX_SPEED_KMH", "90"))
 _HEADERS = {"User-Agent": "RoamMate/1.0 travel-assistant-app"}
 
 
@@ -40,25 +70,57 @@ def get_origin(state: dict) -> dict | None:
 
 async def geocode(place_name: str) -> dict | None:
     """
-    Nominatim: city name → {lat, lng}.
-    Appends ", India" to bias results. Returns None on any failure.
+    City name → {lat, lng}. Returns None when the place cannot be found.
+    Checks the bundled gazetteer, then the Redis geocode cache, and only then
+    queues a Nominatim lookup (1 req/s). Nominatim answers are cached, and
+    "no match" answers are cached too (for a shorter time).
+    """
+    key = normalize_place_name(place_name)
+    if not key:
+        return None
+    coords = gazetteer_lookup(key)
+    if coords:
+        return coords
+    found, coords = await get_cached_geocode(key)
+    if found:
+        return coords
+    return await coalesce(f"geocode:{key}", lambda: _geocode_remote(place_name, key))
+
+
+async def _geocode_remote(place_name: str, key: str) -> dict | None:
+    coords, definitive = await _nominatim_search(place_name)
+    if definitive:
+        await set_cached_geocode(key, coords)
+    return coords
+
+
+@traced("nominatim", "geocode")
+async def _nominatim_search(place_name: str) -> tuple[dict | None, bool]:
+    """
+    Nominatim: appends ", India" to bias results.
+    Returns (coords, definitive) — definitive is False on network/parse errors,
+    which must not be negative-cached.
     """
     params = {"q": f"{place_name}, India", "format": "json", "limit": 1}
     try:
-        async with aiohttp.ClientSession(headers=_HEADERS) as session:
-            async with session.get(
-                NOMINATIM_URL,
-                params=params,
-                timeout=aiohttp.ClientTimeout(total=8),
-            ) as r:
-                results = await r.json()
-                if results:
-                    return {"lat": float(results[0]["lat"]), "lng": float(results[0]["lon"])}
+        async with nominatim_slot():
+            async with http_session() as session:
+                async with session.get(
+                    NOMINATIM_URL,
+                    params=params,
+                    headers=_HEADERS,
+                    timeout=aiohttp.ClientTimeout(total=8),
+                ) as r:
+                    results = await r.json()
+        if results:
+            return {"lat": float(results[0]["lat"]), "lng": float(results[0]["lon"])}, True
+        return None, True
     except Exception as e:
         logger.warning(f"[Nominatim] geocode failed for '{place_name}': {e}")
-    return None
+    return None, False
 
 
+@traced("osrm", "route")
 async def driving_time(origin: dict, destination: dict) -> dict | None:
     """
     OSRM: actual road driving time + distance between two {lat, lng} dicts.
@@ -72,35 +134,167 @@ async def driving_time(origin: dict, destination: dict) -> dict | None:
         "?overview=false"
     )
     try:
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as r:
                 data = await r.json()
                 if data.get("code") == "Ok" and data.get("routes"):
                     route = data["routes"][0]
-                    distance_km = round(route["distance"] / 1000)
-                    duration_mins = round(route["duration"] / 60)
-                    hours = duration_mins // 60
-                    mins = duration_mins % 60
-                    travel_time = f"{hours}h {mins}min" if mins else f"{hours}h"
-                    return {
-                        "distance_km": distance_km,
-                        "duration_mins": duration_mins,
-                        "travel_time": travel_time,
-                    }
+                    return _route_summary(route["distance"], route["duration"])
     except Exception as e:
         logger.warning(f"[OSRM] routing failed: {e}")
     return None
 
 
+def haversine_km(origin: dict, points: list[dict]) -> np.ndarray:
+    """Great-circle distance in km from origin to every {lat, lng} in points."""
+    if not points:
+        return np.empty(0)
+    coords = np.radians(np.array([[p["lat"], p["lng"]] for p in points], dtype=float))
+    lat0, lng0 = np.radians(origin["lat"]), np.radians(origin["lng"])
+    dlat = coords[:, 0] - lat0
+    dlng = coords[:, 1] - lng0
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat0) * np.cos(coords[:, 0]) * np.sin(dlng / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def prefilter_reachable(origin: dict, points: list[dict], max_minutes: float) -> list[int]:
+    """
+    Indices of points that could be reached within max_minutes, nearest first.
+    A point is dropped when even its best case — great-circle distance ×
+    ROAD_CIRCUITY at ROAD_MAX_SPEED_KMH — exceeds the limit.
+    """
+    distances = haversine_km(origin, points)
+    best_case_mins = distances * ROAD_CIRCUITY / ROAD_MAX_SPEED_KMH * 60
+    keep = np.flatnonzero(best_case_mins <= max_minutes)
+    return keep[np.argsort(distances[keep], kind="stable")].tolist()
+
+
+def _route_summary(distance_m: float | None, duration_s: float) -> dict:
+    """{distance_km, duration_mins, travel_time} from OSRM metres / seconds."""
+    duration_mins = round(duration_s / 60)
+    hours = duration_mins // 60
+    mins = duration_mins % 60
+    travel_time = f"{hours}h {mins}min" if mins else f"{hours}h"
+    return {
+        "distance_km": round(distance_m / 1000) if distance_m is not None else None,
+        "duration_mins": duration_mins,
+        "travel_time": travel_time,
+    }
+
+
+def _cell(point: dict) -> str:
+    step = OSRM_CACHE_CELL_DEG
+    return f"{round(point['lat'] / step) * step:.4f},{round(point['lng'] / step) * step:.4f}"
+
+
+def _route_cache_key(origin: dict, destination: dict) -> str:
+    return f"osrm:{_cell(origin)}:{_cell(destination)}"
+
+
+async def _get_cached_routes(keys: list[str]) -> list[dict | None]:
+    r = await get_redis()
+    if not r or not keys:
+        return [None] * len(keys)
+    try:
+        raws = await r.mget(keys)
+        return [json.loads(raw) if raw else None for raw in raws]
+    except Exception as e:
+        logger.warning(f"[OSRM] route cache get error: {e}")
+        return [None] * len(keys)
+
+
+async def _set_cached_routes(routes: dict[str, dict]) -> None:
+    r = await get_redis()
+    if not r or not routes:
+        return
+    try:
+        async with r.pipeline(transaction=False) as pipe:
+            for key, route in routes.items():
+                pipe.setex(key, OSRM_CACHE_TTL, json.dumps(route))
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"[OSRM] route cache set error: {e}")
+
+
+@traced("osrm", "table")
+async def _osrm_table(origin: dict, destinations: list[dict]) -> list[dict | None] | None:
+    """
+    OSRM /table: one origin row against up to OSRM_TABLE_CHUNK destinations.
+    Returns one summary per destination (None where OSRM found no route),
+    or None when the table call itself failed.
+    """
+    coords = ";".join(f"{p['lng']},{p['lat']}" for p in [origin, *destinations])
+    params = {
+        "sources": "0",
+        "destinations": ";".join(str(i) for i in range(1, len(destinations) + 1)),
+        "annotations": "duration,distance",
+    }
+    try:
+        async with http_session() as session:
+            async with session.get(
+                f"{OSRM_TABLE_URL}/{coords}",
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as r:
+                data = await r.json(content_type=None)
+        if data.get("code") != "Ok" or not data.get("durations"):
+            logger.warning(f"[OSRM] table returned {data.get('code')}")
+            return None
+        durations = data["durations"][0]
+        distances = (data.get("distances") or [[None] * len(durations)])[0]
+        return [
+            _route_summary(dist, dur) if dur is not None else None
+            for dur, dist in zip(durations, distances)
+        ]
+    except Exception as e:
+        logger.warning(f"[OSRM] table failed: {e}")
+        return None
+
+
 async def batch_driving_times(
     origin: dict, destinations: list[dict]
 ) -> list[dict | None]:
-    """Run driving_time for multiple destinations in parallel."""
-    results = await asyncio.gather(
-        *[driving_time(origin, d) for d in destinations],
-        return_exceptions=True,
+    """
+    Driving time from origin to every destination, in input order.
+    Cached (origin cell, destination cell) pairs skip the network; the rest go
+    out as OSRM /table requests of at most OSRM_TABLE_CHUNK destinations.
+    A chunk whose table call fails falls back to per-pair driving_time.
+    """
+    if not destinations:
+        return []
+    keys = [_route_cache_key(origin, d) for d in destinations]
+    results = await _get_cached_routes(keys)
+    missing = [i for i, route in enumerate(results) if route is None]
+    if not missing:
+        logger.info(f"[OSRM] {len(keys)}/{len(keys)} routes from cache")
+        return results
+
+    chunks = [missing[i:i + OSRM_TABLE_CHUNK] for i in range(0, len(missing), OSRM_TABLE_CHUNK)]
+    tables = await asyncio.gather(*(
+        _osrm_table(origin, [destinations[i] for i in chunk]) for chunk in chunks
+    ))
+    fallback: list[int] = []
+    for chunk, table in zip(chunks, tables):
+        if table is None:
+            fallback.extend(chunk)
+        else:
+            for i, route in zip(chunk, table):
+                results[i] = route
+
+    if fallback:
+        routed = await asyncio.gather(
+            *[driving_time(origin, destinations[i]) for i in fallback],
+            return_exceptions=True,
+        )
+        for i, route in zip(fallback, routed):
+            results[i] = None if isinstance(route, BaseException) else route
+
+    await _set_cached_routes({keys[i]: results[i] for i in missing if results[i]})
+    logger.info(
+        f"[OSRM] {len(keys) - len(missing)}/{len(keys)} routes from cache, "
+        f"{len(chunks)} table call(s), {len(fallback)} per-pair fallback(s)"
     )
-    return [None if isinstance(r, BaseException) else r for r in results]
+    return results
 
 
 async def resolve_origin_coords(state: dict) -> dict | None:
@@ -0,0 +1,150 @@
+"""
+app/services/geocode_cache.py — Persistent geocode store for geo_utils.geocode.
+
+normalize_place_name: canonical lookup key ("Lonavala, India" → "lonavala")
+gazetteer_lookup: bundled offline gazetteer of Indian cities and towns
+get_cached_geocode / set_cached_geocode: Redis entries with long positive
+    and shorter negative TTLs
+nominatim_slot: rate-limit queue — at most one Nominatim request per
+    NOMINATIM_MIN_INTERVAL seconds per worker, served in arrival order
+geocode_cache_stats: where lookups were answered
+
+Lookup order in geocode(): gazetteer → Redis → Nominatim (queued).
+The gazetteer is a CSV (name,state,lat,lng,aliases) loaded once per process;
+point GEOCODE_GAZETTEER_PATH at a larger export to widen coverage.
+"""
+import asyncio
+import csv
+import json
+import os
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from app.services.redis_pool import get_redis
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+GEOCODE_GAZETTEER_PATH = os.getenv(
+    "GEOCODE_GAZETTEER_PATH",
+    os.path.join(os.path.dirname(__file__), "data", "india_gazetteer.csv"),
+)
+GEOCODE_TTL = int(os.getenv("GEOCODE_TTL", str(180 * 86400)))
+GEOCODE_NEGATIVE_TTL = int(os.getenv("GEOCODE_NEGATIVE_TTL", str(7 * 86400)))
+NOMINATIM_MIN_INTERVAL = float(os.getenv("NOMINATIM_MIN_INTERVAL", "1.0"))
+
+# Stored for names Nominatim has no match for
+_NEGATIVE = "none"
+
+_gazetteer: dict[str, dict] | None = None
+_nominatim_lock: asyncio.Lock | None = None
+_nominatim_lock_loop: asyncio.AbstractEventLoop | None = None
+_last_nominatim_call = 0.0
+
+_stats = {"gazetteer_hits": 0, "cache_hits": 0, "negative_hits": 0, "misses": 0, "nominatim_wait_s": 0.0}
+
+
+def geocode_cache_stats() -> dict[str, float]:
+    return {**_stats, "gazetteer_size": len(_gazetteer or {})}
+
+
+def normalize_place_name(name: str) -> str:
+    """Lowercase, drop punctuation and a trailing country, collapse whitespace."""
+    key = re.sub(r"[^\w\s]", " ", (name or "").lower())
+    key = re.sub(r"\s+", " ", key).strip()
+    return re.sub(r"\s+india$", "", key)
+
+
+def _load_gazetteer() -> dict[str, dict]:
+    entries: dict[str, dict] = {}
+    try:
+        with open(GEOCODE_GAZETTEER_PATH, encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                coords = {"lat": float(row["lat"]), "lng": float(row["lng"])}
+                names = [row["name"], *(row.get("aliases") or "").split("|")]
+                for name in names:
+                    key = normalize_place_name(name)
+                    if key:
+                        entries.setdefault(key, coords)
+                        # "Manali, Himachal Pradesh" is a common LLM spelling
+                        entries.setdefault(normalize_place_name(f"{name} {row['state']}"), coords)
+    except Exception as e:
+        logger.warning(f"[geocode_cache] gazetteer load failed ({GEOCODE_GAZETTEER_PATH}): {e}")
+    logger.info(f"[geocode_cache] gazetteer: {len(entries)} names")
+    return entries
+
+
+def gazetteer_lookup(key: str) -> dict | None:
+    """{lat, lng} for a normalized name from the bundled gazetteer, else None."""
+    global _gazetteer
+    if _gazetteer is None:
+        _gazetteer = _load_gazetteer()
+    coords = _gazetteer.get(key)
+    if coords:
+        _stats["gazetteer_hits"] += 1
+        return dict(coords)
+    return None
+
+
+async def get_cached_geocode(key: str) -> tuple[bool, dict | None]:
+    """(found, coords). found with coords None is a cached negative."""
+    r = await get_redis()
+    if not r:
+        return False, None
+    try:
+        raw = await r.get(f"geo:{key}")
+    except Exception as e:
+        logger.warning(f"[geocode_cache] get error for {key}: {e}")
+        return False, None
+    if raw is None:
+        _stats["misses"] += 1
+        return False, None
+    if raw == _NEGATIVE:
+        _stats["negative_hits"] += 1
+        return True, None
+    _stats["cache_hits"] += 1
+    return True, json.loads(raw)
+
+
+async def set_cached_geocode(key: str, coords: dict | None) -> None:
+    """Store coords for GEOCODE_TTL, or a negative entry for GEOCODE_NEGATIVE_TTL."""
+    r = await get_redis()
+    if not r:
+        return
+    try:
+        if coords is None:
+            await r.setex(f"geo:{key}", GEOCODE_NEGATIVE_TTL, _NEGATIVE)
+        else:
+            await r.setex(f"geo:{key}", GEOCODE_TTL, json.dumps(coords))
+    except Exception as e:
+        logger.warning(f"[geocode_cache] set error for {key}: {e}")
+
+
+def _nominatim_limiter() -> asyncio.Lock:
+    """The Nominatim queue lock for the running loop (a new loop gets a fresh one)."""
+    global _nominatim_lock, _nominatim_lock_loop
+    loop = asyncio.get_running_loop()
+    if _nominatim_lock is None or _nominatim_lock_loop is not loop:
+        _nominatim_lock = asyncio.Lock()
+        _nominatim_lock_loop = loop
+    return _nominatim_lock
+
+
+@asynccontextmanager
+async def nominatim_slot() -> AsyncIterator[None]:
+    """
+    Hold the Nominatim slot for one request. asyncio.Lock wakes waiters in
+    FIFO order, so a burst of lookups becomes a 1 req/s queue.
+    """
+    global _last_nominatim_call
+    async with _nominatim_limiter():
+        wait = _last_nominatim_call + NOMINATIM_MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            _stats["nominatim_wait_s"] += wait
+            await asyncio.sleep(wait)
+        try:
+            yield
+        finally:
+            _last_nominatim_call = time.monotonic()
@@ -0,0 +1,95 @@
+"""
+app/services/http_client.py — Shared aiohttp session for every outbound HTTP call.
+
+init_http_session: called from the FastAPI lifespan on startup
+close_http_session: called from the FastAPI lifespan on shutdown
+http_session: async context manager yielding the shared session
+
+One pooled TCPConnector (per-host limits, DNS cache, keep-alive) is reused by
+Groq, Tavily, Nominatim, OSRM, Google and the MCP tool servers, so a /chat turn
+pays the TLS handshake once per host instead of once per call.
+
+Outside the server (scripts, tests) there is no lifespan, so http_session falls
+back to a short-lived session that is closed when the block exits.
+"""
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import aiohttp
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+HTTP_POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "20"))
+HTTP_DNS_CACHE_TTL = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+HTTP_KEEPALIVE_TIMEOUT = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "60"))
+HTTP_TIMEOUT_TOTAL = float(os.getenv("HTTP_TIMEOUT_TOTAL", "30"))
+HTTP_TIMEOUT_CONNECT = float(os.getenv("HTTP_TIMEOUT_CONNECT", "5"))
+
+_session: aiohttp.ClientSession | None = None
+
+
+def _default_timeout() -> aiohttp.ClientTimeout:
+    return aiohttp.ClientTimeout(total=HTTP_TIMEOUT_TOTAL, connect=HTTP_TIMEOUT_CONNECT)
+
+
+async def init_http_session() -> aiohttp.ClientSession:
+    """Create the shared pooled session. Idempotent."""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_POOL_LIMIT,
+            limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        )
+        _session = aiohttp.ClientSession(connector=connector, timeout=_default_timeout())
+        logger.info(
+            f"[http_client] ready: limit={HTTP_POOL_LIMIT} per_host={HTTP_POOL_LIMIT_PER_HOST} "
+            f"dns_ttl={HTTP_DNS_CACHE_TTL}s timeout={HTTP_TIMEOUT_TOTAL}s"
+        )
+    return _session
+
+
+async def close_http_session() -> None:
+    """Close the shared session and its connector. Safe to call when never opened."""
+    global _session
+    if _session is None:
+        return
+    try:
+        await _session.close()
+    except Exception as e:
+        logger.warning(f"[http_client] close error: {e}")
+    finally:
+        _session = None
+    logger.info("[http_client] closed")
+
+
+@asynccontextmanager
+async def http_session() -> AsyncIterator[aiohttp.ClientSession]:
+    """Yield the shared session, or a throwaway one when the lifespan hasn't opened it.
+
+    Callers must not close the yielded session themselves.
+    """
+    if _session is not None and not _session.closed:
+        yield _session
+        return
+    async with aiohttp.ClientSession(timeout=_default_timeout()) as session:
+        yield session
+
+
+def http_pool_stats() -> dict:
+    """Connector occupancy for the shared session (zeros when not initialised)."""
+    if _session is None or _session.closed:
+        return {"open": False, "limit": HTTP_POOL_LIMIT, "limit_per_host": HTTP_POOL_LIMIT_PER_HOST, "acquired": 0}
+    connector = _session.connector
+    acquired = len(getattr(connector, "_acquired", ()))
+    return {
+        "open": True,
+        "limit": HTTP_POOL_LIMIT,
+        "limit_per_host": HTTP_POOL_LIMIT_PER_HOST,
+        "acquired": acquired,
+    }
@@ -1,15 +1,14 @@
 """
 Intent Extractor - Extracts structured travel intent from user text using LLM.
 """
-import json
 import logging
 import os
-import aiohttp
 from typing import Optional
 
 from dotenv import load_dotenv
 load_dotenv()  # Ensure .env is loaded before reading env vars at module level
 
+from app.services.llm_gateway import complete, extract_json
 from app.models import (
     TravelIntent, Destination, IntentConfidence,
     Vibe, CrowdPreference, Duration, Budget
@@ -19,7 +18,6 @@ logger = logging.getLogger(__name__)
 
 # LLM Configuration — read after load_dotenv()
 GROQ_API_KEY = os.getenv("GROQ_API")
-GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
 MODEL = "meta-llama/llama-4-scout-17b-16e-instruct"
 
 SYSTEM_PROMPT = """You are a travel intent extractor. Always respond with ONLY valid JSON, no other text.
@@ -80,10 +78,6 @@ class IntentExtractor:
     
     async def _call_llm(self, messages: list) -> dict:
         """Call LLM API for intent extraction, passing the full conversation as structured messages."""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
         # Map our internal roles to LLM API roles
         def _to_api_role(role: str) -> str:
             if role in ("human", "user"):
@@ -97,37 +91,19 @@ class IntentExtractor:
             for m in messages if m.get("content")
         ]
 
-        body = {
-            "model": MODEL,
-            "messages": [{"role": "system", "content": SYSTEM_PROMPT}] + api_messages,
-            "max_tokens": 500,
-            "temperature": 0.1
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.post(GROQ_URL, headers=headers, json=body) as r:
-                result = await r.json()
-                content = result["choices"][0]["message"]["content"]
-                return self._extract_json(content)
+        content = await complete(
+            [{"role": "system", "content": SYSTEM_PROMPT}] + api_messages,
+            max_tokens=500,
+            temperature=0.1,
+            call_site="intent",
+            model=MODEL,
+            api_key=self.api_key or "",
+        )
+        return self._extract_json(content)
     
     def _extract_json(self, content: str) -> dict:
         """Extract JSON from LLM response."""
-        # Try direct parse first
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            pass
-        
-        # Try to find JSON in response
-        import re
-        json_match = re.search(r'\{[\s\S]*\}', content)
-        if json_match:
-            try:
-                return json.loads(json_match.group())
-            except json.JSONDecodeError:
-                pass
-        
-        raise ValueError(f"Could not parse JSON from response: {content[:200]}")
+        return extract_json(content, expect=dict)
     
     def _parse_response(self, data: dict) -> TravelIntent:
         """Parse LLM response into TravelIntent model."""
@@ -252,20 +228,17 @@ class IntentExtractor:
             for m in messages if (m.get("content") if isinstance(m, dict) else getattr(m, "content", ""))
         ]
         logger.info("[Groq/clarify] → generating conversational question")
-        headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
-        body = {
-            "model": MODEL,
-            "messages": [{"role": "system", "content": system}] + api_messages,
-            "max_tokens": 80,
-            "temperature": 0.8,
-        }
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(GROQ_URL, headers=headers, json=body) as r:
-                    result = await r.json()
-                    question = result["choices"][0]["message"]["content"].strip()
-                    logger.info(f"[Groq/clarify] ✓ question generated")
-                    return question
+            question = (await complete(
+                [{"role": "system", "content": system}] + api_messages,
+                max_tokens=80,
+                temperature=0.8,
+                call_site="clarify",
+                model=MODEL,
+                api_key=self.api_key,
+            )).strip()
+            logger.info(f"[Groq/clarify] ✓ question generated")
+            return question
         except Exception as e:
             logger.error(f"[Groq/clarify] ✗ {e}")
             return "Sounds like a fun trip! Where are you thinking of going?"
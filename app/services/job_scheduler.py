@@ -0,0 +1,203 @@
+"""
+app/services/job_scheduler.py — In-process background job scheduler.
+
+schedule: queue a job under a key; a key already queued or running is skipped
+init_scheduler: start the worker pool (FastAPI lifespan, startup)
+drain_scheduler: stop taking jobs, let queued ones finish within
+    JOB_DRAIN_TIMEOUT, cancel the rest (FastAPI lifespan, shutdown)
+wait_for_jobs: wait until the queue is empty and no job is running
+job_scheduler_stats: queue depth, running jobs and outcome counters for /health
+
+A job is a zero-argument callable returning an awaitable, so nothing runs (or
+is created) until a worker picks it up. JOB_WORKERS workers take jobs in
+priority order — PRIORITY_HIGH first, FIFO within a priority. At most
+JOB_QUEUE_MAX jobs wait; beyond that new ones are dropped. Failures are
+logged and counted, never raised to the caller.
+
+Metrics on /metrics: roammate_job_queue_depth, roammate_job_wait_seconds,
+roammate_job_duration_seconds and roammate_jobs_total, labelled by the key
+prefix (reddit_area:goa:vagator → reddit_area).
+
+Outside the server there is no lifespan, so the first schedule() starts the
+workers on the running loop. Once drained, the scheduler drops new jobs
+until init_scheduler() runs again. Workers run in an empty contextvars context: a
+job queued during a /chat turn does not add spans to that turn's timing line
+or emit into its stream.
+"""
+import asyncio
+import contextvars
+import itertools
+import os
+import time
+from typing import Any, Awaitable, Callable
+
+from app.services.tracing import JOB_QUEUE_DEPTH, JOB_RESULTS, JOB_SECONDS, JOB_WAIT_SECONDS
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+JOB_QUEUE_MAX = int(os.getenv("JOB_QUEUE_MAX", "500"))
+JOB_DRAIN_TIMEOUT = float(os.getenv("JOB_DRAIN_TIMEOUT", "10"))
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 10
+PRIORITY_LOW = 20
+
+JobFactory = Callable[[], Awaitable[Any]]
+
+
+def _job_name(key: str) -> str:
+    return key.split(":", 1)[0]
+
+
+class JobScheduler:
+    """Priority queue drained by a fixed pool of worker tasks on one event loop."""
+
+    def __init__(self, workers: int = JOB_WORKERS, max_queue: int = JOB_QUEUE_MAX):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.PriorityQueue | None = None
+        self._worker_tasks: list[asyncio.Task] = []
+        self._keys: set[str] = set()  # queued or running
+        self._seq = itertools.count()
+        self._accepting = True
+        self._closed = False  # drained: no lazy restart until start(reopen=True)
+        self._running = 0
+        self._stats = {"submitted": 0, "deduped": 0, "dropped": 0, "completed": 0, "failed": 0, "cancelled": 0}
+
+    def start(self, reopen: bool = False) -> None:
+        """Start the workers on the running loop. Idempotent per loop.
+
+        After drain() the scheduler stays closed — a late submit() must not
+        bring workers back once the lifespan has closed the clients jobs use —
+        until it is explicitly reopened.
+        """
+        if self._closed and not reopen:
+            return
+        self._closed = False
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._queue = asyncio.PriorityQueue()
+        self._keys.clear()
+        self._running = 0
+        self._accepting = True
+        self._worker_tasks = [
+            loop.create_task(self._worker(), name=f"job-worker-{i}", context=contextvars.Context())
+            for i in range(self.workers)
+        ]
+        logger.info(f"[jobs] ready: workers={self.workers} max_queue={self.max_queue}")
+
+    def submit(self, key: str, factory: JobFactory, priority: int = PRIORITY_NORMAL) -> bool:
+        """Queue factory() under key. False when deduplicated, full or draining."""
+        self.start()
+        job = _job_name(key)
+        if self._closed or not self._accepting:
+            self._stats["dropped"] += 1
+            JOB_RESULTS.inc(job, "dropped")
+            logger.warning(f"[jobs] {'closed' if self._closed else 'draining'}, dropped: {key}")
+            return False
+        if key in self._keys:
+            self._stats["deduped"] += 1
+            JOB_RESULTS.inc(job, "deduped")
+            return False
+        if self._queue.qsize() >= self.max_queue:
+            self._stats["dropped"] += 1
+            JOB_RESULTS.inc(job, "dropped")
+            logger.warning(f"[jobs] queue full ({self.max_queue}), dropped: {key}")
+            return False
+        self._keys.add(key)
+        self._queue.put_nowait((priority, next(self._seq), key, factory, time.monotonic()))
+        self._stats["submitted"] += 1
+        JOB_QUEUE_DEPTH.set(self._queue.qsize())
+        return True
+
+    async def _worker(self) -> None:
+        while True:
+            _, _, key, factory, enqueued_at = await self._queue.get()
+            JOB_QUEUE_DEPTH.set(self._queue.qsize())
+            job = _job_name(key)
+            started = time.monotonic()
+            JOB_WAIT_SECONDS.observe(started - enqueued_at, job)
+            self._running += 1
+            try:
+                await factory()
+                self._stats["completed"] += 1
+                JOB_RESULTS.inc(job, "completed")
+            except asyncio.CancelledError:
+                self._stats["cancelled"] += 1
+                JOB_RESULTS.inc(job, "cancelled")
+                raise
+            except Exception as e:
+                self._stats["failed"] += 1
+                JOB_RESULTS.inc(job, "failed")
+                logger.warning(f"[jobs] {key} failed: {e}")
+            finally:
+                JOB_SECONDS.observe(time.monotonic() - started, job)
+                self._running -= 1
+                self._keys.discard(key)
+                self._queue.task_done()
+
+    async def join(self) -> None:
+        """Wait until every queued job has finished."""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def drain(self, timeout: float = JOB_DRAIN_TIMEOUT) -> None:
+        """Refuse new jobs, give queued and running ones `timeout` seconds, cancel the rest."""
+        self._closed = True
+        if self._loop is None:
+            return
+        self._accepting = False
+        pending = self._queue.qsize() + self._running
+        logger.info(f"[jobs] draining {pending} job(s), timeout={timeout}s")
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"[jobs] drain timed out — cancelling {self._queue.qsize() + self._running} job(s)")
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._stats["dropped"] += self._queue.qsize()
+        self._loop = None
+        self._queue = None
+        self._worker_tasks = []
+        self._keys.clear()
+        self._running = 0
+        JOB_QUEUE_DEPTH.set(0)
+        logger.info("[jobs] drained")
+
+    def stats(self) -> dict:
+        return {
+            **self._stats,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "running": self._running,
+            "workers": self.workers,
+        }
+
+
+_scheduler = JobScheduler()
+
+
+def schedule(key: str, factory: JobFactory, priority: int = PRIORITY_NORMAL) -> bool:
+    """Queue a background job on the process scheduler. See JobScheduler.submit."""
+    return _scheduler.submit(key, factory, priority)
+
+
+async def init_scheduler() -> None:
+    _scheduler.start(reopen=True)
+
+
+async def drain_scheduler(timeout: float = JOB_DRAIN_TIMEOUT) -> None:
+    await _scheduler.drain(timeout)
+
+
+async def wait_for_jobs() -> None:
+    await _scheduler.join()
+
+
+def job_scheduler_stats() -> dict:
+    return _scheduler.stats()
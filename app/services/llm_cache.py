@@ -0,0 +1,114 @@
+"""
+app/services/llm_cache.py — Content-addressed cache for Groq completions.
+
+Key format:
+  llm:{sha256(model, max_tokens, temperature, messages)}
+
+Two tiers: an in-process LRU in front of the shared Redis pool. A hit in
+either tier skips the Groq round trip entirely; Redis hits are promoted
+into the LRU so repeat lookups on the same worker stay in memory.
+
+Only call sites listed in LLM_CACHE_TTLS are cached — their prompts are
+built purely from destination / vibe / season / trip_who and run at low
+temperature, so identical prompts from different threads share one answer.
+
+cache_key: hash the request fields that determine the completion
+ttl_for: per-call-site TTL (0 = not cached)
+get_cached_completion / set_cached_completion: two-tier read / write-through
+"""
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+
+from app.services.redis_pool import get_redis
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+LLM_CACHE_LRU_SIZE = int(os.getenv("LLM_CACHE_LRU_SIZE", "512"))
+
+# call_site → TTL seconds. Sites not listed are never cached.
+LLM_CACHE_TTLS: dict[str, int] = {
+    "classify_destinations": 6 * 3600,    # built from Tavily snippets — refreshes with news
+    "destination_hooks":     24 * 3600,
+    "vibe_hooks":            24 * 3600,
+    "area_scale":            7 * 86400,   # geography doesn't change
+}
+
+# key → (expires_at monotonic, text)
+_lru: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+
+
+def ttl_for(call_site: str) -> int:
+    """TTL in seconds for call_site, 0 when the site is not cached."""
+    return LLM_CACHE_TTLS.get(call_site, 0)
+
+
+def cache_key(model: str, messages: list[dict], max_tokens: int, temperature: float) -> str:
+    """Stable content hash of everything that determines the completion."""
+    raw = json.dumps(
+        {"model": model, "messages": messages, "max_tokens": max_tokens, "temperature": temperature},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return "llm:" + hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _lru_get(key: str) -> str | None:
+    entry = _lru.get(key)
+    if entry is None:
+        return None
+    expires_at, text = entry
+    if expires_at < time.monotonic():
+        del _lru[key]
+        return None
+    _lru.move_to_end(key)
+    return text
+
+
+def _lru_set(key: str, text: str, ttl: int) -> None:
+    _lru[key] = (time.monotonic() + ttl, text)
+    _lru.move_to_end(key)
+    while len(_lru) > LLM_CACHE_LRU_SIZE:
+        _lru.popitem(last=False)
+
+
+async def get_cached_completion(key: str) -> str | None:
+    """Return cached completion text from the LRU, then Redis. None on miss/error."""
+    text = _lru_get(key)
+    if text is not None:
+        return text
+    r = await get_redis()
+    if not r:
+        return None
+    try:
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.ttl(key)
+            raw, ttl = await pipe.execute()
+        if raw is None:
+            return None
+        _lru_set(key, raw, ttl if ttl and ttl > 0 else 60)
+        return raw
+    except Exception as e:
+        logger.warning(f"[llm_cache] get error for {key}: {e}")
+        return None
+
+
+async def set_cached_completion(key: str, text: str, ttl: int) -> None:
+    """Write-through to the LRU and Redis. Silent on error."""
+    _lru_set(key, text, ttl)
+    r = await get_redis()
+    if not r:
+        return
+    try:
+        await r.setex(key, ttl, text)
+    except Exception as e:
+        logger.warning(f"[llm_cache] set error for {key}: {e}")
+
+
+def clear_local_cache() -> None:
+    """Drop the in-process LRU (Redis entries are left to expire)."""
+    _lru.clear()
@@ -0,0 +1,459 @@
+"""
+app/services/llm_gateway.py — Single async gateway for every Groq chat completion.
+
+complete: send messages, return the assistant text (raises LLMError on failure)
+complete_json: complete + extract_json in one call (only parseable replies are cached)
+stream: send messages with stream=true, yield text deltas as Groq produces them
+extract_json: shared, tolerant JSON extractor for LLM output (fences, prose, trailing text)
+llm_stats: per-call-site latency, retry and token accounting
+
+All callers share:
+  - the pooled HTTP session from http_client
+  - one concurrency limiter (GROQ_MAX_CONCURRENCY in-flight requests), created
+    lazily for the running event loop
+  - token buckets for Groq's requests-per-minute and tokens-per-minute quotas
+  - retry with jittered exponential backoff on 429 / 5xx / transport errors
+  - the llm_cache response cache, for call sites listed in LLM_CACHE_TTLS
+"""
+import asyncio
+import json
+import os
+import random
+import re
+import time
+from typing import Any, AsyncIterator, Callable
+
+import aiohttp
+
+from app.services.http_client import http_session
+from app.services.llm_cache import cache_key, get_cached_completion, set_cached_completion, ttl_for
+from app.services.tracing import observe
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
+DEFAULT_MODEL = "meta-llama/llama-4-scout-17b-16e-instruct"
+
+GROQ_MAX_CONCURRENCY = int(os.getenv("GROQ_MAX_CONCURRENCY", "8"))
+GROQ_RPM = int(os.getenv("GROQ_RPM", "30"))
+GROQ_TPM = int(os.getenv("GROQ_TPM", "30000"))
+GROQ_MAX_RETRIES = int(os.getenv("GROQ_MAX_RETRIES", "3"))
+GROQ_BACKOFF_BASE = float(os.getenv("GROQ_BACKOFF_BASE", "0.5"))
+GROQ_TIMEOUT = float(os.getenv("GROQ_TIMEOUT", "30"))
+
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class LLMError(Exception):
+    """Groq call failed after retries, or returned no usable completion."""
+
+
+class _TokenBucket:
+    """Continuous-refill token bucket. capacity tokens, refilled over 60 s."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(max(per_minute, 1))
+        self.tokens = self.capacity
+        self.rate = self.capacity / 60.0
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """Wait until `amount` tokens are available and take them. Returns seconds waited."""
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return waited
+            delay = (amount - self.tokens) / self.rate
+            waited += delay
+            await asyncio.sleep(delay)
+
+    def refund(self, amount: float) -> None:
+        """Return over-estimated tokens once the real usage is known."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+_semaphore: asyncio.Semaphore | None = None
+_semaphore_loop: asyncio.AbstractEventLoop | None = None
+_rpm_bucket = _TokenBucket(GROQ_RPM)
+_tpm_bucket = _TokenBucket(GROQ_TPM)
+
+_stats: dict[str, dict[str, float]] = {}
+
+
+def _limiter() -> asyncio.Semaphore:
+    """The concurrency limiter for the running loop (a new loop gets a fresh one)."""
+    global _semaphore, _semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _semaphore is None or _semaphore_loop is not loop:
+        _semaphore = asyncio.Semaphore(GROQ_MAX_CONCURRENCY)
+        _semaphore_loop = loop
+    return _semaphore
+
+
+def _record(call_site: str, **deltas: float) -> None:
+    s = _stats.setdefault(call_site, {
+        "calls": 0, "errors": 0, "retries": 0, "throttle_wait_s": 0.0,
+        "cache_hits": 0, "cache_misses": 0,
+        "latency_s_total": 0.0, "latency_s_max": 0.0,
+        "prompt_tokens": 0, "completion_tokens": 0,
+    })
+    for key, value in deltas.items():
+        if key == "latency_s_max":
+            s[key] = max(s[key], value)
+        else:
+            s[key] += value
+
+
+def llm_stats() -> dict[str, dict[str, float]]:
+    """Snapshot of per-call-site counters (calls, errors, retries, cache, latency, tokens)."""
+    out = {}
+    for site, s in _stats.items():
+        calls = s["calls"] or 1
+        out[site] = {
+            **s,
+            "latency_ms_avg": round(s["latency_s_total"] / calls * 1000, 1),
+            "latency_ms_max": round(s["latency_s_max"] * 1000, 1),
+        }
+    return out
+
+
+def _estimate_tokens(messages: list[dict], max_tokens: int) -> int:
+    """Rough TPM reservation: ~4 chars per prompt token plus the full completion budget."""
+    chars = sum(len(str(m.get("content", ""))) for m in messages)
+    return chars // 4 + max_tokens
+
+
+def _backoff_delay(attempt: int, retry_after: str | None = None) -> float:
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return random.uniform(0, GROQ_BACKOFF_BASE * (2 ** attempt))
+
+
+def _headers(api_key: str | None) -> dict:
+    key = api_key if api_key is not None else os.getenv("GROQ_API", "")
+    return {"Authorization": f"Bearer {key}", "Content-Type": "application/json"}
+
+
+async def _throttle(call_site: str, reserved: int) -> None:
+    """Take one request and `reserved` tokens from the rate-limit buckets."""
+    waited = await _rpm_bucket.acquire(1)
+    waited += await _tpm_bucket.acquire(reserved)
+    if waited:
+        _record(call_site, throttle_wait_s=waited)
+
+
+def _record_success(call_site: str, start: float, reserved: int, usage: dict, attempts: int) -> None:
+    latency = time.perf_counter() - start
+    prompt_tokens = int(usage.get("prompt_tokens") or 0)
+    completion_tokens = int(usage.get("completion_tokens") or 0)
+    if prompt_tokens or completion_tokens:
+        _tpm_bucket.refund(max(reserved - prompt_tokens - completion_tokens, 0))
+    _record(
+        call_site, calls=1, latency_s_total=latency, latency_s_max=latency,
+        prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+    )
+    observe("groq", call_site, latency)
+    logger.debug(
+        f"[Groq/{call_site}] ✓ {latency * 1000:.0f}ms "
+        f"tokens={prompt_tokens}+{completion_tokens} attempts={attempts}"
+    )
+
+
+def _record_failure(call_site: str, start: float) -> None:
+    latency = time.perf_counter() - start
+    _record(call_site, calls=1, errors=1, latency_s_total=latency, latency_s_max=latency)
+    observe("groq", call_site, latency, error=True)
+
+
+async def _post_completion(
+    messages: list[dict],
+    max_tokens: int,
+    temperature: float,
+    call_site: str,
+    model: str,
+    api_key: str | None,
+) -> str:
+    """
+    POST a chat completion to Groq and return the assistant message content.
+    Rate-limited, concurrency-limited and retried. Raises LLMError on failure.
+    """
+    headers = _headers(api_key)
+    body = {
+        "model": model,
+        "messages": messages,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+    }
+    reserved = _estimate_tokens(messages, max_tokens)
+    start = time.perf_counter()
+    last_error: Exception | None = None
+
+    for attempt in range(GROQ_MAX_RETRIES + 1):
+        await _throttle(call_site, reserved)
+        retry_after = None
+        result = None
+        try:
+            async with _limiter():
+                async with http_session() as session:
+                    async with session.post(
+                        GROQ_URL,
+                        headers=headers,
+                        json=body,
+                        timeout=aiohttp.ClientTimeout(total=GROQ_TIMEOUT),
+                    ) as r:
+                        if r.status in _RETRY_STATUS:
+                            retry_after = r.headers.get("retry-after")
+                            raise LLMError(f"HTTP {r.status}")
+                        result = await r.json()
+            content = result["choices"][0]["message"]["content"]
+        except (LLMError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+            last_error = e
+            if attempt < GROQ_MAX_RETRIES:
+                delay = _backoff_delay(attempt, retry_after)
+                logger.warning(f"[Groq/{call_site}] retry {attempt + 1}/{GROQ_MAX_RETRIES} in {delay:.2f}s: {e}")
+                _record(call_site, retries=1)
+                await asyncio.sleep(delay)
+                continue
+            break
+        except Exception as e:
+            # Malformed body / unexpected error — not worth retrying
+            err = result.get("error") if isinstance(result, dict) else None
+            last_error = LLMError(f"{err or e}")
+            break
+        else:
+            _record_success(call_site, start, reserved, result.get("usage") or {}, attempt + 1)
+            return content
+
+    _record_failure(call_site, start)
+    raise LLMError(f"[Groq/{call_site}] failed: {last_error}")
+
+
+class _RetryableStatus(LLMError):
+    def __init__(self, status: int, retry_after: str | None):
+        super().__init__(f"HTTP {status}")
+        self.retry_after = retry_after
+
+
+_END = object()
+
+
+async def _pump_stream(headers: dict, body: dict, queue: asyncio.Queue) -> dict:
+    """
+    Read one Groq SSE response into `queue` and return its usage. Holds a
+    limiter slot only while Groq is sending, so a slow consumer of the queue
+    never occupies one. Always ends the queue with _END.
+    """
+    usage: dict = {}
+    try:
+        async with _limiter():
+            async with http_session() as session:
+                async with session.post(
+                    GROQ_URL,
+                    headers=headers,
+                    json=body,
+                    timeout=aiohttp.ClientTimeout(total=GROQ_TIMEOUT),
+                ) as r:
+                    if r.status in _RETRY_STATUS:
+                        raise _RetryableStatus(r.status, r.headers.get("retry-after"))
+                    if r.status != 200:
+                        raise ValueError(f"HTTP {r.status}: {(await r.text())[:200]}")
+                    # SSE body: one `data: {chunk}` line per delta, then `data: [DONE]`
+                    async for raw in r.content:
+                        line = raw.decode("utf-8", "ignore").strip()
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == "[DONE]":
+                            break
+                        chunk = json.loads(data)
+                        usage = (chunk.get("x_groq") or {}).get("usage") or chunk.get("usage") or usage
+                        choices = chunk.get("choices") or []
+                        delta = (choices[0].get("delta") or {}).get("content") if choices else None
+                        if delta:
+                            queue.put_nowait(delta)
+    finally:
+        queue.put_nowait(_END)
+    return usage
+
+
+async def stream(
+    messages: list[dict],
+    *,
+    max_tokens: int = 500,
+    temperature: float = 0.1,
+    call_site: str = "groq",
+    model: str = DEFAULT_MODEL,
+    api_key: str | None = None,
+) -> AsyncIterator[str]:
+    """
+    Yield assistant text deltas from Groq's stream=true API as they arrive.
+    Same limiter, buckets and retry policy as complete(), but retries only
+    happen before the first chunk — once text has been yielded, a failure
+    raises LLMError and the caller keeps what it already has. Never cached.
+
+    The response is read by a background task (_pump_stream) that releases its
+    limiter slot as soon as Groq finishes, however slowly the caller consumes.
+    """
+    headers = _headers(api_key)
+    body = {
+        "model": model,
+        "messages": messages,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "stream": True,
+    }
+    reserved = _estimate_tokens(messages, max_tokens)
+    start = time.perf_counter()
+    last_error: Exception | None = None
+    yielded = False
+
+    for attempt in range(GROQ_MAX_RETRIES + 1):
+        await _throttle(call_site, reserved)
+        retry_after = None
+        queue: asyncio.Queue = asyncio.Queue()
+        pump = asyncio.create_task(_pump_stream(headers, body, queue))
+        try:
+            while (delta := await queue.get()) is not _END:
+                yielded = True
+                yield delta
+            usage = await pump
+        except (LLMError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+            last_error = e
+            retry_after = getattr(e, "retry_after", None)
+            if not yielded and attempt < GROQ_MAX_RETRIES:
+                delay = _backoff_delay(attempt, retry_after)
+                logger.warning(f"[Groq/{call_site}] retry {attempt + 1}/{GROQ_MAX_RETRIES} in {delay:.2f}s: {e}")
+                _record(call_site, retries=1)
+                await asyncio.sleep(delay)
+                continue
+            break
+        except Exception as e:
+            last_error = e
+            break
+        else:
+            _record_success(call_site, start, reserved, usage, attempt + 1)
+            return
+        finally:
+            # The caller stopped early (or we are retrying): stop reading Groq
+            if not pump.done():
+                pump.cancel()
+
+    _record_failure(call_site, start)
+    raise LLMError(f"[Groq/{call_site}] stream failed: {last_error}")
+
+
+async def _complete(
+    messages: list[dict],
+    max_tokens: int,
+    temperature: float,
+    call_site: str,
+    model: str,
+    api_key: str | None,
+    parse: Callable[[str], Any] | None,
+) -> Any:
+    """Cache lookup → Groq → parse → cache store. Only replies that parse are cached."""
+    ttl = ttl_for(call_site)
+    key = cache_key(model, messages, max_tokens, temperature) if ttl else None
+
+    if key:
+        cached = await get_cached_completion(key)
+        if cached is not None:
+            try:
+                result = parse(cached) if parse else cached
+            except ValueError:
+                pass
+            else:
+                _record(call_site, cache_hits=1)
+                logger.debug(f"[Groq/{call_site}] cache hit {key[:16]}")
+                return result
+        _record(call_site, cache_misses=1)
+
+    content = await _post_completion(messages, max_tokens, temperature, call_site, model, api_key)
+    result = parse(content) if parse else content
+    if key:
+        await set_cached_completion(key, content, ttl)
+    return result
+
+
+async def complete(
+    messages: list[dict],
+    *,
+    max_tokens: int = 500,
+    temperature: float = 0.1,
+    call_site: str = "groq",
+    model: str = DEFAULT_MODEL,
+    api_key: str | None = None,
+) -> str:
+    """Return the assistant text for messages. Raises LLMError on failure."""
+    return await _complete(messages, max_tokens, temperature, call_site, model, api_key, parse=None)
+
+
+_FENCE_RE = re.compile(r"```(?:json|JSON)?\s*(.*?)```", re.DOTALL)
+
+
+def extract_json(text: str, expect: type | None = None) -> Any:
+    """
+    Parse JSON out of an LLM reply. Handles bare JSON, ```json fences, and JSON
+    embedded in prose. `expect` (dict or list) restricts the accepted top-level type.
+    Raises ValueError when nothing parseable is found.
+    """
+    text = (text or "").strip()
+
+    candidates = [m.group(1).strip() for m in _FENCE_RE.finditer(text)]
+    if text.startswith("```") and not candidates:
+        # Unterminated fence — drop the opening marker
+        candidates.append(re.sub(r"^```(?:json|JSON)?", "", text).strip())
+    candidates.append(text)
+
+    for candidate in candidates:
+        try:
+            parsed = json.loads(candidate)
+        except ValueError:
+            continue
+        if expect is None or isinstance(parsed, expect):
+            return parsed
+
+    openers = {dict: "{", list: "["}.get(expect, "{[")
+    decoder = json.JSONDecoder()
+    for candidate in candidates:
+        for i, ch in enumerate(candidate):
+            if ch not in openers:
+                continue
+            try:
+                parsed, _ = decoder.raw_decode(candidate, i)
+            except ValueError:
+                continue
+            if expect is None or isinstance(parsed, expect):
+                return parsed
+
+    raise ValueError(f"Could not parse JSON from response: {text[:200]}")
+
+
+async def complete_json(
+    messages: list[dict],
+    *,
+    expect: type | None = None,
+    max_tokens: int = 500,
+    temperature: float = 0.1,
+    call_site: str = "groq",
+    model: str = DEFAULT_MODEL,
+    api_key: str | None = None,
+) -> Any:
+    """complete() + extract_json(). Raises LLMError or ValueError."""
+    return await _complete(
+        messages, max_tokens, temperature, call_site, model, api_key,
+        parse=lambda text: extract_json(text, expect=expect),
+    )
@@ -1,9 +1,13 @@
 """
 Ranker - Deterministic ranking algorithm for places based on scores and user intent.
 """
+import heapq
 import logging
+import os
 from typing import Optional
 
+import numpy as np
+
 from app.models import (
     Place, PlaceAreaMapping, TravelIntent, RankedPlace, RankExplanation,
     ScoreResult, AreaScores, Vibe, CrowdPreference
@@ -28,6 +32,12 @@ INTENT_WEIGHTS = {
     Vibe.PARTY: {'quality': 0.30, 'crowd_fit': 0.10, 'authenticity': 0.20, 'intent_match': 0.40},
 }
 
+# Callers downstream (responder, place cards, frontend) show at most this many
+RANKED_PLACES_SHOWN = 6
+
+# rank_places switches to the NumPy batch path at this many candidates
+BATCH_RANK_MIN_PLACES = int(os.getenv("BATCH_RANK_MIN_PLACES", "16"))
+
 # Crowd preference mappings
 CROWD_PREF_VALUES = {
     CrowdPreference.LOW: 0.2,
@@ -44,78 +54,231 @@ class Ranker:
         self,
         places: list[PlaceAreaMapping],
         intent: TravelIntent,
-        area_scores: Optional[AreaScores] = None
+        area_scores: Optional[AreaScores] = None,
+        top_k: Optional[int] = None
+    ) -> list[RankedPlace]:
+        """Rank places and return them best first.
+
+        top_k keeps only the best k — the same places, in the same order, as
+        the first k of the full ranking. Places are scored first and
+        RankedPlace / RankExplanation objects are built for the returned ones
+        only, so a small top_k over a large candidate set skips most of the work.
+
+        Large candidate sets take the NumPy batch path; small ones stay on the
+        per-place loop, where array setup would cost more than it saves. Both
+        produce identical output.
+        """
+        if len(places) >= BATCH_RANK_MIN_PLACES:
+            return self._rank_places_batch(places, intent, area_scores, top_k)
+        return self._rank_places_scalar(places, intent, area_scores, top_k)
+
+    def _rank_places_scalar(
+        self,
+        places: list[PlaceAreaMapping],
+        intent: TravelIntent,
+        area_scores: Optional[AreaScores],
+        top_k: Optional[int] = None
     ) -> list[RankedPlace]:
-        """Rank all places and return sorted list."""
+        """Per-place scoring loop; heap selection when top_k is set."""
         weights = self._get_weights(intent)
-        ranked = []
+        crowd_fit = self._compute_crowd_fit(
+            area_scores.crowd_score if area_scores else None,
+            intent
+        )
+        authenticity = self._compute_authenticity_fit(
+            area_scores.authenticity_score if area_scores else None,
+            intent
+        )
         
-        for mapping in places:
-            place = mapping.place
-            
-            # Calculate component scores
-            quality = self._compute_quality(place)
-            crowd_fit = self._compute_crowd_fit(
-                area_scores.crowd_score if area_scores else None,
-                intent
-            )
-            authenticity = self._compute_authenticity_fit(
-                area_scores.authenticity_score if area_scores else None,
-                intent
-            )
-            intent_match = self._compute_intent_match(place, intent)
-            
-            # Calculate contributions
-            quality_contrib = quality * weights['quality']
-            crowd_contrib = crowd_fit * weights['crowd_fit']
-            auth_contrib = authenticity * weights['authenticity']
-            intent_contrib = intent_match * weights['intent_match']
-            
-            # Final rank score
-            rank_score = quality_contrib + crowd_contrib + auth_contrib + intent_contrib
-            
-            # Determine top and weakest factors
-            contributions = {
-                'quality': quality_contrib,
-                'crowd_fit': crowd_contrib,
-                'authenticity': auth_contrib,
-                'intent_match': intent_contrib
-            }
-            top_factor = max(contributions, key=contributions.get)
-            weakest_factor = min(contributions, key=contributions.get)
-            
-            # Build explanation
-            explanation = RankExplanation(
-                quality={'value': round(quality, 3), 'weight': weights['quality'], 'contribution': round(quality_contrib, 3)},
-                crowd_fit={'value': round(crowd_fit, 3), 'weight': weights['crowd_fit'], 'contribution': round(crowd_contrib, 3)},
-                authenticity={'value': round(authenticity, 3), 'weight': weights['authenticity'], 'contribution': round(auth_contrib, 3)},
-                intent_match={'value': round(intent_match, 3), 'weight': weights['intent_match'], 'contribution': round(intent_contrib, 3)},
-                top_factor=top_factor,
-                weakest_factor=weakest_factor
-            )
-            
-            # Calculate confidence
-            confidence = self._compute_confidence(
-                place, area_scores, intent_match
-            )
-            
-            ranked.append(RankedPlace(
-                place=place,
-                rank_score=round(rank_score, 3),
-                rank_position=0,  # Will be set after sorting
-                area=mapping.primary_area,
-                explanation=explanation,
-                confidence=round(confidence, 3)
-            ))
-        
-        # Sort by rank score descending
-        ranked.sort(key=lambda x: x.rank_score, reverse=True)
-        
-        # Assign positions
-        for i, rp in enumerate(ranked):
-            rp.rank_position = i + 1
+        # Calculate component scores
+        quality = [self._compute_quality(m.place) for m in places]
+        intent_match = [self._compute_intent_match(m.place, intent) for m in places]
+        scores = [
+            round(self._weighted_score(weights, q, crowd_fit, authenticity, i), 3)
+            for q, i in zip(quality, intent_match)
+        ]
         
+        # Rank score descending, input order on ties (a stable sort)
+        def sort_key(i: int) -> tuple[float, int]:
+            return -scores[i], i
+
+        if top_k is None:
+            order = sorted(range(len(places)), key=sort_key)
+        else:
+            order = heapq.nsmallest(top_k, range(len(places)), key=sort_key)
+        
+        return self._build_ranked(
+            places, order, weights, area_scores, quality, crowd_fit, authenticity, intent_match
+        )
+
+    def _rank_places_batch(
+        self,
+        places: list[PlaceAreaMapping],
+        intent: TravelIntent,
+        area_scores: Optional[AreaScores],
+        top_k: Optional[int] = None
+    ) -> list[RankedPlace]:
+        """
+        Score every candidate at once as NumPy arrays, select and order the
+        winners, then build objects for those only. Arithmetic runs in the same
+        order as the scalar path, so scores match bit for bit.
+        """
+        weights = self._get_weights(intent)
+        place_objs = [m.place for m in places]
+
+        quality = self._quality_vector(place_objs)
+        crowd_fit = self._compute_crowd_fit(
+            area_scores.crowd_score if area_scores else None,
+            intent
+        )
+        authenticity = self._compute_authenticity_fit(
+            area_scores.authenticity_score if area_scores else None,
+            intent
+        )
+        intent_match = self._intent_match_vector(place_objs, intent)
+
+        rank_score = self._weighted_score(weights, quality, crowd_fit, authenticity, intent_match)
+        # Python's round() (not np.round) so ties and the sort key match the scalar path
+        neg_scores = -np.array([round(score, 3) for score in rank_score.tolist()])
+
+        if top_k is None or top_k >= len(places):
+            order = np.argsort(neg_scores, kind="stable")
+        elif top_k <= 0:
+            order = np.empty(0, dtype=np.intp)
+        else:
+            # argpartition is not stable: take everything tied with the k-th
+            # score, then stable-sort that short list so ties keep input order
+            kth = np.partition(neg_scores, top_k - 1)[top_k - 1]
+            candidates = np.flatnonzero(neg_scores <= kth)
+            order = candidates[np.argsort(neg_scores[candidates], kind="stable")][:top_k]
+
+        return self._build_ranked(
+            places, order.tolist(), weights, area_scores,
+            quality.tolist(), crowd_fit, authenticity, intent_match.tolist(),
+        )
+
+    @staticmethod
+    def _weighted_score(weights: dict[str, float], quality, crowd_fit, authenticity, intent_match):
+        """Final rank score; takes floats or NumPy arrays."""
+        return (
+            quality * weights['quality']
+            + crowd_fit * weights['crowd_fit']
+            + authenticity * weights['authenticity']
+            + intent_match * weights['intent_match']
+        )
+
+    def _build_ranked(
+        self,
+        places: list[PlaceAreaMapping],
+        order: list[int],
+        weights: dict[str, float],
+        area_scores: Optional[AreaScores],
+        quality: list[float],
+        crowd_fit: float,
+        authenticity: float,
+        intent_match: list[float]
+    ) -> list[RankedPlace]:
+        """RankedPlace objects for places[order], with positions assigned."""
+        ranked = []
+        for position, i in enumerate(order, start=1):
+            rp = self._build_ranked_place(
+                places[i], weights, area_scores, quality[i], crowd_fit, authenticity, intent_match[i]
+            )
+            rp.rank_position = position
+            ranked.append(rp)
         return ranked
+
+    def _build_ranked_place(
+        self,
+        mapping: PlaceAreaMapping,
+        weights: dict[str, float],
+        area_scores: Optional[AreaScores],
+        quality: float,
+        crowd_fit: float,
+        authenticity: float,
+        intent_match: float
+    ) -> RankedPlace:
+        """Weighted score, explanation and confidence for one place's component scores."""
+        place = mapping.place
+
+        # Calculate contributions
+        quality_contrib = quality * weights['quality']
+        crowd_contrib = crowd_fit * weights['crowd_fit']
+        auth_contrib = authenticity * weights['authenticity']
+        intent_contrib = intent_match * weights['intent_match']
+        
+        # Final rank score
+        rank_score = self._weighted_score(weights, quality, crowd_fit, authenticity, intent_match)
+        
+        # Determine top and weakest factors
+        contributions = {
+            'quality': quality_contrib,
+            'crowd_fit': crowd_contrib,
+            'authenticity': auth_contrib,
+            'intent_match': intent_contrib
+        }
+        top_factor = max(contributions, key=contributions.get)
+        weakest_factor = min(contributions, key=contributions.get)
+        
+        # Build explanation
+        explanation = RankExplanation(
+            quality={'value': round(quality, 3), 'weight': weights['quality'], 'contribution': round(quality_contrib, 3)},
+            crowd_fit={'value': round(crowd_fit, 3), 'weight': weights['crowd_fit'], 'contribution': round(crowd_contrib, 3)},
+            authenticity={'value': round(authenticity, 3), 'weight': weights['authenticity'], 'contribution': round(auth_contrib, 3)},
+            intent_match={'value': round(intent_match, 3), 'weight': weights['intent_match'], 'contribution': round(intent_contrib, 3)},
+            top_factor=top_factor,
+            weakest_factor=weakest_factor
+        )
+        
+        # Calculate confidence
+        confidence = self._compute_confidence(
+            place, area_scores, intent_match
+        )
+        
+        return RankedPlace(
+            place=place,
+            rank_score=round(rank_score, 3),
+            rank_position=0,  # Will be set after sorting
+            area=mapping.primary_area,
+            explanation=explanation,
+            confidence=round(confidence, 3)
+        )
+
+    def _quality_vector(self, places: list[Place]) -> np.ndarray:
+        """_compute_quality over every place at once."""
+        ratings = np.array([np.nan if p.rating is None else p.rating for p in places], dtype=float)
+        reviews = np.array([p.review_count for p in places], dtype=float)
+        normalized_rating = (ratings - 1) / 4
+        review_confidence = np.minimum(reviews / 100, 1.0)
+        return np.where(np.isnan(ratings), 0.5, normalized_rating * 0.6 + review_confidence * 0.4)
+
+    def _intent_match_vector(self, places: list[Place], intent: TravelIntent) -> np.ndarray:
+        """
+        _compute_intent_match over every place at once. Tags are tokenized into
+        one vocabulary; an interests × vocabulary substring matrix is built once,
+        so each interest/tag pair is tested once instead of once per place.
+        """
+        if not intent.interests:
+            return np.full(len(places), 0.5)
+
+        vocab: dict[str, int] = {}
+        rows: list[int] = []
+        cols: list[int] = []
+        for row, place in enumerate(places):
+            for tag in place.tags:
+                rows.append(row)
+                cols.append(vocab.setdefault(tag.lower(), len(vocab)))
+
+        interest_matches_tag = np.array(
+            [[interest.lower() in tag for tag in vocab] for interest in intent.interests],
+            dtype=np.int32,
+        ).reshape(len(intent.interests), len(vocab))
+        place_has_tag = np.zeros((len(places), len(vocab)), dtype=np.int32)
+        place_has_tag[rows, cols] = 1
+
+        matched = ((place_has_tag @ interest_matches_tag.T) > 0).sum(axis=1)
+        has_tags = np.bincount(np.array(rows, dtype=np.intp), minlength=len(places)) > 0
+        return np.where(has_tags, matched / len(intent.interests), 0.3)
     
     def _get_weights(self, intent: TravelIntent) -> dict[str, float]:
         """Get weights adjusted by user intent."""
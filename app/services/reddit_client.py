@@ -0,0 +1,152 @@
+"""
+app/services/reddit_client.py — Shared asyncpraw client for every Reddit call.
+
+init_reddit_client: called from the FastAPI lifespan on startup
+close_reddit_client: called from the FastAPI lifespan on shutdown
+reddit_client: async context manager yielding the shared client
+reddit_slot: process-wide limit of REDDIT_MAX_CONCURRENCY in-flight Reddit requests
+rate_limit_low: Reddit's remaining quota has dropped under REDDIT_RATELIMIT_RESERVE
+reddit_client_stats: slot occupancy and rate-limit state for /health
+
+One client means one asyncprawcore session: a single OAuth token and a single
+RateLimiter fed by Reddit's x-ratelimit-* response headers, which sleeps
+before a request when the window is nearly spent. Per-call clients each
+started with an empty view of the quota.
+
+Outside the server (scripts, tests) there is no lifespan, so reddit_client
+falls back to a short-lived client that is closed when the block exits.
+"""
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import asyncpraw
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CLIENT_ID = os.getenv("REDDIT_CLIENT_ID", "")
+CLIENT_SECRET = os.getenv("REDDIT_CLIENT_SECRET", "")
+USER_AGENT = "platform:roam_mate:v2.0 (by u/Admirable-Star-1447)"
+REDDIT_MAX_CONCURRENCY = int(os.getenv("REDDIT_MAX_CONCURRENCY", "6"))
+# Below this many requests left in the window, searches skip comment loads
+REDDIT_RATELIMIT_RESERVE = int(os.getenv("REDDIT_RATELIMIT_RESERVE", "20"))
+
+_reddit: asyncpraw.Reddit | None = None
+_semaphore: asyncio.Semaphore | None = None
+_semaphore_loop: asyncio.AbstractEventLoop | None = None
+_stats = {"requests": 0, "in_flight": 0, "waiting": 0, "low_quota_skips": 0}
+
+
+def _new_client() -> asyncpraw.Reddit:
+    reddit = asyncpraw.Reddit(
+        client_id=CLIENT_ID,
+        client_secret=CLIENT_SECRET,
+        user_agent=USER_AGENT,
+    )
+    reddit.read_only = True
+    return reddit
+
+
+async def init_reddit_client() -> asyncpraw.Reddit | None:
+    """Create the shared client. Idempotent; skipped when credentials are missing."""
+    global _reddit
+    if _reddit is None:
+        if not CLIENT_SECRET:
+            logger.warning("[reddit_client] REDDIT_CLIENT_SECRET not set — no shared client")
+            return None
+        _reddit = _new_client()
+        logger.info(f"[reddit_client] ready: max_concurrency={REDDIT_MAX_CONCURRENCY}")
+    return _reddit
+
+
+async def close_reddit_client() -> None:
+    """Close the shared client. Safe to call when never opened."""
+    global _reddit
+    if _reddit is None:
+        return
+    try:
+        await _reddit.close()
+    except Exception as e:
+        logger.warning(f"[reddit_client] close error: {e}")
+    finally:
+        _reddit = None
+    logger.info("[reddit_client] closed")
+
+
+@asynccontextmanager
+async def reddit_client() -> AsyncIterator[asyncpraw.Reddit]:
+    """Yield the shared client, or a throwaway one when the lifespan hasn't opened it.
+
+    Callers must not close the yielded client themselves.
+    """
+    if _reddit is not None:
+        yield _reddit
+        return
+    reddit = _new_client()
+    try:
+        yield reddit
+    finally:
+        await reddit.close()
+
+
+def _limiter() -> asyncio.Semaphore:
+    """The request-slot semaphore for the running loop (a new loop gets a fresh one)."""
+    global _semaphore, _semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _semaphore is None or _semaphore_loop is not loop:
+        _semaphore = asyncio.Semaphore(REDDIT_MAX_CONCURRENCY)
+        _semaphore_loop = loop
+    return _semaphore
+
+
+@asynccontextmanager
+async def reddit_slot() -> AsyncIterator[None]:
+    """Hold one of the REDDIT_MAX_CONCURRENCY request slots shared by the whole process."""
+    semaphore = _limiter()
+    _stats["waiting"] += 1
+    try:
+        await semaphore.acquire()
+    finally:
+        _stats["waiting"] -= 1
+    _stats["in_flight"] += 1
+    _stats["requests"] += 1
+    try:
+        yield
+    finally:
+        _stats["in_flight"] -= 1
+        semaphore.release()
+
+
+def _limits(reddit) -> tuple[int | None, int | None]:
+    """(remaining, used) from asyncprawcore's header-fed rate limiter; None until the first response."""
+    try:
+        limits = reddit.auth.limits
+        remaining, used = limits["remaining"], limits["used"]
+    except Exception:
+        return None, None
+    return (
+        remaining if isinstance(remaining, (int, float)) else None,
+        used if isinstance(used, (int, float)) else None,
+    )
+
+
+def rate_limit_low(reddit) -> bool:
+    remaining, _ = _limits(reddit)
+    if remaining is not None and remaining < REDDIT_RATELIMIT_RESERVE:
+        _stats["low_quota_skips"] += 1
+        return True
+    return False
+
+
+def reddit_client_stats() -> dict:
+    remaining, used = _limits(_reddit) if _reddit is not None else (None, None)
+    return {
+        **_stats,
+        "shared": _reddit is not None,
+        "max_concurrency": REDDIT_MAX_CONCURRENCY,
+        "ratelimit_remaining": remaining,
+        "ratelimit_used": used,
+    }
@@ -2,24 +2,29 @@
 reddit_signals.py — Direct asyncpraw Reddit access (no MCP hop).
 Builds structured place signals: {place_name: {sentiment_score, crowd_signal, vibe_tags, mention_count, review_highlights}}
 Groq extracts structured signals per place from raw Reddit posts.
+
+Destination signals are kept in reddit_store across turns and users: a fresh
+entry is served as is, a stale one is served immediately while a background
+crawl loads only submissions newer than the last crawl and merges them in.
+
+All calls share the lifespan-owned client from reddit_client and its
+process-wide request slots.
 """
 import asyncio
-import json
-import os
-import aiohttp
-import asyncpraw
+import time
 from typing import Dict, Any, List, Optional
 
+from app.services.job_scheduler import PRIORITY_LOW, schedule
+from app.services.llm_gateway import complete_json
+from app.services.reddit_client import CLIENT_SECRET, rate_limit_low, reddit_client, reddit_slot
+from app.services.reddit_store import get_stored, is_fresh, merge_entry, public_view, put_stored, store_key
+from app.services.single_flight import coalesce
+from app.services.tracing import traced
 from app.utils.logger import get_logger
 from app.models import TravelIntent
 
 logger = get_logger(__name__)
 
-CLIENT_ID = os.getenv("REDDIT_CLIENT_ID", "")
-CLIENT_SECRET = os.getenv("REDDIT_CLIENT_SECRET", "")
-USER_AGENT = "platform:roam_mate:v2.0 (by u/Admirable-Star-1447)"
-GROQ_API_KEY = os.getenv("GROQ_API", "")
-GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
 MODEL = "meta-llama/llama-4-scout-17b-16e-instruct"
 
 
@@ -52,40 +57,84 @@ def build_reddit_queries(intent: TravelIntent) -> List[str]:
     return unique_queries[:4]
 
 
+@traced("reddit", "search")
 async def _search_reddit(
     reddit,
     query: str,
     limit: int = 12,
     comment_limit: int = 4,
     comment_body_chars: int = 200,
+    since: float = 0.0,
+    seen: Optional[set] = None,
 ) -> List[str]:
-    """Search r/all and return formatted post strings."""
-    posts = []
-    semaphore = asyncio.Semaphore(3)
-    async with semaphore:
-        try:
+    """
+    Search r/all and return formatted post strings.
+    With since, the search is sorted by new and stops at the first submission
+    created at or before that epoch time. seen skips
+    submission IDs already in it and records the ones loaded, so searches
+    sharing a set never load the same post twice.
+
+    The listing and each submission.load() hold a reddit_slot; the loads run
+    concurrently. When Reddit's remaining quota is low, comments are skipped
+    and posts are built from the listing alone.
+    """
+    submissions = []
+    try:
+        async with reddit_slot():
             subreddit = await reddit.subreddit("all")
-            async for submission in subreddit.search(query, sort="relevance", limit=limit, time_filter="year"):
-                try:
-                    await asyncio.wait_for(submission.load(), timeout=10)
-                    await submission.comments.replace_more(limit=0)
-                    top_comments = [
-                        c.body[:comment_body_chars] for c in submission.comments.list()[:comment_limit]
-                        if hasattr(c, "body")
-                    ]
-                    posts.append(
-                        f"TITLE: {submission.title}\n"
-                        f"TEXT: {getattr(submission, 'selftext', '')[:400]}\n"
-                        f"COMMENTS: {' | '.join(top_comments)}"
-                    )
-                except Exception:
-                    pass
-        except Exception as e:
-            logger.warning(f"[Reddit] ✗ '{query}': {e}")
+            # An incremental refresh lists newest first and stops at the last crawl
+            listing = (
+                subreddit.search(query, sort="new", limit=limit, time_filter="all") if since
+                else subreddit.search(query, sort="relevance", limit=limit, time_filter="year")
+            )
+            async for submission in listing:
+                if since and getattr(submission, "created_utc", 0) <= since:
+                    break
+                if seen is not None:
+                    if submission.id in seen:
+                        continue
+                    seen.add(submission.id)
+                submissions.append(submission)
+    except Exception as e:
+        logger.warning(f"[Reddit] ✗ '{query}': {e}")
+
+    load_comments = not rate_limit_low(reddit)
+    if not load_comments:
+        logger.warning(f"[Reddit] rate limit low — '{query}' without comments")
+    formatted = await asyncio.gather(*(
+        _format_submission(s, comment_limit, comment_body_chars, load_comments) for s in submissions
+    ))
+    posts = [p for p in formatted if p]
     logger.info(f"[Reddit] ✓ '{query}' → {len(posts)} posts")
     return posts
 
 
+async def _format_submission(
+    submission,
+    comment_limit: int,
+    comment_body_chars: int,
+    load_comments: bool = True,
+) -> Optional[str]:
+    """TITLE / TEXT / COMMENTS block for one submission, or None if loading it failed."""
+    try:
+        top_comments = []
+        if load_comments:
+            async with reddit_slot():
+                await asyncio.wait_for(submission.load(), timeout=10)
+            await submission.comments.replace_more(limit=0)
+            top_comments = [
+                c.body[:comment_body_chars] for c in submission.comments.list()[:comment_limit]
+                if hasattr(c, "body")
+            ]
+        return (
+            f"TITLE: {submission.title}\n"
+            f"TEXT: {getattr(submission, 'selftext', '')[:400]}\n"
+            f"COMMENTS: {' | '.join(top_comments)}"
+        )
+    except Exception:
+        return None
+
+
 async def _extract_place_signals(raw_posts: str, destination: str) -> Dict[str, Any]:
     """Use Groq to extract structured place signals from raw Reddit text."""
     system = (
@@ -96,30 +145,24 @@ async def _extract_place_signals(raw_posts: str, destination: str) -> Dict[str,
     )
     user_msg = f"Destination: {destination}\n\nReddit posts:\n{raw_posts[:4000]}"
 
-    headers = {"Authorization": f"Bearer {GROQ_API_KEY}", "Content-Type": "application/json"}
-    body = {
-        "model": MODEL,
-        "messages": [
-            {"role": "system", "content": system},
-            {"role": "user", "content": user_msg},
-        ],
-        "max_tokens": 1000,
-        "temperature": 0.1,
-    }
+    messages = [
+        {"role": "system", "content": system},
+        {"role": "user", "content": user_msg},
+    ]
 
     logger.info(f"[Groq/reddit-extract] → extracting place signals for '{destination}'")
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(GROQ_URL, headers=headers, json=body) as r:
-                result = await r.json()
-                content = result["choices"][0]["message"]["content"]
-                import re
-                match = re.search(r"\{[\s\S]*\}", content)
-                if match:
-                    parsed = json.loads(match.group())
-                    n = len(parsed.get("place_signals", {}))
-                    logger.info(f"[Groq/reddit-extract] ✓ extracted signals for {n} places")
-                    return parsed
+        parsed = await complete_json(
+            messages,
+            expect=dict,
+            max_tokens=1000,
+            temperature=0.1,
+            call_site="reddit_extract",
+            model=MODEL,
+        )
+        n = len(parsed.get("place_signals", {}))
+        logger.info(f"[Groq/reddit-extract] ✓ extracted signals for {n} places")
+        return parsed
     except Exception as e:
         logger.error(f"[Groq/reddit-extract] ✗ {e}")
 
@@ -136,27 +179,52 @@ async def get_reddit_place_signals(
       "place_signals": { "Place Name": { sentiment_score, crowd_signal, vibe_tags, mention_count, review_highlights } },
       "raw_posts_text": str  # for ScoringEngine crowd/auth analysis
     }
+    Served from reddit_store when the destination has been crawled before;
+    a stale entry is returned as is and refreshed in the background.
     """
     destination = intent.destination.city or intent.destination.region or intent.destination.area or "Unknown"
+
+    stored = await get_stored(destination)
+    if stored is not None:
+        if not is_fresh(stored):
+            _schedule_refresh(intent, destination, post_limit, stored)
+        return public_view(stored)
+
+    entry = await coalesce(
+        store_key(destination), lambda: _crawl_destination(intent, destination, post_limit, None)
+    )
+    return public_view(entry) if entry else {"place_signals": {}, "raw_posts_text": ""}
+
+
+async def _crawl_destination(
+    intent: TravelIntent,
+    destination: str,
+    post_limit: int,
+    stored: Optional[Dict[str, Any]],
+) -> Optional[Dict[str, Any]]:
+    """
+    Search Reddit, extract signals from the posts not already in stored, and
+    write the merged entry back. Returns the entry, or None when a first
+    crawl found nothing worth keeping.
+    """
     queries = build_reddit_queries(intent)
 
     if not CLIENT_SECRET:
         logger.warning("[Reddit] ✗ REDDIT_CLIENT_SECRET not set — skipping")
-        return {"place_signals": {}, "raw_posts_text": ""}
+        return None
 
-    logger.info(f"[Reddit] → searching {len(queries)} queries for '{destination}'")
-    reddit = asyncpraw.Reddit(
-        client_id=CLIENT_ID,
-        client_secret=CLIENT_SECRET,
-        user_agent=USER_AGENT,
-    )
-    reddit.read_only = True
+    known_ids = set(stored.get("post_ids", [])) if stored else set()
+    since = float(stored.get("crawled_at", 0)) if stored else 0.0
+    seen = set(known_ids)
+    started = time.time()
 
-    try:
-        tasks = [_search_reddit(reddit, q, post_limit) for q in queries]
+    logger.info(
+        f"[Reddit] → searching {len(queries)} queries for '{destination}'"
+        + (f" (posts after {since:.0f})" if stored else "")
+    )
+    async with reddit_client() as reddit:
+        tasks = [_search_reddit(reddit, q, post_limit, since=since, seen=seen) for q in queries]
         results = await asyncio.gather(*tasks, return_exceptions=True)
-    finally:
-        await reddit.close()
 
     all_posts: List[str] = []
     for r in results:
@@ -164,14 +232,52 @@ async def get_reddit_place_signals(
             all_posts.extend(r)
 
     raw_text = "\n\n---\n\n".join(all_posts)
+    new_ids = sorted(seen - known_ids)
 
     if not all_posts:
-        logger.warning("No Reddit posts retrieved")
-        return {"place_signals": {}, "raw_posts_text": ""}
+        if stored is None:
+            logger.warning("No Reddit posts retrieved")
+            return None
+        # Nothing new — keep the entry but restart its freshness window
+        entry = merge_entry(stored, {}, "", new_ids, started)
+    else:
+        signals = await _extract_place_signals(raw_text, destination)
+        place_signals = signals.get("place_signals", {})
+        if not place_signals and stored is None:
+            # Extraction failed — serve the posts for this turn, don't pin an empty entry
+            return {"place_signals": {}, "raw_posts_text": raw_text}
+        entry = merge_entry(stored, place_signals, raw_text, new_ids, started)
 
-    signals = await _extract_place_signals(raw_text, destination)
-    signals["raw_posts_text"] = raw_text
-    return signals
+    await put_stored(destination, entry)
+    return entry
+
+
+async def _refresh_destination(
+    intent: TravelIntent,
+    destination: str,
+    post_limit: int,
+    stored: Dict[str, Any],
+) -> None:
+    try:
+        await coalesce(
+            store_key(destination), lambda: _crawl_destination(intent, destination, post_limit, stored)
+        )
+    except Exception as e:
+        logger.warning(f"[Reddit] background refresh failed for '{destination}': {e}")
+
+
+def _schedule_refresh(
+    intent: TravelIntent,
+    destination: str,
+    post_limit: int,
+    stored: Dict[str, Any],
+) -> None:
+    logger.info(f"[Reddit] stale signals for '{destination}' — refreshing in background")
+    schedule(
+        f"refresh:{store_key(destination)}",
+        lambda: _refresh_destination(intent, destination, post_limit, stored),
+        priority=PRIORITY_LOW,
+    )
 
 
 async def get_area_reddit_signals(
@@ -189,11 +295,7 @@ async def get_area_reddit_signals(
     ]
     all_posts: List[str] = []
     try:
-        async with asyncpraw.Reddit(
-            client_id=CLIENT_ID,
-            client_secret=CLIENT_SECRET,
-            user_agent=USER_AGENT,
-        ) as reddit:
+        async with reddit_client() as reddit:
             tasks = [_search_reddit(reddit, q, limit=8, comment_limit=15, comment_body_chars=350) for q in queries]
             results = await asyncio.gather(*tasks, return_exceptions=True)
             for r in results:
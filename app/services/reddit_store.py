@@ -0,0 +1,149 @@
+"""
+app/services/reddit_store.py — Destination-keyed store of extracted Reddit signals.
+
+Key format:
+  reddit_signals:{destination}   TTL REDDIT_STORE_TTL (14 days)
+
+Value: {place_signals, raw_posts_text, post_ids, crawled_at}
+  post_ids: submissions already folded in — a refresh skips them
+  crawled_at: epoch seconds of the last crawl — a refresh only loads
+              submissions created after it
+
+get_stored / put_stored: Redis read/write, silent on error
+is_fresh: crawled within REDDIT_STORE_FRESH_S
+merge_entry: fold a refresh's posts and extracted signals into a stored entry
+public_view: the {place_signals, raw_posts_text} shape callers expect
+reddit_store_stats: hit / stale / miss / refresh counters for /health
+"""
+import json
+import os
+import time
+
+from app.services.geocode_cache import normalize_place_name
+from app.services.redis_pool import get_redis
+from app.services.tracing import record_cache
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+REDDIT_STORE_TTL = int(os.getenv("REDDIT_STORE_TTL", str(14 * 86400)))
+REDDIT_STORE_FRESH_S = int(os.getenv("REDDIT_STORE_FRESH_S", str(6 * 3600)))
+REDDIT_STORE_MAX_POST_IDS = int(os.getenv("REDDIT_STORE_MAX_POST_IDS", "500"))
+# ScoringEngine keyword analysis reads this; newest posts are kept first
+REDDIT_STORE_MAX_RAW_CHARS = int(os.getenv("REDDIT_STORE_MAX_RAW_CHARS", "20000"))
+_MAX_HIGHLIGHTS = 5
+
+_stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "new_posts": 0}
+
+
+def reddit_store_stats() -> dict[str, int]:
+    return dict(_stats)
+
+
+def store_key(destination: str) -> str:
+    return f"reddit_signals:{normalize_place_name(destination)}"
+
+
+def is_fresh(entry: dict, now: float | None = None) -> bool:
+    return (now or time.time()) - float(entry.get("crawled_at", 0)) < REDDIT_STORE_FRESH_S
+
+
+def public_view(entry: dict) -> dict:
+    return {
+        "place_signals": entry.get("place_signals", {}),
+        "raw_posts_text": entry.get("raw_posts_text", ""),
+    }
+
+
+async def get_stored(destination: str) -> dict | None:
+    """Stored entry for a destination, or None. Counts hit / stale / miss."""
+    r = await get_redis()
+    if not r:
+        return None
+    key = store_key(destination)
+    try:
+        raw = await r.get(key)
+        entry = json.loads(raw) if raw else None
+    except Exception as e:
+        logger.warning(f"[reddit_store] get error for {key}: {e}")
+        return None
+    if entry is None:
+        _stats["misses"] += 1
+        record_cache("reddit_signals", "miss")
+    elif is_fresh(entry):
+        _stats["hits"] += 1
+        record_cache("reddit_signals", "hit")
+    else:
+        _stats["stale_hits"] += 1
+        record_cache("reddit_signals", "stale")
+    return entry
+
+
+async def put_stored(destination: str, entry: dict) -> None:
+    r = await get_redis()
+    if not r:
+        return
+    key = store_key(destination)
+    try:
+        await r.setex(key, REDDIT_STORE_TTL, json.dumps(entry, default=str))
+        logger.info(
+            f"[reddit_store] set: {key} places={len(entry.get('place_signals', {}))} "
+            f"posts={len(entry.get('post_ids', []))}"
+        )
+    except Exception as e:
+        logger.warning(f"[reddit_store] set error for {key}: {e}")
+
+
+def _merge_place(old: dict, new: dict) -> dict:
+    """Mention-weighted sentiment, summed mentions, newest crowd signal, unioned tags."""
+    old_n = int(old.get("mention_count", 1) or 1)
+    new_n = int(new.get("mention_count", 1) or 1)
+    old_s = float(old.get("sentiment_score", 0.5))
+    new_s = float(new.get("sentiment_score", 0.5))
+    return {
+        **old,
+        **new,
+        "sentiment_score": round((old_s * old_n + new_s * new_n) / (old_n + new_n), 3),
+        "mention_count": old_n + new_n,
+        "vibe_tags": list(dict.fromkeys([*old.get("vibe_tags", []), *new.get("vibe_tags", [])])),
+        "review_highlights": list(dict.fromkeys(
+            [*new.get("review_highlights", []), *old.get("review_highlights", [])]
+        ))[:_MAX_HIGHLIGHTS],
+    }
+
+
+def merge_entry(
+    stored: dict | None,
+    place_signals: dict,
+    raw_posts_text: str,
+    new_post_ids: list[str],
+    crawled_at: float,
+) -> dict:
+    """
+    New store entry from a crawl. Place names are matched case-insensitively;
+    a place seen before has its signals combined with the new mentions.
+    """
+    merged = dict((stored or {}).get("place_signals", {}))
+    by_lower = {name.lower(): name for name in merged}
+    for name, signal in (place_signals or {}).items():
+        if not isinstance(signal, dict):
+            continue
+        existing = by_lower.get(name.lower())
+        if existing is None:
+            merged[name] = signal
+            by_lower[name.lower()] = name
+        else:
+            merged[existing] = _merge_place(merged[existing], signal)
+
+    old_raw = (stored or {}).get("raw_posts_text", "")
+    raw = "\n\n---\n\n".join(t for t in (raw_posts_text, old_raw) if t)
+    post_ids = list(dict.fromkeys([*new_post_ids, *(stored or {}).get("post_ids", [])]))
+    if stored is not None:
+        _stats["refreshes"] += 1
+    _stats["new_posts"] += len(new_post_ids)
+    return {
+        "place_signals": merged,
+        "raw_posts_text": raw[:REDDIT_STORE_MAX_RAW_CHARS],
+        "post_ids": post_ids[:REDDIT_STORE_MAX_POST_IDS],
+        "crawled_at": crawled_at,
+    }
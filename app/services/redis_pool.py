@@ -0,0 +1,122 @@
+"""
+app/services/redis_pool.py — Process-wide Redis connection pool.
+
+init_redis_pool: called from the FastAPI lifespan on startup
+close_redis_pool: called from the FastAPI lifespan on shutdown
+get_redis: shared client bound to the pool (lazily created outside the server)
+redis_pool_stats: pool size + connection wait-time metrics for sizing under load
+
+Every Redis user (area_cache, planning, in_destination) goes through get_redis
+instead of opening and closing its own connection per lookup.
+"""
+import os
+import time
+
+import redis.asyncio as aioredis
+from redis.asyncio.connection import BlockingConnectionPool
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+REDIS_POOL_SIZE = int(os.getenv("REDIS_POOL_SIZE", "20"))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "5"))
+
+_client: aioredis.Redis | None = None
+
+_wait_stats = {
+    "acquisitions": 0,
+    "timeouts": 0,
+    "wait_total_s": 0.0,
+    "wait_max_s": 0.0,
+}
+
+
+class _InstrumentedPool(BlockingConnectionPool):
+    """BlockingConnectionPool that records how long callers wait for a connection."""
+
+    async def get_connection(self, command_name, *keys, **options):
+        start = time.perf_counter()
+        try:
+            return await super().get_connection(command_name, *keys, **options)
+        except aioredis.ConnectionError:
+            _wait_stats["timeouts"] += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            _wait_stats["acquisitions"] += 1
+            _wait_stats["wait_total_s"] += waited
+            _wait_stats["wait_max_s"] = max(_wait_stats["wait_max_s"], waited)
+
+
+def _build_client() -> aioredis.Redis:
+    pool = _InstrumentedPool.from_url(
+        REDIS_URL,
+        max_connections=REDIS_POOL_SIZE,
+        timeout=REDIS_POOL_TIMEOUT,
+        decode_responses=True,
+    )
+    return aioredis.Redis(connection_pool=pool)
+
+
+async def init_redis_pool() -> aioredis.Redis | None:
+    """Create the shared pool and verify connectivity. Returns None if Redis is down."""
+    global _client
+    if _client is None:
+        _client = _build_client()
+    try:
+        await _client.ping()
+        logger.info(f"[redis_pool] ready: {REDIS_URL} max_connections={REDIS_POOL_SIZE}")
+    except Exception as e:
+        # Keep the client — the pool reconnects lazily once Redis comes back.
+        logger.warning(f"[redis_pool] Redis unreachable at startup: {e}")
+    return _client
+
+
+async def close_redis_pool() -> None:
+    """Disconnect every pooled connection. Safe to call when never initialised."""
+    global _client
+    if _client is None:
+        return
+    try:
+        await _client.aclose()
+        await _client.connection_pool.disconnect()
+    except Exception as e:
+        logger.warning(f"[redis_pool] close error: {e}")
+    finally:
+        _client = None
+    logger.info("[redis_pool] closed")
+
+
+async def get_redis() -> aioredis.Redis | None:
+    """Return the shared client, creating the pool on first use. Never close the result."""
+    global _client
+    if _client is None:
+        try:
+            _client = _build_client()
+        except Exception as e:
+            logger.warning(f"[redis_pool] could not create pool: {e}")
+            return None
+    return _client
+
+
+def redis_pool_stats() -> dict:
+    """Pool occupancy and connection wait-time metrics."""
+    acquisitions = _wait_stats["acquisitions"]
+    stats = {
+        "max_connections": REDIS_POOL_SIZE,
+        "created": 0,
+        "in_use": 0,
+        "idle": 0,
+        "acquisitions": acquisitions,
+        "timeouts": _wait_stats["timeouts"],
+        "wait_avg_ms": round(_wait_stats["wait_total_s"] / acquisitions * 1000, 3) if acquisitions else 0.0,
+        "wait_max_ms": round(_wait_stats["wait_max_s"] * 1000, 3),
+    }
+    if _client is not None:
+        pool = _client.connection_pool
+        in_use = len(getattr(pool, "_in_use_connections", ()))
+        idle = len(getattr(pool, "_available_connections", ()))
+        stats.update({"created": in_use + idle, "in_use": in_use, "idle": idle})
+    return stats
@@ -10,6 +10,7 @@ Signal flow per spec:
   → confidence from mention_count
   → reddit_crowd forwarded to ScoringEngine
 """
+from bisect import bisect_right
 from typing import Any, Dict, List, Optional, Tuple
 
 from app.utils.logger import get_logger
@@ -17,27 +18,97 @@ from app.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _joined(texts: List[str]) -> Tuple[str, List[int]]:
+    """NUL-joined text plus each part's start offset, for one-sweep str.find."""
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text) + 1
+    return "\0".join(texts), starts
+
+
+class _SignalIndex:
+    """
+    Place-name lookups over one (reddit_signals, blog_signals) pair, built once
+    so scoring many places does not re-lowercase and rescan every signal key
+    and blog snippet per place.
+
+    Keys and snippets are lowercased once and NUL-joined; a name is located in
+    all of them with one str.find sweep (C speed), and bisect maps the offset
+    back to the key or source it falls in.
+    """
+
+    def __init__(self, reddit_signals: Dict[str, Any], blog_signals: Dict[str, Any]):
+        self.place_signals = reddit_signals.get("place_signals", {})
+        self._keys = list(self.place_signals)
+        self._keys_lower = [key.lower() for key in self._keys]
+        self._keys_text, self._key_starts = _joined(self._keys_lower)
+
+        sources = blog_signals.get("sources", [])
+        self._snippets = [source.get("snippet", "").lower() for source in sources]
+        self._blog_scores = [source.get("final_score", 0.5) for source in sources]
+        self._blog_text, self._blog_starts = _joined(self._snippets)
+
+    def reddit_signal(self, place_name: str) -> Optional[Dict[str, Any]]:
+        """Exact key, else the first key (in signal order) either containing or contained in the name."""
+        signal = self.place_signals.get(place_name)
+        if signal:
+            return signal
+        if not self._keys:
+            return None
+        name = place_name.lower()
+        if "\0" in name:
+            first = next(
+                (i for i, key in enumerate(self._keys_lower) if key in name or name in key),
+                len(self._keys),
+            )
+        else:
+            # Leftmost hit in the joined keys = first key containing the name
+            pos = self._keys_text.find(name)
+            first = bisect_right(self._key_starts, pos) - 1 if pos != -1 else len(self._keys)
+            # ...unless an earlier key is contained in the name
+            for i in range(first):
+                if self._keys_lower[i] in name:
+                    first = i
+                    break
+        return self.place_signals[self._keys[first]] if first < len(self._keys) else None
+
+    def blog_hits(self, place_name: str) -> List[float]:
+        """final_score of every source whose snippet mentions the place, in source order."""
+        name = place_name.lower()
+        if not name or "\0" in name:
+            return [score for snippet, score in zip(self._snippets, self._blog_scores) if name in snippet]
+        hits = []
+        pos = self._blog_text.find(name)
+        while pos != -1:
+            source = bisect_right(self._blog_starts, pos) - 1
+            hits.append(self._blog_scores[source])
+            if source + 1 == len(self._blog_starts):
+                break
+            pos = self._blog_text.find(name, self._blog_starts[source + 1])
+        return hits
+
+
 def _social_score(
     place_name: str,
     reddit_signals: Dict[str, Any],
     blog_signals: Dict[str, Any],
+    index: Optional[_SignalIndex] = None,
 ) -> Tuple[float, float, Optional[str]]:
     """
     Compute combined social score for a place.
+    Pass an index built from the same signals to reuse it across places.
 
     Returns:
         (combined_score, confidence, reddit_crowd)
         reddit_crowd: 'low' | 'medium' | 'high' | None
     """
-    place_signals = reddit_signals.get("place_signals", {})
+    if index is None:
+        index = _SignalIndex(reddit_signals, blog_signals)
 
     # Try exact match, then partial match
-    signal = place_signals.get(place_name)
-    if not signal:
-        for key in place_signals:
-            if key.lower() in place_name.lower() or place_name.lower() in key.lower():
-                signal = place_signals[key]
-                break
+    signal = index.reddit_signal(place_name)
 
     reddit_score = 0.5
     confidence = 0.3
@@ -52,11 +123,7 @@ def _social_score(
 
     # Blog score: weighted by final_score for sources mentioning the place
     blog_score = 0.3  # fallback
-    blog_hits = []
-    for source in blog_signals.get("sources", []):
-        snippet = source.get("snippet", "").lower()
-        if place_name.lower() in snippet:
-            blog_hits.append(source.get("final_score", 0.5))
+    blog_hits = index.blog_hits(place_name)
 
     if blog_hits:
         blog_score = sum(blog_hits) / len(blog_hits)
@@ -74,9 +141,10 @@ def score_all_places(
     Attach social scores to each place dict.
     Returns the same list with added 'social_score', 'social_confidence', 'reddit_crowd' fields.
     """
+    index = _SignalIndex(reddit_signals, blog_signals)
     for place in places:
         name = place.get("name", "")
-        score, conf, crowd = _social_score(name, reddit_signals, blog_signals)
+        score, conf, crowd = _social_score(name, reddit_signals, blog_signals, index)
         place["social_score"] = score
         place["social_confidence"] = conf
         place["reddit_crowd"] = crowd
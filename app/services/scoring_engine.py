@@ -2,6 +2,7 @@
 Scoring Engine - Deterministic scoring for crowd and authenticity.
 """
 import logging
+from functools import lru_cache
 from typing import Optional
 
 from app.models import ScoreResult, AreaScores
@@ -9,6 +10,36 @@ from app.models import ScoreResult, AreaScores
 logger = logging.getLogger(__name__)
 
 
+class KeywordMatcher:
+    """
+    Counts, per keyword group, how many of the group's keywords occur in a text.
+
+    Built once from every group; a keyword listed in several groups is
+    searched for once. This is not a single pass over the text: count() runs
+    one `in` scan per deduplicated keyword. Each scan is CPython's C substring
+    search, and for a few dozen short keywords that measured faster than a
+    combined regex or a pure-Python Aho–Corasick walk.
+    """
+    
+    def __init__(self, groups: dict[str, list[str]]):
+        self.groups = list(groups)
+        self._keywords = list(dict.fromkeys(kw.lower() for kws in groups.values() for kw in kws))
+        # keyword → the group names it counts towards (once per listing)
+        self._membership = {
+            kw: [name for name, kws in groups.items() for k in kws if k.lower() == kw]
+            for kw in self._keywords
+        }
+    
+    def count(self, text_lower: str) -> dict[str, int]:
+        """Keyword hits per group in already-lowercased text."""
+        counts = dict.fromkeys(self.groups, 0)
+        for kw in self._keywords:
+            if kw in text_lower:
+                for name in self._membership[kw]:
+                    counts[name] += 1
+        return counts
+
+
 class CrowdScorer:
     """Computes crowd score from Reddit and Google signals."""
     
@@ -88,11 +119,11 @@ class CrowdScorer:
     
     def _analyze_reddit_crowd(self, text: str) -> tuple[float, float]:
         """Analyze Reddit text for crowd signals. Returns (score, confidence)."""
-        text_lower = text.lower()
+        counts = reddit_keyword_counts(text)
         
-        high_count = sum(1 for kw in self.HIGH_CROWD_KEYWORDS if kw in text_lower)
-        medium_count = sum(1 for kw in self.MEDIUM_CROWD_KEYWORDS if kw in text_lower)
-        low_count = sum(1 for kw in self.LOW_CROWD_KEYWORDS if kw in text_lower)
+        high_count = counts['crowd_high']
+        medium_count = counts['crowd_medium']
+        low_count = counts['crowd_low']
         
         total = high_count + medium_count + low_count
         if total == 0:
@@ -182,10 +213,10 @@ class AuthenticityScorer:
     
     def _analyze_reddit_authenticity(self, text: str) -> tuple[float, float]:
         """Analyze Reddit text for authenticity signals."""
-        text_lower = text.lower()
+        counts = reddit_keyword_counts(text)
         
-        high_count = sum(1 for kw in self.HIGH_AUTH_KEYWORDS if kw in text_lower)
-        low_count = sum(1 for kw in self.LOW_AUTH_KEYWORDS if kw in text_lower)
+        high_count = counts['auth_high']
+        low_count = counts['auth_low']
         
         total = high_count + low_count
         if total == 0:
@@ -197,6 +228,25 @@ class AuthenticityScorer:
         return score, confidence
 
 
+_REDDIT_KEYWORDS = KeywordMatcher({
+    'crowd_high': CrowdScorer.HIGH_CROWD_KEYWORDS,
+    'crowd_medium': CrowdScorer.MEDIUM_CROWD_KEYWORDS,
+    'crowd_low': CrowdScorer.LOW_CROWD_KEYWORDS,
+    'auth_high': AuthenticityScorer.HIGH_AUTH_KEYWORDS,
+    'auth_low': AuthenticityScorer.LOW_AUTH_KEYWORDS,
+})
+
+
+@lru_cache(maxsize=8)
+def reddit_keyword_counts(text: str) -> dict[str, int]:
+    """
+    Crowd and authenticity keyword counts for a Reddit text. Cached, so the
+    two scorers in score_area share one lowercase and one scan. Do not mutate
+    the returned dict.
+    """
+    return _REDDIT_KEYWORDS.count(text.lower())
+
+
 class ScoringEngine:
     """Combined scoring engine for areas."""
     
@@ -0,0 +1,143 @@
+"""
+app/services/single_flight.py — Request coalescing for concurrent identical cache misses.
+
+coalesce: run compute() once per key; concurrent callers await the same result.
+
+Two layers, both keyed by the cache key the caller is about to fill
+(e.g. area_cards:goa:beach_coast):
+
+  1. In-process — callers in the same worker share one asyncio.Task.
+  2. Redis lock — when a `reread` coroutine is supplied, the in-process leader
+     takes `sf:{key}` with SET NX EX. Leaders in other workers that lose the
+     race poll `reread` (normally get_cached) until the winner has written the
+     cache, then return that instead of recomputing. If the lock expires or
+     the wait times out, they compute themselves — a lost lock never blocks.
+
+Redis being unavailable degrades to in-process coalescing only.
+"""
+import asyncio
+import os
+import time
+import uuid
+from typing import Any, Awaitable, Callable, TypeVar
+
+from app.services.redis_pool import get_redis
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+SINGLE_FLIGHT_LOCK_TTL = int(os.getenv("SINGLE_FLIGHT_LOCK_TTL", "60"))
+SINGLE_FLIGHT_WAIT_TIMEOUT = float(os.getenv("SINGLE_FLIGHT_WAIT_TIMEOUT", "45"))
+SINGLE_FLIGHT_POLL_INTERVAL = float(os.getenv("SINGLE_FLIGHT_POLL_INTERVAL", "0.25"))
+SINGLE_FLIGHT_DISTRIBUTED = os.getenv("SINGLE_FLIGHT_DISTRIBUTED", "1") == "1"
+
+# Compare-and-delete: only the lock owner may release it.
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+_inflight: dict[str, asyncio.Task] = {}
+_stats = {"leaders": 0, "coalesced": 0, "remote_waits": 0, "remote_hits": 0}
+
+
+def single_flight_stats() -> dict[str, int]:
+    """Counters: leaders (computations run), coalesced (callers that joined one), remote hits."""
+    return {**_stats, "inflight": len(_inflight)}
+
+
+async def _acquire_lock(key: str, token: str) -> bool | None:
+    """True = lock taken, False = held elsewhere, None = Redis unavailable."""
+    r = await get_redis()
+    if not r:
+        return None
+    try:
+        return bool(await r.set(f"sf:{key}", token, nx=True, ex=SINGLE_FLIGHT_LOCK_TTL))
+    except Exception as e:
+        logger.warning(f"[single_flight] lock error for {key}: {e}")
+        return None
+
+
+async def _release_lock(key: str, token: str) -> None:
+    r = await get_redis()
+    if not r:
+        return
+    try:
+        await r.eval(_RELEASE_SCRIPT, 1, f"sf:{key}", token)
+    except Exception as e:
+        logger.warning(f"[single_flight] unlock error for {key}: {e}")
+
+
+async def _lock_held(key: str) -> bool:
+    r = await get_redis()
+    if not r:
+        return False
+    try:
+        return bool(await r.exists(f"sf:{key}"))
+    except Exception:
+        return False
+
+
+async def _wait_for_remote(key: str, reread: Callable[[], Awaitable[Any]]) -> Any:
+    """Poll reread() while another worker holds the lock. None when it never lands."""
+    _stats["remote_waits"] += 1
+    deadline = time.monotonic() + SINGLE_FLIGHT_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        await asyncio.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+        result = await reread()
+        if result is not None:
+            _stats["remote_hits"] += 1
+            logger.info(f"[single_flight] remote fill: {key}")
+            return result
+        if not await _lock_held(key):
+            break
+    return None
+
+
+async def _lead(
+    key: str,
+    compute: Callable[[], Awaitable[T]],
+    reread: Callable[[], Awaitable[T | None]] | None,
+) -> T:
+    if reread is None or not SINGLE_FLIGHT_DISTRIBUTED:
+        return await compute()
+
+    token = uuid.uuid4().hex
+    locked = await _acquire_lock(key, token)
+    if locked is False:
+        result = await _wait_for_remote(key, reread)
+        if result is not None:
+            return result
+        locked = await _acquire_lock(key, token)
+    try:
+        return await compute()
+    finally:
+        if locked:
+            await _release_lock(key, token)
+
+
+async def coalesce(
+    key: str,
+    compute: Callable[[], Awaitable[T]],
+    reread: Callable[[], Awaitable[T | None]] | None = None,
+) -> T:
+    """
+    Return compute()'s result, running it at most once per key at a time.
+    Pass reread (a cache lookup) to also coalesce across workers via a Redis lock.
+    Exceptions from compute() propagate to every waiting caller.
+    """
+    task = _inflight.get(key)
+    if task is not None:
+        _stats["coalesced"] += 1
+        logger.info(f"[single_flight] joined: {key}")
+        return await asyncio.shield(task)
+
+    _stats["leaders"] += 1
+    task = asyncio.get_running_loop().create_task(_lead(key, compute, reread))
+    _inflight[key] = task
+    task.add_done_callback(lambda t: _inflight.pop(key, None) if _inflight.get(key) is t else None)
+    return await asyncio.shield(task)
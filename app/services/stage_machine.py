@@ -2,7 +2,8 @@
 app/services/stage_machine.py — Adaptive conversation stage resolver.
 
 resolve_stage: reads GraphState, returns current stage string.
-determine_action: takes stage, returns (action, payload) for the frontend.
+determine_action: takes stage, returns (action, payload) for the frontend,
+    then queues speculative warming of the likely next stage.
 
 Both are imported by responder.py and intent.py. Nothing else should
 define conversation stage logic.
@@ -10,35 +11,62 @@ define conversation stage logic.
 import asyncio
 import json
 import os
-import aiohttp
+from typing import Any, Awaitable
 
 from app.services.tavily_client import tavily_search
-from app.services.geo_utils import get_origin, resolve_origin_coords, geocode, batch_driving_times
+from app.services.geo_utils import (
+    get_origin, resolve_origin_coords, geocode, batch_driving_times, prefilter_reachable,
+)
 from app.services.area_cache import get_cached, set_cached
+from app.services.job_scheduler import PRIORITY_LOW, schedule
+from app.services.single_flight import coalesce
+from app.services.stage_prefetch import PREFETCH_FANOUT, Target, cancel_prefetch, prefetch
+from app.services.stream_events import emit
+from app.services.tracing import span
 from app.utils.place_photos import fetch_place_photos
+from app.services.llm_gateway import complete_json
 from app.utils.logger import get_logger
 from app.tools.fetchers.places import search_places
 from app.services.ranker import Ranker
 from app.services.scorer import score_all_places
 from app.models import Place, PlaceAreaMapping
 from app.services.reddit_signals import get_area_reddit_signals
-from app.services.activity_options import build_activity_options
+from app.services.activity_options import activity_options_key, build_activity_options
 
 logger = get_logger(__name__)
 
 GROQ_API_KEY = os.getenv("GROQ_API", "")
-GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
 _MODEL = "meta-llama/llama-4-scout-17b-16e-instruct"
 
 _ranker = Ranker()
+
+# area_cache stale-while-revalidate windows: past the soft TTL the cached cards
+# are still served while the builder reruns in the background; hard TTL evicts.
+_VIBE_CARDS_TTL, _VIBE_CARDS_HARD_TTL = 86400, 7 * 86400
+_AREA_CARDS_TTL, _AREA_CARDS_HARD_TTL = 86400, 7 * 86400
+_PLACE_CARDS_TTL, _PLACE_CARDS_HARD_TTL = 43200, 3 * 86400
+
+# Max per-area place-card pipelines in flight for one areas_selected turn
+PLACE_CARDS_AREA_CONCURRENCY = int(os.getenv("PLACE_CARDS_AREA_CONCURRENCY", "3"))
+# Default-category Maps searches started alongside the Groq category call
+PLACE_SPECULATIVE_SEARCHES = int(os.getenv("PLACE_SPECULATIVE_SEARCHES", "2"))
+
 _VALID_VIBE_IDS = {"adv", "loc", "spt", "hid"}
 
+# Destination suggestions: longest acceptable drive from the origin
+_MAX_DRIVE_MINS = 720
+
 DEFAULT_PLACE_CATEGORIES: list[dict] = [
     {"label": "Things to Do", "query": "attractions activities things to do"},
     {"label": "Cafés & Bars", "query": "cafes bars restaurants local food"},
     {"label": "Viewpoints & Nature", "query": "viewpoints nature parks scenic"},
 ]
 
+# Defaults most likely to match a Groq category, best first: the category
+# prompt always asks for a food/drink category, and "things to do" is the
+# next most common pick.
+_SPECULATIVE_DEFAULT_LABELS = ("Cafés & Bars", "Things to Do", "Viewpoints & Nature")
+
 _CATEGORY_DESCRIPTIONS = {
     "beach_coast":     "beaches, coastal towns, sea, islands, water sports",
     "hills_nature":    "hill stations, mountains, forests, trekking, altitude, valleys",
@@ -51,29 +79,22 @@ _CATEGORY_DESCRIPTIONS = {
 
 # ── Private Groq helpers ───────────────────────────────────────────────────────
 
-async def _groq_json(prompt: str, max_tokens: int = 500) -> dict | list | None:
+async def _groq_json(
+    prompt: str, max_tokens: int = 500, call_site: str = "stage_machine"
+) -> dict | list | None:
     """Send a prompt to Groq expecting a JSON response. Returns parsed result or None."""
     if not GROQ_API_KEY:
         return None
-    headers = {"Authorization": f"Bearer {GROQ_API_KEY}", "Content-Type": "application/json"}
-    body = {
-        "model": _MODEL,
-        "messages": [{"role": "user", "content": prompt}],
-        "max_tokens": max_tokens,
-        "temperature": 0.1,
-    }
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(GROQ_URL, headers=headers, json=body) as r:
-                result = await r.json()
-                text = result["choices"][0]["message"]["content"].strip()
-                if text.startswith("```"):
-                    text = text.split("```")[1]
-                    if text.startswith("json"):
-                        text = text[4:]
-                return json.loads(text)
+        return await complete_json(
+            [{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=0.1,
+            call_site=call_site,
+            model=_MODEL,
+        )
     except Exception as e:
-        logger.error(f"[Groq/_groq_json] failed: {e}")
+        logger.error(f"[Groq/{call_site}] failed: {e}")
         return None
 
 
@@ -94,7 +115,7 @@ async def _classify_destinations(
         'Return ONLY valid JSON (no markdown): {"beach_coast": ["Alibaug"], "hills_nature": ["Lonavala"]}\n'
         "Only include categories with at least one destination. Omit empty categories."
     )
-    result = await _groq_json(prompt)
+    result = await _groq_json(prompt, call_site="classify_destinations")
     if isinstance(result, dict):
         classified = {
             k: [str(v) for v in vals]
@@ -122,7 +143,7 @@ async def _extract_live_hooks(event_results: list[dict]) -> dict[str, str]:
         'Return ONLY valid JSON (no markdown): {"hills_nature": "Kasol Nomad Festival this weekend"}\n'
         "Only include categories where you found a clear event. Omit if none found."
     )
-    result = await _groq_json(prompt)
+    result = await _groq_json(prompt, call_site="live_hooks")
     if isinstance(result, dict):
         return {
             k: str(v)[:70]
@@ -154,7 +175,7 @@ async def _generate_destination_hooks(
         "Return ONLY a valid JSON array of strings matching the input order (no markdown):\n"
         '["Monsoon turns the valleys electric green — strawberry season peak", "Sea breeze and empty beaches"]'
     )
-    result = await _groq_json(prompt, max_tokens=300)
+    result = await _groq_json(prompt, max_tokens=300, call_site="destination_hooks")
     if isinstance(result, list) and len(result) == len(destinations):
         return [str(h) for h in result]
     return [f"Visit {d}" for d in destinations]
@@ -164,7 +185,7 @@ async def _generate_destination_hooks(
 
 def _rank_places_for_area(
     places_raw: list[dict],
-    intent: any,
+    intent: Any,
     reddit_signals: dict,
     blog_signals: dict,
 ) -> list[dict]:
@@ -186,10 +207,10 @@ def _rank_places_for_area(
             tags=p.get("types") or p.get("tags") or [],
         )
         mappings.append(PlaceAreaMapping(place=place))
-    ranked = _ranker.rank_places(mappings, intent, area_scores=None) if intent else []
+    ranked = _ranker.rank_places(mappings, intent, area_scores=None, top_k=3) if intent else []
     id_to_raw: dict[str, dict] = {(p.get("place_id") or p.get("id", "")): p for p in filtered}
     result = []
-    for rp in ranked[:3]:
+    for rp in ranked:
         pid = rp.place.place_id
         raw = id_to_raw.get(pid, {})
         result.append({"id": pid, "name": rp.place.name, "photo_url": raw.get("photo_url")})
@@ -215,15 +236,36 @@ async def _prefetch_area_reddit(
         pass
 
 
+def _exp_key(state: dict) -> str:
+    """Cache-key segment for the traveller's interests: experience types, else vibe ids."""
+    experience_types = state.get("experience_types") or []
+    return "|".join(sorted(experience_types or state.get("selected_vibe_ids") or []))
+
+
+def place_cards_key(state: dict, area_id: str) -> str:
+    return f"place_cards:{state.get('destination', '').lower()}:{area_id.lower()}:{_exp_key(state)}"
+
+
+def vibe_cards_key(destination: str) -> str:
+    return f"vibe_cards:{destination.lower()}"
+
+
+def area_cards_key(state: dict) -> str:
+    return f"area_cards:{state.get('destination', '').lower()}:{_exp_key(state)}"
+
+
 async def fetch_place_cards(state: dict, area_id: str | None = None) -> list[dict]:
-    """4-step pipeline: Groq categories → Maps search → rank → Groq hooks. Returns categorised place cards."""
+    """4-step pipeline: Groq categories → Maps search → rank → Groq hooks. Returns categorised place cards.
+
+    The steps are pipelined: the PLACE_SPECULATIVE_SEARCHES most likely default
+    categories are searched alongside the Groq category call and reused when a
+    chosen category overlaps them. Each category is then ranked and hooked (and
+    streamed as a place_category event) as soon as its own search returns.
+    Concurrent misses for the same cache key are coalesced into one pipeline run.
+    """
     destination = state.get("destination", "")
     area_id = area_id or (state.get("selected_areas") or [""])[0]
     experience_types = state.get("experience_types") or []
-    selected_vibe_ids = state.get("selected_vibe_ids") or []
-    travel_intent = state.get("travel_intent")
-    reddit_signals = state.get("reddit_signals") or {}
-    blog_signals = state.get("blog_signals") or {}
 
     area_name = area_id
     for area in (state.get("area_cards") or []):
@@ -231,56 +273,186 @@ async def fetch_place_cards(state: dict, area_id: str | None = None) -> list[dic
             area_name = area.get("name", area_id)
             break
 
-    exp_key = "|".join(sorted(experience_types)) if experience_types else "|".join(sorted(selected_vibe_ids))
-    cache_key = f"place_cards:{destination.lower()}:{area_id.lower()}:{exp_key}"
-    cached = await get_cached(cache_key)
-    if cached:
-        state["place_cards"] = cached
-        try:
-            asyncio.create_task(_prefetch_area_reddit(destination, area_id, area_name, experience_types))
-        except Exception:
-            pass
-        return cached
-
-    # Step 1 — Category determination
-    trip_who = state.get("trip_who") or ""
-    trip_season = state.get("trip_season") or ""
-    exp_desc = ", ".join(experience_types) if experience_types else ", ".join(selected_vibe_ids)
-    cat_prompt = (
-        f"You are a travel expert. For {area_name} in {destination}, "
-        f"experience types: {exp_desc or 'general'}, group: {trip_who}, season: {trip_season}. "
-        f"Return a JSON array of 3-4 category objects with 'label' (display name) and 'query' (Google Maps search terms). "
-        f"Always include a food/drink category (Cafés & Bars or Restaurants). "
-        f'Example: [{{"label": "Adventure Spots", "query": "trekking viewpoints cliff"}}]. '
-        f"Return only valid JSON, no explanation."
+    cache_key = place_cards_key(state, area_id)
+    snapshot = dict(state)
+    cached = await get_cached(
+        cache_key,
+        revalidate=lambda: _compute_place_cards(snapshot, area_id, area_name, cache_key),
     )
-    raw_cats = await _groq_json(cat_prompt, max_tokens=250)
-    categories: list[dict] = raw_cats if (isinstance(raw_cats, list) and raw_cats) else DEFAULT_PLACE_CATEGORIES
+    if not cached:
+        cached = await coalesce(
+            cache_key,
+            lambda: _compute_place_cards(state, area_id, area_name, cache_key),
+            reread=lambda: get_cached(cache_key),
+        )
+    state["place_cards"] = cached
+    schedule(
+        f"reddit_area:{destination.lower()}:{area_id.lower()}",
+        lambda: _prefetch_area_reddit(destination, area_id, area_name, experience_types),
+        priority=PRIORITY_LOW,
+    )
+    return cached
 
-    # Step 2 — Maps search per category (parallel)
-    search_tasks = [search_places(f"{area_name}, {destination}", cat["query"]) for cat in categories]
-    raw_results = await asyncio.gather(*search_tasks, return_exceptions=True)
 
-    # Step 3 — Score and rank per category
-    categories_with_places: list[dict] = []
-    for cat, raw in zip(categories, raw_results):
-        if isinstance(raw, Exception) or not raw:
-            continue
-        ranked = _rank_places_for_area(raw, travel_intent, reddit_signals, blog_signals)
-        if ranked:
-            categories_with_places.append({"label": cat["label"], "places": ranked})
-
-    if not categories_with_places:
-        state["place_cards"] = []
-        try:
-            asyncio.create_task(_prefetch_area_reddit(destination, area_id, area_name, experience_types))
-        except Exception:
-            pass
+async def _fetch_place_cards_for_areas(state: dict, area_ids: list[str]) -> list[list[dict]]:
+    """
+    Run fetch_place_cards for every area concurrently (at most
+    PLACE_CARDS_AREA_CONCURRENCY at once). Results come back in selection
+    order so cross-area dedup stays deterministic; a failed area yields [].
+    """
+    semaphore = asyncio.Semaphore(PLACE_CARDS_AREA_CONCURRENCY)
+
+    async def one(aid: str) -> list[dict]:
+        async with semaphore:
+            return await fetch_place_cards(state, area_id=aid)
+
+    results = await asyncio.gather(*(one(aid) for aid in area_ids), return_exceptions=True)
+    per_area: list[list[dict]] = []
+    for aid, res in zip(area_ids, results):
+        if isinstance(res, BaseException):
+            logger.warning(f"[place_cards] area {aid} failed: {res}")
+            per_area.append([])
+        else:
+            per_area.append(res or [])
+    return per_area
+
+
+async def _compute_place_cards(state: dict, area_id: str, area_name: str, cache_key: str) -> list[dict]:
+    """Cache-miss path of fetch_place_cards. Does not mutate state — the result may be shared."""
+    destination = state.get("destination", "")
+    experience_types = state.get("experience_types") or []
+    selected_vibe_ids = state.get("selected_vibe_ids") or []
+    travel_intent = state.get("travel_intent")
+    reddit_signals = state.get("reddit_signals") or {}
+    blog_signals = state.get("blog_signals") or {}
+
+    # Step 1 — Category determination. The likeliest default-category Maps
+    # searches start now, while Groq is still choosing, and are reused on overlap.
+    location = f"{area_name}, {destination}"
+    loop = asyncio.get_running_loop()
+    speculative = {
+        idx: loop.create_task(_search_category(location, DEFAULT_PLACE_CATEGORIES[idx]["query"]))
+        for idx in _speculative_defaults()
+    }
+    try:
+        trip_who = state.get("trip_who") or ""
+        trip_season = state.get("trip_season") or ""
+        exp_desc = ", ".join(experience_types) if experience_types else ", ".join(selected_vibe_ids)
+        cat_prompt = (
+            f"You are a travel expert. For {area_name} in {destination}, "
+            f"experience types: {exp_desc or 'general'}, group: {trip_who}, season: {trip_season}. "
+            f"Return a JSON array of 3-4 category objects with 'label' (display name) and 'query' (Google Maps search terms). "
+            f"Always include a food/drink category (Cafés & Bars or Restaurants). "
+            f'Example: [{{"label": "Adventure Spots", "query": "trekking viewpoints cliff"}}]. '
+            f"Return only valid JSON, no explanation."
+        )
+        raw_cats = await _groq_json(cat_prompt, max_tokens=250, call_site="place_categories")
+        categories: list[dict] = raw_cats if (isinstance(raw_cats, list) and raw_cats) else DEFAULT_PLACE_CATEGORIES
+
+        # Step 2 — Maps search per category: reuse an overlapping speculative search, else search now
+        searches: list[asyncio.Task] = []
+        reused: set[int] = set()
+        for cat in categories:
+            idx = _matching_default_category(cat, candidates=speculative.keys() - reused)
+            if idx is not None:
+                reused.add(idx)
+                searches.append(speculative[idx])
+            else:
+                searches.append(loop.create_task(_search_category(location, cat["query"])))
+        logger.info(
+            f"[place_cards] {area_name}: {len(reused)}/{len(speculative)} speculative searches reused"
+        )
+
+        # Steps 3 + 4 — each category is ranked and hooked as soon as its search lands
+        built = await asyncio.gather(*(
+            _build_place_category(
+                cat, search, area_name, destination, selected_vibe_ids,
+                travel_intent, reddit_signals, blog_signals,
+            )
+            for cat, search in zip(categories, searches)
+        ))
+    finally:
+        for task in speculative.values():
+            task.cancel()
+
+    categories_out = [cat for cat in built if cat]
+    if not categories_out:
+        return []
+
+    await set_cached(cache_key, categories_out, ttl=_PLACE_CARDS_TTL, hard_ttl=_PLACE_CARDS_HARD_TTL)
+    return categories_out
+
+
+async def _search_category(location: str, query: str) -> list[dict]:
+    """Maps search for one place category. [] on failure."""
+    try:
+        return await search_places(location, query) or []
+    except Exception as e:
+        logger.warning(f"[place_cards] search failed for '{query}' in {location}: {e}")
         return []
 
-    # Step 4 — Hook + vibe generation (one batch Groq call)
-    all_ids = [p["id"] for cat in categories_with_places for p in cat["places"]]
-    all_names = [p["name"] for cat in categories_with_places for p in cat["places"]]
+
+def _speculative_defaults() -> list[int]:
+    """Indices of the DEFAULT_PLACE_CATEGORIES searched before Groq has chosen."""
+    by_label = {cat["label"]: idx for idx, cat in enumerate(DEFAULT_PLACE_CATEGORIES)}
+    ranked = [by_label[label] for label in _SPECULATIVE_DEFAULT_LABELS if label in by_label]
+    return ranked[:max(PLACE_SPECULATIVE_SEARCHES, 0)]
+
+
+def _query_terms(text: str) -> set[str]:
+    return {t for t in text.lower().replace("&", " ").replace(",", " ").split() if t}
+
+
+def _matching_default_category(cat: dict, candidates: set[int]) -> int | None:
+    """
+    Index of the candidate DEFAULT_PLACE_CATEGORIES entry an LLM category overlaps
+    with: same label, or at least half of the query terms shared. None when nothing matches.
+    """
+    label = (cat.get("label") or "").strip().lower()
+    terms = _query_terms(cat.get("query") or "")
+    for idx in sorted(candidates):
+        default = DEFAULT_PLACE_CATEGORIES[idx]
+        if label and label == default["label"].lower():
+            return idx
+        default_terms = _query_terms(default["query"])
+        if terms and len(terms & default_terms) * 2 >= len(terms | default_terms):
+            return idx
+    return None
+
+
+async def _build_place_category(
+    cat: dict,
+    search: Awaitable[list[dict]],
+    area_name: str,
+    destination: str,
+    selected_vibe_ids: list[str],
+    travel_intent: Any,
+    reddit_signals: dict,
+    blog_signals: dict,
+) -> dict | None:
+    """Rank one category's search results and attach hooks. Streams the finished category."""
+    raw = await search
+    if not raw:
+        return None
+    ranked = _rank_places_for_area(raw, travel_intent, reddit_signals, blog_signals)
+    if not ranked:
+        return None
+    hooks = await _generate_place_hooks(ranked, area_name, destination, selected_vibe_ids)
+    category = {
+        "label": cat["label"],
+        "places": [_place_card(p, hooks.get(p["id"]), area_name) for p in ranked],
+    }
+    emit("place_category", {"area": area_name, **category})
+    return category
+
+
+async def _generate_place_hooks(
+    places: list[dict],
+    area_name: str,
+    destination: str,
+    selected_vibe_ids: list[str],
+) -> dict:
+    """Groq hook + vibe call for one category's places. {} on failure."""
     vibe_desc = ", ".join(selected_vibe_ids) if selected_vibe_ids else "general travel"
     hook_prompt = (
         f"You are a travel expert. For each place in {area_name}, {destination}, "
@@ -291,49 +463,38 @@ async def fetch_place_cards(state: dict, area_id: str | None = None) -> list[dic
         f'spt=spiritual/wellness/nature, hid=hidden gem/offbeat), '
         f'"vibe_hint" (3-4 comma-separated activities this place is best for, '
         f"matching the traveller's vibe, lowercase, no trailing punctuation). "
-        f"Places: {json.dumps(dict(zip(all_ids, all_names)))}. "
+        f"Places: {json.dumps({p['id']: p['name'] for p in places})}. "
         f"Return only valid JSON."
     )
-    hooks_raw = await _groq_json(hook_prompt, max_tokens=1200)
-    hooks: dict = hooks_raw if isinstance(hooks_raw, dict) else {}
-
-    categories_out = []
-    for cat in categories_with_places:
-        places_out = []
-        for p in cat["places"]:
-            raw = hooks.get(p["id"])
-            if isinstance(raw, dict):
-                hook_str = raw.get("hook") or f"A great spot in {area_name}"
-                vibe_id_raw = raw.get("vibe_id", "adv")
-                vibe_id = vibe_id_raw if vibe_id_raw in _VALID_VIBE_IDS else "adv"
-                vibe_hint = (raw.get("vibe_hint") or "").rstrip(".,;")
-            elif isinstance(raw, str):
-                # backwards compat: Groq returned old flat string format
-                hook_str = raw
-                vibe_id = "adv"
-                vibe_hint = ""
-            else:
-                hook_str = f"A great spot in {area_name}"
-                vibe_id = "adv"
-                vibe_hint = ""
-            places_out.append({
-                "id": p["id"],
-                "name": p["name"],
-                "hook": hook_str,
-                "photo_url": p["photo_url"],
-                "vibe_id": vibe_id,
-                "vibe_hint": vibe_hint,
-                "area": area_name,
-            })
-        categories_out.append({"label": cat["label"], "places": places_out})
-
-    state["place_cards"] = categories_out
-    await set_cached(cache_key, categories_out, ttl=43200)
-    try:
-        asyncio.create_task(_prefetch_area_reddit(destination, area_id, area_name, experience_types))
-    except Exception:
-        pass
-    return categories_out
+    hooks_raw = await _groq_json(hook_prompt, max_tokens=100 + 120 * len(places), call_site="place_hooks")
+    return hooks_raw if isinstance(hooks_raw, dict) else {}
+
+
+def _place_card(p: dict, raw: Any, area_name: str) -> dict:
+    """Frontend place card from a ranked place and its Groq hook entry."""
+    if isinstance(raw, dict):
+        hook_str = raw.get("hook") or f"A great spot in {area_name}"
+        vibe_id_raw = raw.get("vibe_id", "adv")
+        vibe_id = vibe_id_raw if vibe_id_raw in _VALID_VIBE_IDS else "adv"
+        vibe_hint = (raw.get("vibe_hint") or "").rstrip(".,;")
+    elif isinstance(raw, str):
+        # backwards compat: Groq returned old flat string format
+        hook_str = raw
+        vibe_id = "adv"
+        vibe_hint = ""
+    else:
+        hook_str = f"A great spot in {area_name}"
+        vibe_id = "adv"
+        vibe_hint = ""
+    return {
+        "id": p["id"],
+        "name": p["name"],
+        "hook": hook_str,
+        "photo_url": p["photo_url"],
+        "vibe_id": vibe_id,
+        "vibe_hint": vibe_hint,
+        "area": area_name,
+    }
 
 
 # ── Stage resolution ───────────────────────────────────────────────────────────
@@ -397,9 +558,68 @@ async def _build_activity_options_for_place(state: dict) -> list[dict]:
 
 # ── Action determination ───────────────────────────────────────────────────────
 
+def _prefetch_targets(action: str | None, payload: dict | None, state: dict) -> list[Target]:
+    """
+    Caches the next turn will most likely read after this payload is shown:
+      show_destination_chips → area cards for the first PREFETCH_FANOUT destinations
+      show_area_cards        → place cards for the first areas
+      show_place_cards / show_activity_options → activity options for the first
+                               places not yet picked
+    Vibe cards are multi-select, so the next area_cards key can't be guessed.
+    """
+    payload = payload or {}
+    targets: list[Target] = []
+
+    if action == "show_destination_chips":
+        for dest in (payload.get("destinations") or [])[:PREFETCH_FANOUT]:
+            dest_state = {**state, "destination": dest.get("name", "")}
+            if dest_state["destination"]:
+                targets.append(("area_cards", area_cards_key(dest_state),
+                                lambda s=dest_state: fetch_area_cards(s)))
+
+    elif action == "show_area_cards":
+        snapshot = {**state, "area_cards": payload.get("areas") or []}
+        for area in snapshot["area_cards"][:PREFETCH_FANOUT]:
+            aid = area.get("id", "")
+            if aid:
+                targets.append(("place_cards", place_cards_key(snapshot, aid),
+                                lambda a=aid: fetch_place_cards(dict(snapshot), area_id=a)))
+
+    elif action in ("show_place_cards", "show_activity_options"):
+        if action == "show_place_cards":
+            places = payload.get("places") or []
+        else:
+            places = [p for cat in (state.get("place_cards") or []) for p in cat.get("places", [])]
+        picked = {state.get("selected_place"), *(state.get("pending_activities") or {})}
+        destination = state.get("destination", "")
+        area_id = (state.get("selected_areas") or [""])[0]
+        intent, trip_who = state.get("travel_intent"), state.get("trip_who")
+        for place in [p for p in places if p.get("id") and p.get("id") not in picked][:PREFETCH_FANOUT]:
+            pid, name = place["id"], place.get("name", place["id"])
+            targets.append(("activity_options", activity_options_key(destination, pid),
+                            lambda p=pid, n=name: build_activity_options(p, n, destination, area_id, intent, trip_who)))
+
+    return targets
+
+
 async def determine_action(stage: str, state: dict) -> tuple[str | None, dict | None]:
     """
     Given a stage, return (action, payload) to send to the frontend.
+
+    The user has acted, so speculative work queued for the previous payload is
+    dropped first; once this payload is ready the likely next stage is warmed
+    in the background (see stage_prefetch).
+    """
+    scope = state.get("thread_id") or ""
+    cancel_prefetch(scope)
+    action, payload = await _action_for_stage(stage, state)
+    prefetch(scope, _prefetch_targets(action, payload, state))
+    return action, payload
+
+
+async def _action_for_stage(stage: str, state: dict) -> tuple[str | None, dict | None]:
+    """
+    Given a stage, return (action, payload) to send to the frontend.
     Helper functions are stubs — filled in Sprint 2+.
     """
     if stage == "experience_type_unknown":
@@ -428,8 +648,7 @@ async def determine_action(stage: str, state: dict) -> tuple[str | None, dict |
     if stage == "areas_selected":
         all_categories: list[dict] = []
         seen_ids: set[str] = set()
-        for aid in state.get("selected_areas") or []:
-            cats = await fetch_place_cards(state, area_id=aid)
+        for cats in await _fetch_place_cards_for_areas(state, state.get("selected_areas") or []):
             for cat in cats:
                 deduped = [p for p in cat.get("places", []) if p.get("id") not in seen_ids]
                 for p in deduped:
@@ -661,13 +880,17 @@ async def fetch_destination_suggestions(state: dict) -> list[dict]:
     if not geocoded:
         return []
 
-    # Step 4: OSRM road filter — keep only ≤720 mins (12 hours)
+    # Step 4: OSRM road filter — keep only ≤720 mins (12 hours). A great-circle
+    # screen first drops candidates that cannot make it even on ideal roads.
     filtered: list[tuple[str, int, int, str]] = []  # (name, dist_km, dur_mins, travel_time)
 
     if origin and "lat" in origin:
-        times = await batch_driving_times(origin, [c for _, c in geocoded])
-        for (name, _), time_data in zip(geocoded, times):
-            if time_data and time_data["duration_mins"] <= 720:
+        reachable = [geocoded[i] for i in prefilter_reachable(origin, [c for _, c in geocoded], _MAX_DRIVE_MINS)]
+        if len(reachable) < len(geocoded):
+            logger.info(f"[destinations] pre-filter dropped {len(geocoded) - len(reachable)}/{len(geocoded)} candidates")
+        times = await batch_driving_times(origin, [c for _, c in reachable]) if reachable else []
+        for (name, _), time_data in zip(reachable, times):
+            if time_data and time_data["duration_mins"] <= _MAX_DRIVE_MINS:
                 filtered.append((name, time_data["distance_km"], time_data["duration_mins"], time_data["travel_time"]))
     else:
         # No origin coords — include all without distance data
@@ -687,7 +910,8 @@ async def fetch_destination_suggestions(state: dict) -> list[dict]:
 
     # Step 6: Google Places photos for all candidates
     GOOGLE_MAPS_KEY = os.getenv("GOOGLE_API_KEY", "")
-    photos_raw = await fetch_place_photos(names_filtered, GOOGLE_MAPS_KEY)
+    with span("google_photos", "destination_cards"):
+        photos_raw = await fetch_place_photos(names_filtered, GOOGLE_MAPS_KEY)
     photo_by_name = {p["name"]: p["url"] for p in photos_raw if isinstance(p, dict)}
 
     # Step 7: assemble cards
@@ -710,16 +934,24 @@ async def fetch_vibe_cards(state: dict) -> list[dict]:
 
     Branch B only — called when user typed destination directly with no experience_types.
     Falls back to BASE_VIBE_CARDS generic descriptions on Groq failure.
-    Cached by destination for 24h.
+    Cached by destination: fresh for 24h, then served stale for up to 7 days
+    while a background rebuild runs. Generic fallbacks are not cached.
     """
     destination = state.get("destination", "")
     if not destination:
         return [{**v} for v in BASE_VIBE_CARDS]
 
-    cache_key = f"vibe_cards:{destination.lower()}"
-    cached = await get_cached(cache_key)
+    cache_key = vibe_cards_key(destination)
+    snapshot = dict(state)
+    cached = await get_cached(cache_key, revalidate=lambda: _compute_vibe_cards(snapshot, cache_key))
     if cached is not None:
         return cached
+    return await _compute_vibe_cards(state, cache_key) or [{**v} for v in BASE_VIBE_CARDS]
+
+
+async def _compute_vibe_cards(state: dict, cache_key: str) -> list[dict] | None:
+    """Cache-miss / refresh path of fetch_vibe_cards. None when Groq gave no hooks."""
+    destination = state.get("destination", "")
 
     # Build context from already-fetched blog signals
     blog_ctx = ""
@@ -741,16 +973,18 @@ async def fetch_vibe_cards(state: dict) -> list[dict]:
         f'Return JSON only (no markdown):\n'
         f'{{"adv": "...", "loc": "...", "spt": "...", "hid": "..."}}'
     )
-    hooks = await _groq_json(prompt, max_tokens=300)
+    hooks = await _groq_json(prompt, max_tokens=300, call_site="vibe_hooks")
+    if not isinstance(hooks, dict):
+        return None
 
     cards = []
     for v in BASE_VIBE_CARDS:
         card = {**v}
-        if isinstance(hooks, dict) and v["id"] in hooks and hooks[v["id"]]:
+        if v["id"] in hooks and hooks[v["id"]]:
             card["description"] = str(hooks[v["id"]])[:70]
         cards.append(card)
 
-    await set_cached(cache_key, cards)
+    await set_cached(cache_key, cards, ttl=_VIBE_CARDS_TTL, hard_ttl=_VIBE_CARDS_HARD_TTL)
     return cards
 
 
@@ -762,22 +996,36 @@ async def fetch_area_cards(state: dict) -> list[dict]:
       2. Tavily enrichment per zone (parallel)
       3. Area generation with teaser+summary (Groq, one batch call)
       4. Photos (Google Places, parallel)
-    Cached by (destination, experience_type|vibe_ids) for 24h.
+    Cached by (destination, experience_type|vibe_ids): fresh for 24h, then served
+    stale for up to 7 days while a background rebuild runs. Concurrent misses
+    for the same key are coalesced into one pipeline run.
     """
     destination = state.get("destination", "")
     if not destination:
         return []
 
-    experience_types: list[str] = state.get("experience_types") or []
-    vibe_ids: list[str] = state.get("selected_vibe_ids") or []
-    exp_key = "|".join(sorted(experience_types)) if experience_types else "|".join(sorted(vibe_ids))
-    cache_key = f"area_cards:{destination.lower()}:{exp_key}"
+    cache_key = area_cards_key(state)
 
-    cached = await get_cached(cache_key)
+    snapshot = dict(state)
+    cached = await get_cached(cache_key, revalidate=lambda: _compute_area_cards(snapshot, cache_key))
     if cached is not None:
         state["area_cards"] = cached
         return cached
 
+    areas = await coalesce(
+        cache_key,
+        lambda: _compute_area_cards(state, cache_key),
+        reread=lambda: get_cached(cache_key),
+    )
+    state["area_cards"] = areas
+    return areas
+
+
+async def _compute_area_cards(state: dict, cache_key: str) -> list[dict]:
+    """Cache-miss path of fetch_area_cards. Does not mutate state — the result may be shared."""
+    destination = state.get("destination", "")
+    experience_types: list[str] = state.get("experience_types") or []
+    vibe_ids: list[str] = state.get("selected_vibe_ids") or []
     trip_season = state.get("trip_season") or "any season"
     trip_who = state.get("trip_who") or "travellers"
     interest_str = ", ".join(experience_types or vibe_ids) or "travel"
@@ -791,7 +1039,7 @@ async def fetch_area_cards(state: dict) -> list[dict]:
         f'Return JSON only (no markdown):\n'
         f'{{"tier": "flat", "zones": []}} or {{"tier": "zoned", "zones": ["North Goa", "South Goa"]}}'
     )
-    scale = await _groq_json(scale_prompt, max_tokens=150)
+    scale = await _groq_json(scale_prompt, max_tokens=150, call_site="area_scale")
     if not isinstance(scale, dict) or "tier" not in scale:
         scale = {"tier": "flat", "zones": []}
 
@@ -832,9 +1080,8 @@ async def fetch_area_cards(state: dict) -> list[dict]:
         f'Return a JSON array only (no markdown):\n'
         f'[{{"id":"...","name":"...","zone":"..." or null,"teaser":"...","summary":"...","tags":["..."]}}]'
     )
-    areas_raw = await _groq_json(area_prompt, max_tokens=1500)
+    areas_raw = await _groq_json(area_prompt, max_tokens=1500, call_site="area_cards")
     if not isinstance(areas_raw, list) or not areas_raw:
-        state["area_cards"] = []
         return []
 
     # Step 4: Photos (parallel)
@@ -843,7 +1090,8 @@ async def fetch_area_cards(state: dict) -> list[dict]:
         fetch_place_photos([a.get("name", "")], GOOGLE_API_KEY)
         for a in areas_raw
     ]
-    photo_raw = await asyncio.gather(*photo_tasks, return_exceptions=True)
+    with span("google_photos", "area_cards"):
+        photo_raw = await asyncio.gather(*photo_tasks, return_exceptions=True)
     photo_map: dict[int, str | None] = {}
     for idx, (a, pr) in enumerate(zip(areas_raw, photo_raw)):
         if isinstance(pr, list) and pr:
@@ -864,8 +1112,7 @@ async def fetch_area_cards(state: dict) -> list[dict]:
         for idx, a in enumerate(areas_raw)
     ]
 
-    state["area_cards"] = areas
-    await set_cached(cache_key, areas)
+    await set_cached(cache_key, areas, ttl=_AREA_CARDS_TTL, hard_ttl=_AREA_CARDS_HARD_TTL)
     return areas
 
 
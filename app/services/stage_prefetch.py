@@ -0,0 +1,136 @@
+"""
+app/services/stage_prefetch.py — Speculative warming of the next stage's cache.
+
+prefetch: start a round of speculative jobs for a thread, replacing its last round
+cancel_prefetch: drop a thread's queued speculative jobs (the user has acted)
+prefetch_stats: scheduled / warmed / skipped counters and remaining budget for /health
+
+The stage machine decides what to warm (see stage_machine._prefetch_targets):
+each target is (kind, cache_key, warm) where warm() runs the same fetch the
+next turn would run — fetch_area_cards, fetch_place_cards or
+build_activity_options — so the result lands under the key that turn reads.
+
+Jobs run on the job scheduler at PRIORITY_LOW. When a job starts it is skipped if
+  - its round was cancelled or replaced and it is not part of the new one,
+  - the key is already cached (fresh or stale), or
+  - the budget can't cover it.
+The budget is PREFETCH_BUDGET_PER_MIN Groq calls per minute for the whole
+process, refilled continuously; each kind is charged its Groq call count
+(PREFETCH_COSTS). Speculative work shares GROQ_RPM with foreground turns, so
+the default is a small slice of it.
+
+A job that has already started is left to finish. Its pipeline runs inside
+single_flight, so a foreground request for the same key joins it rather than
+starting over.
+"""
+import os
+import time
+from typing import Any, Awaitable, Callable
+
+from app.services.area_cache import is_cached
+from app.services.job_scheduler import PRIORITY_LOW, schedule
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PREFETCH_ENABLED = os.getenv("PREFETCH_ENABLED", "1") == "1"
+# Cards warmed per payload: the first N destinations / areas / places shown
+PREFETCH_FANOUT = int(os.getenv("PREFETCH_FANOUT", "2"))
+PREFETCH_BUDGET_PER_MIN = float(os.getenv("PREFETCH_BUDGET_PER_MIN", "8"))
+
+# Groq calls per pipeline: area_scale + area_cards; place_categories + one
+# place_hooks per category (3-4); activity_options
+PREFETCH_COSTS = {"area_cards": 2, "place_cards": 5, "activity_options": 1}
+
+Target = tuple[str, str, Callable[[], Awaitable[Any]]]
+
+
+class _Budget:
+    """Non-blocking token bucket: capacity per_minute, refilled over 60 s."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = max(per_minute, 0.0)
+        self.tokens = self.capacity
+        self.rate = self.capacity / 60.0
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_spend(self, amount: float) -> bool:
+        self._refill()
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return True
+        return False
+
+    def remaining(self) -> float:
+        self._refill()
+        return round(self.tokens, 2)
+
+
+_budget = _Budget(PREFETCH_BUDGET_PER_MIN)
+# thread scope → job keys of its current round that have not started yet
+_wanted: dict[str, set[str]] = {}
+_stats = {"scheduled": 0, "warmed": 0, "failed": 0, "cancelled": 0, "already_warm": 0, "over_budget": 0}
+
+
+def prefetch_stats() -> dict:
+    return {**_stats, "budget_remaining": _budget.remaining(), "pending_threads": len(_wanted)}
+
+
+def _release(scope: str, job_key: str) -> None:
+    keys = _wanted.get(scope)
+    if keys is None:
+        return
+    keys.discard(job_key)
+    if not keys:
+        _wanted.pop(scope, None)
+
+
+async def _run(scope: str, job_key: str, kind: str, cache_key: str, warm: Callable[[], Awaitable[Any]]) -> None:
+    if job_key not in _wanted.get(scope, ()):
+        _stats["cancelled"] += 1
+        return
+    _release(scope, job_key)
+    if await is_cached(cache_key):
+        _stats["already_warm"] += 1
+        return
+    if not _budget.try_spend(PREFETCH_COSTS.get(kind, 1)):
+        _stats["over_budget"] += 1
+        logger.info(f"[prefetch] over budget, skipped: {cache_key}")
+        return
+    try:
+        await warm()
+        _stats["warmed"] += 1
+        logger.info(f"[prefetch] warmed: {cache_key}")
+    except Exception as e:
+        _stats["failed"] += 1
+        logger.warning(f"[prefetch] {cache_key} failed: {e}")
+
+
+def cancel_prefetch(scope: str) -> None:
+    """Drop the thread's speculative jobs that have not started yet."""
+    dropped = _wanted.pop(scope, None)
+    if dropped:
+        logger.info(f"[prefetch] cancelled {len(dropped)} job(s) for thread {scope or '-'}")
+
+
+def prefetch(scope: str, targets: list[Target]) -> int:
+    """Replace the thread's round with these targets. Returns how many were queued."""
+    cancel_prefetch(scope)
+    if not PREFETCH_ENABLED or not targets:
+        return 0
+    keys = _wanted.setdefault(scope, set())
+    queued = 0
+    for kind, cache_key, warm in targets:
+        job_key = f"prefetch:{scope}:{cache_key}"
+        keys.add(job_key)
+        # An already queued job for this key is deduped and runs as part of this round
+        if schedule(job_key, lambda k=job_key, kd=kind, ck=cache_key, w=warm: _run(scope, k, kd, ck, w),
+                    priority=PRIORITY_LOW):
+            queued += 1
+    _stats["scheduled"] += queued
+    return queued
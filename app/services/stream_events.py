@@ -0,0 +1,46 @@
+"""
+app/services/stream_events.py — Per-request event channel for /chat/stream.
+
+bind_stream: attach an asyncio.Queue to the current request context
+unbind_stream: detach it again
+emit: push (event, data) onto the bound queue — a no-op outside /chat/stream
+
+The queue lives in a ContextVar, so graph nodes and services can emit from
+anywhere below the request (LangGraph runs nodes in child tasks, which copy
+the context) without threading a handle through GraphState. Plain /chat
+requests never bind a queue, so emit costs one ContextVar lookup there.
+
+Events emitted today:
+  node    — a LangGraph node finished ({"node", "keys", "ms"})
+  action  — determine_action resolved ({"action", "payload", "stage"})
+  place_category — one category of place cards is ready ({"area", "label", "places"})
+  token   — a chunk of responder text ({"text"})
+  done    — the full ChatResponse
+  error   — the turn failed ({"detail"})
+"""
+import asyncio
+from contextvars import ContextVar, Token
+from typing import Any
+
+_sink: ContextVar[asyncio.Queue | None] = ContextVar("roammate_stream_sink", default=None)
+
+
+def bind_stream(queue: asyncio.Queue) -> Token:
+    """Route emit() calls in this context (and tasks spawned from it) to queue."""
+    return _sink.set(queue)
+
+
+def unbind_stream(token: Token) -> None:
+    _sink.reset(token)
+
+
+def is_streaming() -> bool:
+    """True when the current request is a /chat/stream request."""
+    return _sink.get() is not None
+
+
+def emit(event: str, data: Any) -> None:
+    """Queue an SSE event for the current request. Never blocks, never raises."""
+    queue = _sink.get()
+    if queue is not None:
+        queue.put_nowait((event, data))
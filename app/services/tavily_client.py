@@ -3,10 +3,11 @@ app/services/tavily_client.py — Shared Tavily search client.
 
 Used by blog_signals.py and stage_machine.py.
 """
-import aiohttp
 import os
 from typing import Any
 
+from app.services.http_client import http_session
+from app.services.tracing import traced
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -15,6 +16,7 @@ TAVILY_API_KEY = os.getenv("TAVILY_API_KEY", "")
 TAVILY_URL = "https://api.tavily.com/search"
 
 
+@traced("tavily", "search")
 async def tavily_search(query: str, max_results: int = 5) -> list[dict[str, Any]]:
     """Call Tavily search API and return raw results. Returns [] on any failure."""
     if not TAVILY_API_KEY:
@@ -29,7 +31,7 @@ async def tavily_search(query: str, max_results: int = 5) -> list[dict[str, Any]
     }
     logger.info(f"[Tavily] → '{query}'")
     try:
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.post(TAVILY_URL, json=payload) as r:
                 data = await r.json()
                 results = data.get("results", [])
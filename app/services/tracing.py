@@ -0,0 +1,213 @@
+"""
+app/services/tracing.py — Latency tracing and Prometheus metrics.
+
+span: context manager timing one node or external call
+traced: decorator form of span for async functions
+traced_node: wrap a LangGraph node (used by graph/builder.py)
+record_cache: count an area_cache lookup as hit / stale / miss
+start_turn / end_turn: collect every span recorded during one /chat turn
+turn_summary: one-line per-turn breakdown appended to tool_events
+render_metrics: Prometheus text exposition for GET /metrics
+
+Metrics live in-process (one registry per worker) and are rendered in the
+Prometheus text format directly, so no client library is needed.
+"""
+import functools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Awaitable, Callable, Iterator
+
+_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class _Histogram:
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...]):
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+        # labels → [per-bucket counts..., +Inf count], sum
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.setdefault(labels, [[0] * (len(_BUCKETS) + 1), 0.0])
+        counts = series[0]
+        for i, bound in enumerate(_BUCKETS):
+            if value <= bound:
+                counts[i] += 1
+        counts[-1] += 1
+        series[1] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total) in sorted(self._series.items()):
+            base = _label_str(self.labelnames, labels)
+            for bound, count in zip(_BUCKETS, counts):
+                lines.append(f'{self.name}_bucket{{{base}le="{bound}"}} {count}')
+            lines.append(f'{self.name}_bucket{{{base}le="+Inf"}} {counts[-1]}')
+            lines.append(f"{self.name}_sum{{{base.rstrip(',')}}} {total:.6f}")
+            lines.append(f"{self.name}_count{{{base.rstrip(',')}}} {counts[-1]}")
+        return lines
+
+
+class _Gauge:
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._value = 0.0
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge", f"{self.name} {self._value:g}"]
+
+
+class _Counter:
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...]):
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+        self._series: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._series[labels] = self._series.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._series.get(labels, 0)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self._series.items()):
+            lines.append(f"{self.name}{{{_label_str(self.labelnames, labels).rstrip(',')}}} {value:g}")
+        return lines
+
+
+def _label_str(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    def esc(v: str) -> str:
+        return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+    return "".join(f'{n}="{esc(v)}",' for n, v in zip(names, values))
+
+
+NODE_SECONDS = _Histogram(
+    "roammate_node_duration_seconds", "LangGraph node latency.", ("node",)
+)
+EXTERNAL_SECONDS = _Histogram(
+    "roammate_external_call_duration_seconds", "External call latency.", ("service", "op")
+)
+EXTERNAL_ERRORS = _Counter(
+    "roammate_external_call_errors_total", "External calls that raised.", ("service", "op")
+)
+CACHE_LOOKUPS = _Counter(
+    "roammate_cache_lookups_total", "Cache lookups by result.", ("cache", "result")
+)
+TURN_SECONDS = _Histogram(
+    "roammate_turn_duration_seconds", "End-to-end /chat turn latency.", ("endpoint",)
+)
+JOB_QUEUE_DEPTH = _Gauge(
+    "roammate_job_queue_depth", "Background jobs waiting for a worker."
+)
+JOB_WAIT_SECONDS = _Histogram(
+    "roammate_job_wait_seconds", "Background job time spent queued.", ("job",)
+)
+JOB_SECONDS = _Histogram(
+    "roammate_job_duration_seconds", "Background job run time.", ("job",)
+)
+JOB_RESULTS = _Counter(
+    "roammate_jobs_total", "Background jobs by outcome.", ("job", "result")
+)
+
+_METRICS = (
+    TURN_SECONDS, NODE_SECONDS, EXTERNAL_SECONDS, EXTERNAL_ERRORS, CACHE_LOOKUPS,
+    JOB_QUEUE_DEPTH, JOB_WAIT_SECONDS, JOB_SECONDS, JOB_RESULTS,
+)
+
+# Spans recorded during the current turn: [(kind, name, seconds)]
+_turn: ContextVar[list | None] = ContextVar("roammate_turn_spans", default=None)
+
+
+def observe(service: str, op: str, seconds: float, error: bool = False) -> None:
+    """Record one completed call. service == "node" goes to the node histogram."""
+    if service == "node":
+        NODE_SECONDS.observe(seconds, op)
+    else:
+        EXTERNAL_SECONDS.observe(seconds, service, op)
+        if error:
+            EXTERNAL_ERRORS.inc(service, op)
+    spans = _turn.get()
+    if spans is not None:
+        spans.append((service, op, seconds))
+
+
+@contextmanager
+def span(service: str, op: str = "") -> Iterator[None]:
+    """Time the enclosed block. Exceptions are counted and re-raised."""
+    start = time.perf_counter()
+    error = False
+    try:
+        yield
+    except Exception:
+        error = True
+        raise
+    finally:
+        observe(service, op, time.perf_counter() - start, error)
+
+
+def traced(service: str, op: str = "") -> Callable:
+    """Decorator: time every call of an async function as service/op."""
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            with span(service, op or fn.__name__):
+                return await fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def traced_node(name: str, fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Wrap a LangGraph node so its latency lands in roammate_node_duration_seconds."""
+    @functools.wraps(fn)
+    async def wrapper(state):
+        with span("node", name):
+            return await fn(state)
+    return wrapper
+
+
+def record_cache(cache: str, result: str) -> None:
+    """result: "hit", "stale" or "miss"."""
+    CACHE_LOOKUPS.inc(cache, result)
+
+
+def start_turn() -> Token:
+    """Begin collecting spans for this request (child tasks share the list)."""
+    return _turn.set([])
+
+
+def end_turn(token: Token) -> list[tuple[str, str, float]]:
+    """Stop collecting and return the spans recorded since start_turn."""
+    spans = _turn.get() or []
+    _turn.reset(token)
+    return spans
+
+
+def turn_summary(spans: list[tuple[str, str, float]], total_s: float) -> str:
+    """
+    "[timing] total=3210ms | node:responder=1830ms | groq:responder=1650ms | tavily:tavily_search=820ms×3"
+    Grouped by service/op, slowest first. Parallel calls are summed, so a group
+    can exceed the wall-clock total.
+    """
+    groups: dict[str, list[float]] = {}
+    for service, op, seconds in spans:
+        groups.setdefault(f"{service}:{op}" if op else service, []).append(seconds)
+    parts = []
+    for label, values in sorted(groups.items(), key=lambda kv: -sum(kv[1])):
+        count = f"×{len(values)}" if len(values) > 1 else ""
+        parts.append(f"{label}={sum(values) * 1000:.0f}ms{count}")
+    return " | ".join([f"[timing] total={total_s * 1000:.0f}ms"] + parts)
+
+
+def render_metrics() -> str:
+    lines: list[str] = []
+    for metric in _METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
@@ -6,6 +6,9 @@ Provides a unified interface for nodes to call any registered tool.
 import os
 from typing import Any, Dict
 
+import aiohttp
+
+from app.services.http_client import http_session
 from app.tools.registry import call_tool, MCP_URLS
 from app.utils.logger import get_logger
 
@@ -25,13 +28,13 @@ class MCPClient:
 
     async def health_check(self) -> Dict[str, bool]:
         """Ping each registered MCP server."""
-        import httpx
         statuses: Dict[str, bool] = {}
-        async with httpx.AsyncClient(timeout=5.0) as client:
+        async with http_session() as session:
             for name, url in MCP_URLS.items():
                 try:
-                    r = await client.get(url)
-                    statuses[name] = r.status_code < 500
+                    # SSE endpoints stream forever — the status line is all we need
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as r:
+                        statuses[name] = r.status < 500
                 except Exception:
                     statuses[name] = False
         logger.info(f"MCP health: {statuses}")
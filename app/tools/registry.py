@@ -6,8 +6,10 @@ URLs loaded from environment variables.
 import os
 from typing import Any, Dict
 
-import httpx
+import aiohttp
 
+from app.services.http_client import http_session
+from app.services.tracing import span
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -35,16 +37,17 @@ async def call_tool(server: str, tool_name: str, args: Dict[str, Any]) -> Any:
     payload = {"tool": tool_name, "arguments": args}
 
     logger.info(f"[MCP] → {server}/{tool_name} | args={args}")
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(invoke_url, json=payload)
-            response.raise_for_status()
-            data = response.json()
-            logger.info(f"[MCP] ✓ {server}/{tool_name} | {len(str(data))} chars returned")
-            return data
-    except httpx.HTTPStatusError as e:
-        logger.error(f"[MCP] ✗ {server}/{tool_name}: HTTP {e.response.status_code}")
-        raise
-    except Exception as e:
-        logger.error(f"[MCP] ✗ {server}/{tool_name}: {e}")
-        raise
+    with span("mcp", f"{server}/{tool_name}"):
+        try:
+            async with http_session() as session:
+                async with session.post(invoke_url, json=payload, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
+                logger.info(f"[MCP] ✓ {server}/{tool_name} | {len(str(data))} chars returned")
+                return data
+        except aiohttp.ClientResponseError as e:
+            logger.error(f"[MCP] ✗ {server}/{tool_name}: HTTP {e.status}")
+            raise
+        except Exception as e:
+            logger.error(f"[MCP] ✗ {server}/{tool_name}: {e}")
+            raise
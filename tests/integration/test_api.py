@@ -20,3 +20,34 @@ async def test_health_endpoint():
         r = await client.get("/health")
         assert r.status_code == 200
         assert r.json()["status"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_emits_node_action_and_done_events():
+    import json
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock, patch
+    from app.api.server import app
+    from app.services.stream_events import emit
+
+    final_state = {"response": "Goa it is!", "messages": [], "phase": "planning", "action": "show_area_cards"}
+
+    class FakeGraph:
+        async def astream(self, state_input, config=None, stream_mode=None):
+            yield {"detect_intent": {"destination": "Goa"}}
+            emit("action", {"action": "show_area_cards", "payload": {}, "stage": "destination_known"})
+            yield {"responder": {"response": "Goa it is!"}}
+
+        async def aget_state(self, config):
+            return SimpleNamespace(values=final_state)
+
+    app.state.graph = FakeGraph()
+    with patch("app.api.server.fetch_place_photos", new_callable=AsyncMock, return_value=[]), \
+         patch("app.api.server.save_conversation"):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            r = await client.post("/chat/stream", json={"message": "Goa", "thread_id": "t-stream"})
+    assert r.status_code == 200
+    events = [line.split(":", 1)[1].strip() for line in r.text.splitlines() if line.startswith("event:")]
+    assert events == ["node", "action", "node", "done"]
+    done = [line for line in r.text.splitlines() if line.startswith("data:")][-1]
+    assert json.loads(done.split(":", 1)[1])["response"] == "Goa it is!"
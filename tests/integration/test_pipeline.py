@@ -159,8 +159,8 @@ async def test_full_pipeline_to_day_planner():
          patch("app.services.area_cache.set_cached", new_callable=AsyncMock), \
          patch("app.services.day_planner._groq_post", side_effect=groq_post_mock), \
          patch("app.services.day_planner.tavily_search", new_callable=AsyncMock, return_value=[]), \
-         patch("app.services.day_planner.get_cached", new_callable=AsyncMock, return_value=None), \
-         patch("app.graph.nodes.responder.aiohttp.ClientSession", _fixed_session(_RESPONDER_TEXT)), \
+         patch("app.services.day_planner.get_many_cached", new_callable=AsyncMock, return_value=[]), \
+         patch("app.services.http_client.aiohttp.ClientSession", _fixed_session(_RESPONDER_TEXT)), \
          patch("app.utils.place_photos.fetch_place_photos", new_callable=AsyncMock, return_value=[]), \
          patch("app.api.server.fetch_place_photos", new_callable=AsyncMock, return_value=[]), \
          patch("app.services.stage_machine.fetch_area_cards",
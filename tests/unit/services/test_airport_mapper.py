@@ -0,0 +1,117 @@
+"""Unit tests for the grid-indexed AirportMapper."""
+import csv
+import os
+import random
+
+import pytest
+
+_FIELDS = ["ident", "type", "name", "latitude_deg", "longitude_deg", "iso_country",
+           "municipality", "iata_code", "country_name"]
+
+_AIRPORTS = [
+    ("VABB", "large_airport", "Chhatrapati Shivaji Maharaj Intl", 19.0887, 72.8679, "IN", "Mumbai", "BOM", "India"),
+    ("VAPO", "medium_airport", "Pune Airport", 18.5821, 73.9197, "IN", "Pune", "PNQ", "India"),
+    ("VANM", "large_airport", "Navi Mumbai Intl", 18.9920, 73.0700, "IN", "Navi Mumbai", "NMI", "India"),
+    ("VOGO", "large_airport", "Goa Intl", 15.3808, 73.8314, "IN", "Goa", "GOI", "India"),
+    ("VASD", "small_airport", "Shirdi Airport", 19.6886, 74.3789, "IN", "Shirdi", "SAG", "India"),
+    ("VILH", "medium_airport", "Leh Kushok Bakula Rimpochee", 34.1359, 77.5465, "IN", "Leh", "IXL", "India"),
+    ("NZAA", "large_airport", "Auckland Airport", -37.0082, 174.7850, "NZ", "Auckland", "AKL", "New Zealand"),
+    ("NFFN", "large_airport", "Nadi Intl", -17.7554, 177.4430, "FJ", "Nadi", "NAN", "Fiji"),
+    ("XHEL", "heliport", "Some Heliport", 19.10, 72.90, "IN", "Mumbai", "", "India"),
+    ("XBAD", "small_airport", "No coords", 0, 0, "IN", "", "", "India"),
+]
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(_FIELDS)
+        writer.writerows(rows)
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "world-airports.csv"
+    _write_csv(path, _AIRPORTS)
+    return str(path)
+
+
+def test_loads_only_typed_airports_with_coordinates(csv_path):
+    from app.services.airport_mapper import AirportMapper
+    assert len(AirportMapper(csv_path)) == 8
+
+
+def test_find_nearest_respects_type_radius_and_order(csv_path):
+    from app.services.airport_mapper import AirportMapper
+    mapper = AirportMapper(csv_path)
+    result = mapper.find_nearest(19.0760, 72.8777)
+    # Pune (~120 km) is outside the 100 km medium-airport radius
+    assert [a.iata_code for a in result] == ["BOM", "NMI"]
+    assert result[0].distance_km == pytest.approx(1.7, abs=0.2)
+
+
+def test_find_for_destination_falls_back_to_expanded_search(csv_path):
+    from app.services.airport_mapper import AirportMapper
+    mapper = AirportMapper(csv_path)
+    # Kargil: nothing within type radius; Leh (~190 km) appears in the 300 km search
+    result = mapper.find_for_destination(34.5539, 76.1349)
+    assert result.primary_airport == "IXL"
+
+
+def test_queries_across_the_antimeridian(csv_path):
+    from app.services.airport_mapper import AirportMapper
+    mapper = AirportMapper(csv_path)
+    # Nadi sits at 177.4°E; a point at 179.9°W is ~280 km east across the date line
+    assert [a.iata_code for a in mapper._expanded_search(-17.7, -179.9, 3)] == ["NAN"]
+    assert [a.iata_code for a in mapper._expanded_search(-17.7, 170.0, 3)] == []
+
+
+def test_get_for_city(csv_path):
+    from app.services.airport_mapper import AirportMapper
+    mapper = AirportMapper(csv_path)
+    assert [a.iata_code for a in mapper.get_for_city("pune", "INDIA")] == ["PNQ"]
+
+
+def test_snapshot_is_reused_and_invalidated_by_newer_csv(csv_path):
+    from app.services.airport_mapper import AirportMapper
+    AirportMapper(csv_path)
+    snapshot = f"{csv_path}.npz"
+    assert os.path.exists(snapshot)
+
+    # Snapshot newer than the CSV → the CSV is not parsed again
+    os.utime(csv_path, (1, 1))
+    _write_csv(csv_path, _AIRPORTS[:1])
+    os.utime(csv_path, (1, 1))
+    assert len(AirportMapper(csv_path)) == 8
+
+    # CSV touched after the snapshot → reparsed
+    os.utime(csv_path, None)
+    os.utime(snapshot, (1, 1))
+    assert len(AirportMapper(csv_path)) == 1
+
+
+def test_matches_brute_force_scan(tmp_path):
+    """Grid + vectorised search returns exactly what the full-scan version did."""
+    from app.services.airport_mapper import AirportMapper, haversine_distance, _TYPES
+
+    rng = random.Random(7)
+    rows = [
+        (f"X{i}", rng.choice(_TYPES), f"Airport {i}", round(rng.uniform(5, 35), 4),
+         round(rng.uniform(68, 90), 4), "IN", f"City {i % 50}", f"A{i:03d}", "India")
+        for i in range(600)
+    ]
+    path = tmp_path / "airports.csv"
+    _write_csv(path, rows)
+    mapper = AirportMapper(str(path))
+
+    limits = {"large_airport": 150, "medium_airport": 100, "small_airport": 50}
+    for _ in range(50):
+        lat, lon = rng.uniform(5, 35), rng.uniform(68, 90)
+        brute = []
+        for r in rows:
+            d = haversine_distance(lat, lon, r[3], r[4])
+            if r[1] in ("large_airport", "medium_airport") and d <= limits[r[1]]:
+                brute.append((round(d, 1), r[7]))
+        brute.sort(key=lambda x: x[0])
+        got = [(a.distance_km, a.iata_code) for a in mapper.find_nearest(lat, lon, max_results=5)]
+        assert got == brute[:5]
@@ -0,0 +1,104 @@
+"""Unit tests for the offline cache warmer."""
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+
+_AREAS = [{"id": "vagator", "name": "Vagator"}, {"id": "anjuna", "name": "Anjuna"}]
+_PLACES = [{"label": "Things to Do", "places": [{"id": "chapora_fort", "name": "Chapora Fort"},
+                                                 {"id": "thalassa", "name": "Thalassa"}]}]
+
+
+def _patched(cached=lambda key: True, area_cards=None):
+    from app.services import cache_warmer
+    return (
+        patch.object(cache_warmer, "fetch_vibe_cards", new_callable=AsyncMock, return_value=[]),
+        patch.object(cache_warmer, "fetch_area_cards", new_callable=AsyncMock,
+                     side_effect=area_cards or (lambda state: _AREAS)),
+        patch.object(cache_warmer, "fetch_place_cards", new_callable=AsyncMock, return_value=_PLACES),
+        patch.object(cache_warmer, "build_activity_options", new_callable=AsyncMock, return_value=[]),
+        patch.object(cache_warmer, "is_cached", new_callable=AsyncMock, side_effect=cached),
+    )
+
+
+@pytest.mark.asyncio
+async def test_warm_drives_every_stage_with_a_synthetic_state(tmp_path):
+    from app.services import cache_warmer
+    checkpoint = str(tmp_path / "warm.json")
+    patches = _patched()
+    with patches[0] as v, patches[1] as a, patches[2] as p, patches[3] as act, patches[4]:
+        report = await cache_warmer.warm(["Goa"], ["beach_coast"], areas=1, places=1, checkpoint_path=checkpoint)
+    v.assert_awaited_once_with({"destination": "Goa"})
+    state = a.await_args.args[0]
+    assert state["experience_types"] == ["beach_coast"]
+    assert state["travel_intent"].destination.city == "Goa"
+    assert [c.kwargs["area_id"] for c in p.await_args_list] == ["vagator"]
+    assert act.await_args.args[:4] == ("chapora_fort", "Chapora Fort", "Goa", "vagator")
+    assert report["units"] == {"planned": 2, "done": 2, "resumed": 0, "failed": 0, "skipped_budget": 0}
+    assert report["coverage"]["place_cards"] == {"cached": 1, "targeted": 1}
+    units = json.loads(open(checkpoint).read())["units"]
+    assert units["goa|beach_coast"] == [
+        "area_cards:goa:beach_coast", "place_cards:goa:vagator:beach_coast", "activity_options:goa:chapora_fort",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rerun_resumes_and_retries_only_failed_units(tmp_path):
+    from app.services import cache_warmer
+    checkpoint = str(tmp_path / "warm.json")
+
+    def flaky(state):
+        if state["experience_types"] == ["hills_nature"]:
+            raise RuntimeError("groq 503")
+        return _AREAS
+    patches = _patched(cached=lambda key: "hills" not in key, area_cards=flaky)
+    with patches[0], patches[1], patches[2], patches[3], patches[4]:
+        first = await cache_warmer.warm(["Goa"], ["beach_coast", "hills_nature"], checkpoint_path=checkpoint)
+    assert first["units"]["done"] == 2 and first["units"]["failed"] == 1
+
+    patches = _patched()
+    with patches[0] as v, patches[1] as a, patches[2], patches[3], patches[4]:
+        second = await cache_warmer.warm(["Goa"], ["beach_coast", "hills_nature"], checkpoint_path=checkpoint)
+    v.assert_not_called()
+    assert [c.args[0]["experience_types"] for c in a.await_args_list] == [["hills_nature"]]
+    assert second["units"] == {"planned": 3, "done": 1, "resumed": 2, "failed": 0, "skipped_budget": 0}
+    # Coverage spans the whole plan, including units finished by the first run
+    assert second["coverage"]["area_cards"] == {"cached": 2, "targeted": 2}
+
+
+@pytest.mark.asyncio
+async def test_unit_whose_cards_were_not_cached_is_failed_and_retried(tmp_path):
+    from app.services import cache_warmer
+    checkpoint = str(tmp_path / "warm.json")
+    # Groq failed: fetch_area_cards returns [] without raising and caches nothing
+    patches = _patched(cached=lambda key: not key.startswith("area_cards:"), area_cards=lambda state: [])
+    with patches[0], patches[1], patches[2], patches[3], patches[4]:
+        report = await cache_warmer.warm(["Goa"], ["beach_coast"], checkpoint_path=checkpoint)
+    assert report["units"]["done"] == 1 and report["units"]["failed"] == 1
+    assert list(json.loads(open(checkpoint).read())["units"]) == ["vibe:goa"]
+
+
+@pytest.mark.asyncio
+async def test_groq_budget_stops_new_units(tmp_path):
+    from app.services import cache_warmer
+    patches = _patched()
+    with patches[0] as v, patches[1], patches[2], patches[3], patches[4]:
+        report = await cache_warmer.warm(
+            ["Goa", "Coorg"], ["beach_coast"], max_groq_calls=0, checkpoint_path=str(tmp_path / "w.json"),
+        )
+    v.assert_not_called()
+    assert report["units"]["skipped_budget"] == 4
+    assert "skipped (Groq budget)" in cache_warmer.format_report(report)
+
+
+def test_cli_reads_destinations_file(tmp_path):
+    from app.services.cache_warmer import _parse_args
+    path = tmp_path / "popular.txt"
+    path.write_text("Goa\n# coastal\n\nGokarna\n")
+    args = _parse_args(["--destinations", "Coorg", "--destinations-file", str(path),
+                        "--experience-types", "hills_nature"])
+    assert args.destinations == ["Coorg", "Goa", "Gokarna"]
+    assert args.experience_types == ["hills_nature"]
+    with pytest.raises(SystemExit):
+        _parse_args(["--experience-types", "beach_coast"])
@@ -1,4 +1,6 @@
 """Unit tests for geo_utils."""
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from app.services.geo_utils import batch_driving_times
@@ -160,13 +162,88 @@ async def test_batch_driving_times_returns_in_order():
             return {"distance_km": 150, "duration_mins": 180, "travel_time": "3h"}
         return {"distance_km": 400, "duration_mins": 480, "travel_time": "8h"}
 
-    with patch("app.services.geo_utils.driving_time", side_effect=mock_driving_time):
+    with patch("app.services.geo_utils._osrm_table", new=AsyncMock(return_value=None)), \
+         patch("app.services.geo_utils._get_cached_routes", new=AsyncMock(return_value=[None, None])), \
+         patch("app.services.geo_utils._set_cached_routes", new=AsyncMock()), \
+         patch("app.services.geo_utils.driving_time", side_effect=mock_driving_time):
         results = await batch_driving_times(origin, [dest1, dest2])
 
     assert results[0]["distance_km"] == 150
     assert results[1]["distance_km"] == 400
 
 
+def _table_session(payload: dict):
+    mock_response = MagicMock()
+    mock_response.json = AsyncMock(return_value=payload)
+    mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+    mock_response.__aexit__ = AsyncMock(return_value=None)
+    mock_session = MagicMock()
+    mock_session.get = MagicMock(return_value=mock_response)
+    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_session.__aexit__ = AsyncMock(return_value=None)
+    return mock_session
+
+
+@pytest.mark.asyncio
+async def test_osrm_table_parses_one_row_matrix():
+    from app.services.geo_utils import _osrm_table
+    payload = {"code": "Ok", "durations": [[19800, None]], "distances": [[263000, None]]}
+    session = _table_session(payload)
+    with patch("aiohttp.ClientSession", return_value=session):
+        rows = await _osrm_table({"lat": 19.076, "lng": 72.877}, [{"lat": 17.685, "lng": 73.609}, {"lat": 0, "lng": 0}])
+    assert rows == [{"distance_km": 263, "duration_mins": 330, "travel_time": "5h 30min"}, None]
+    url = session.get.call_args[0][0]
+    assert url.endswith("/table/v1/driving/72.877,19.076;73.609,17.685;0,0")
+    assert session.get.call_args[1]["params"]["sources"] == "0"
+
+
+@pytest.mark.asyncio
+async def test_batch_driving_times_chunks_table_requests():
+    from app.services import geo_utils
+    origin = {"lat": 19.076, "lng": 72.877}
+    dests = [{"lat": 18 + i / 10, "lng": 73.0} for i in range(5)]
+
+    async def fake_table(o, chunk):
+        return [{"distance_km": 1, "duration_mins": 60, "travel_time": "1h"} for _ in chunk]
+
+    with patch.object(geo_utils, "OSRM_TABLE_CHUNK", 2), \
+         patch.object(geo_utils, "_get_cached_routes", new=AsyncMock(return_value=[None] * 5)), \
+         patch.object(geo_utils, "_set_cached_routes", new=AsyncMock()) as mock_set, \
+         patch.object(geo_utils, "_osrm_table", side_effect=fake_table) as mock_table, \
+         patch.object(geo_utils, "driving_time", new=AsyncMock()) as mock_route:
+        results = await geo_utils.batch_driving_times(origin, dests)
+
+    assert [len(c.args[1]) for c in mock_table.call_args_list] == [2, 2, 1]
+    assert all(r["duration_mins"] == 60 for r in results)
+    mock_route.assert_not_called()
+    assert len(mock_set.call_args[0][0]) == 5
+
+
+@pytest.mark.asyncio
+async def test_batch_driving_times_serves_cached_cells_without_network():
+    from app.services import geo_utils
+    origin = {"lat": 19.076, "lng": 72.877}
+    dests = [{"lat": 18.52, "lng": 73.85}, {"lat": 17.69, "lng": 75.91}]
+    cached = {"distance_km": 150, "duration_mins": 180, "travel_time": "3h"}
+    fresh = {"distance_km": 400, "duration_mins": 480, "travel_time": "8h"}
+
+    with patch.object(geo_utils, "_get_cached_routes", new=AsyncMock(return_value=[cached, None])), \
+         patch.object(geo_utils, "_set_cached_routes", new=AsyncMock()) as mock_set, \
+         patch.object(geo_utils, "_osrm_table", new=AsyncMock(return_value=[fresh])) as mock_table:
+        results = await geo_utils.batch_driving_times(origin, dests)
+
+    assert results == [cached, fresh]
+    assert mock_table.call_args[0][1] == [dests[1]]
+    assert list(mock_set.call_args[0][0].values()) == [fresh]
+
+
+def test_route_cache_key_snaps_nearby_points_to_one_cell():
+    from app.services.geo_utils import _route_cache_key
+    a = _route_cache_key({"lat": 19.0761, "lng": 72.8774}, {"lat": 18.5204, "lng": 73.8567})
+    b = _route_cache_key({"lat": 19.0758, "lng": 72.8779}, {"lat": 18.5201, "lng": 73.8569})
+    assert a == b == "osrm:19.0800,72.8800:18.5200,73.8600"
+
+
 @pytest.mark.asyncio
 async def test_batch_driving_times_returns_none_for_failed_destination():
     origin = {"lat": 19.076, "lng": 72.877}
@@ -178,8 +255,106 @@ async def test_batch_driving_times_returns_none_for_failed_destination():
             raise ValueError("OSRM unreachable")
         return {"distance_km": 150, "duration_mins": 180, "travel_time": "3h"}
 
-    with patch("app.services.geo_utils.driving_time", side_effect=mock_driving_time):
+    with patch("app.services.geo_utils._osrm_table", new=AsyncMock(return_value=None)), \
+         patch("app.services.geo_utils._get_cached_routes", new=AsyncMock(return_value=[None, None])), \
+         patch("app.services.geo_utils._set_cached_routes", new=AsyncMock()), \
+         patch("app.services.geo_utils.driving_time", side_effect=mock_driving_time):
         results = await batch_driving_times(origin, [dest1, dest2])
 
     assert results[0]["distance_km"] == 150
     assert results[1] is None
+
+
+# ── geocode cache / gazetteer ─────────────────────────────────────────────────
+
+def test_normalize_place_name():
+    from app.services.geocode_cache import normalize_place_name
+    assert normalize_place_name("  Lonavala, India ") == "lonavala"
+    assert normalize_place_name("McLeod-Ganj") == "mcleod ganj"
+    assert normalize_place_name("") == ""
+
+
+@pytest.mark.asyncio
+async def test_geocode_answers_gazetteer_names_without_network():
+    from app.services import geo_utils
+    with patch.object(geo_utils, "get_cached_geocode", new=AsyncMock()) as mock_cache, \
+         patch.object(geo_utils, "_nominatim_search", new=AsyncMock()) as mock_remote:
+        assert await geo_utils.geocode("Bangalore") == {"lat": 12.9716, "lng": 77.5946}
+        assert await geo_utils.geocode("Manali, Himachal Pradesh") == {"lat": 32.2432, "lng": 77.1892}
+    mock_cache.assert_not_called()
+    mock_remote.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_geocode_uses_redis_cache_including_negatives():
+    from app.services import geo_utils
+    with patch.object(geo_utils, "get_cached_geocode",
+                      new=AsyncMock(side_effect=[(True, {"lat": 1.0, "lng": 2.0}), (True, None)])), \
+         patch.object(geo_utils, "_nominatim_search", new=AsyncMock()) as mock_remote:
+        assert await geo_utils.geocode("Tiny Hamlet") == {"lat": 1.0, "lng": 2.0}
+        assert await geo_utils.geocode("Made Up Place") is None
+    mock_remote.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_geocode_caches_definitive_nominatim_answers_only():
+    from app.services import geo_utils
+    with patch.object(geo_utils, "get_cached_geocode", new=AsyncMock(return_value=(False, None))), \
+         patch.object(geo_utils, "set_cached_geocode", new=AsyncMock()) as mock_set, \
+         patch.object(geo_utils, "_nominatim_search",
+                      new=AsyncMock(side_effect=[(None, True), (None, False)])):
+        assert await geo_utils.geocode("Nowhere Town") is None
+        assert await geo_utils.geocode("Flaky Town") is None
+    mock_set.assert_awaited_once_with("nowhere town", None)
+
+
+@pytest.mark.asyncio
+async def test_nominatim_slot_spaces_requests():
+    import time
+    from app.services import geocode_cache
+    stamps: list[float] = []
+
+    async def hit():
+        async with geocode_cache.nominatim_slot():
+            stamps.append(time.monotonic())
+
+    with patch.object(geocode_cache, "NOMINATIM_MIN_INTERVAL", 0.05):
+        await asyncio.gather(hit(), hit(), hit())
+    gaps = [b - a for a, b in zip(stamps, stamps[1:])]
+    assert all(g >= 0.045 for g in gaps)
+
+
+def test_nominatim_slot_works_across_event_loops():
+    from app.services import geocode_cache
+
+    async def burst():
+        async def hit():
+            async with geocode_cache.nominatim_slot():
+                await asyncio.sleep(0)
+        await asyncio.gather(hit(), hit())
+
+    # A lock contended in one loop must not be reused by the next (CLI runs, tests)
+    with patch.object(geocode_cache, "NOMINATIM_MIN_INTERVAL", 0), \
+         patch.object(geocode_cache, "_nominatim_lock", None):
+        asyncio.run(burst())
+        asyncio.run(burst())
+
+
+# ── great-circle pre-filter ───────────────────────────────────────────────────
+
+def test_haversine_km_matches_known_distance():
+    from app.services.geo_utils import haversine_km
+    mumbai = {"lat": 19.0760, "lng": 72.8777}
+    distances = haversine_km(mumbai, [{"lat": 18.5204, "lng": 73.8567}, mumbai])
+    assert 118 < distances[0] < 122  # Mumbai → Pune ≈ 120 km
+    assert distances[1] == pytest.approx(0.0)
+
+
+def test_prefilter_reachable_drops_hopeless_and_sorts_nearest_first():
+    from app.services.geo_utils import prefilter_reachable
+    mumbai = {"lat": 19.0760, "lng": 72.8777}
+    goa = {"lat": 15.2993, "lng": 74.1240}
+    pune = {"lat": 18.5204, "lng": 73.8567}
+    delhi = {"lat": 28.6139, "lng": 77.2090}
+    assert prefilter_reachable(mumbai, [goa, delhi, pune], 720) == [2, 0]
+    assert prefilter_reachable(mumbai, [], 720) == []
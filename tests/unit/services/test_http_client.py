@@ -0,0 +1,41 @@
+"""Unit tests for the shared HTTP session."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+@pytest.mark.asyncio
+async def test_http_session_reuses_shared_session_after_init():
+    from app.services import http_client
+    shared = await http_client.init_http_session()
+    try:
+        async with http_client.http_session() as s1:
+            pass
+        async with http_client.http_session() as s2:
+            pass
+        assert s1 is shared and s2 is shared
+        assert not shared.closed  # callers never close the shared session
+        assert shared.connector.limit_per_host == http_client.HTTP_POOL_LIMIT_PER_HOST
+    finally:
+        await http_client.close_http_session()
+    assert shared.closed
+
+
+@pytest.mark.asyncio
+async def test_http_session_falls_back_to_short_lived_session():
+    from app.services import http_client
+    await http_client.close_http_session()
+    temp = MagicMock()
+    temp.__aenter__ = AsyncMock(return_value=temp)
+    temp.__aexit__ = AsyncMock(return_value=False)
+    with patch("aiohttp.ClientSession", return_value=temp):
+        async with http_client.http_session() as session:
+            assert session is temp
+    temp.__aexit__.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_close_http_session_is_safe_when_never_opened():
+    from app.services import http_client
+    await http_client.close_http_session()
+    await http_client.close_http_session()
+    assert http_client.http_pool_stats()["open"] is False
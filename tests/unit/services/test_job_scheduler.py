@@ -0,0 +1,156 @@
+"""Unit tests for the background job scheduler."""
+import asyncio
+
+import pytest
+
+
+def _recorder(log: list, name: str, delay: float = 0.0, tracker: dict | None = None):
+    async def job():
+        if tracker is not None:
+            tracker["now"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["now"])
+        await asyncio.sleep(delay)
+        if tracker is not None:
+            tracker["now"] -= 1
+        log.append(name)
+    return job
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_by_priority_then_fifo():
+    from app.services.job_scheduler import PRIORITY_HIGH, PRIORITY_LOW, JobScheduler
+    scheduler = JobScheduler(workers=1)
+    log: list[str] = []
+    # The first job occupies the single worker while the rest queue up
+    scheduler.submit("a:1", _recorder(log, "first", 0.01))
+    await asyncio.sleep(0)
+    scheduler.submit("a:low", _recorder(log, "low"), PRIORITY_LOW)
+    scheduler.submit("a:n1", _recorder(log, "normal-1"))
+    scheduler.submit("a:high", _recorder(log, "high"), PRIORITY_HIGH)
+    scheduler.submit("a:n2", _recorder(log, "normal-2"))
+    await scheduler.join()
+    assert log == ["first", "high", "normal-1", "normal-2", "low"]
+    await scheduler.drain()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_key_is_skipped_while_queued_or_running():
+    from app.services.job_scheduler import JobScheduler
+    scheduler = JobScheduler(workers=2)
+    log: list[str] = []
+    assert scheduler.submit("reddit_area:goa:vagator", _recorder(log, "one", 0.01))
+    await asyncio.sleep(0)  # now running
+    assert not scheduler.submit("reddit_area:goa:vagator", _recorder(log, "dup"))
+    await scheduler.join()
+    # Finished — the key can be queued again
+    assert scheduler.submit("reddit_area:goa:vagator", _recorder(log, "again"))
+    await scheduler.join()
+    assert log == ["one", "again"]
+    assert scheduler.stats()["deduped"] == 1
+    await scheduler.drain()
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_bounds_concurrency_and_failures_are_contained():
+    from app.services.job_scheduler import JobScheduler
+    scheduler = JobScheduler(workers=3)
+    log: list[str] = []
+    tracker = {"now": 0, "peak": 0}
+
+    async def boom():
+        raise RuntimeError("redis down")
+    scheduler.submit("x:boom", boom)
+    for i in range(10):
+        scheduler.submit(f"x:{i}", _recorder(log, str(i), 0.005, tracker))
+    await scheduler.join()
+    assert tracker["peak"] == 3
+    assert len(log) == 10
+    stats = scheduler.stats()
+    assert stats["failed"] == 1 and stats["completed"] == 10 and stats["queue_depth"] == 0
+    await scheduler.drain()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_new_jobs():
+    from app.services.job_scheduler import JobScheduler
+    scheduler = JobScheduler(workers=1, max_queue=2)
+    log: list[str] = []
+    results = [scheduler.submit(f"q:{i}", _recorder(log, str(i))) for i in range(4)]
+    assert results == [True, True, False, False]
+    await scheduler.join()
+    assert log == ["0", "1"]
+    await scheduler.drain()
+
+
+@pytest.mark.asyncio
+async def test_drain_finishes_queued_jobs_and_refuses_new_ones():
+    from app.services.job_scheduler import JobScheduler
+    scheduler = JobScheduler(workers=1)
+    log: list[str] = []
+    for i in range(3):
+        scheduler.submit(f"d:{i}", _recorder(log, str(i), 0.005))
+    drain = asyncio.get_running_loop().create_task(scheduler.drain(timeout=5))
+    await asyncio.sleep(0)
+    assert not scheduler.submit("d:late", _recorder(log, "late"))
+    await drain
+    assert log == ["0", "1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_drain_timeout_cancels_stragglers():
+    from app.services.job_scheduler import JobScheduler
+    scheduler = JobScheduler(workers=1)
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+    scheduler.submit("s:slow", slow)
+    scheduler.submit("s:never", slow)
+    await asyncio.sleep(0)
+    await scheduler.drain(timeout=0.01)
+    assert cancelled.is_set()
+    stats = scheduler.stats()
+    assert stats["cancelled"] == 1 and stats["dropped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_jobs_do_not_join_the_submitting_turn():
+    from app.services.job_scheduler import JobScheduler
+    from app.services.tracing import end_turn, render_metrics, span, start_turn
+    scheduler = JobScheduler(workers=1)
+
+    async def job():
+        with span("redis", "persist"):
+            pass
+    token = start_turn()
+    scheduler.submit("place_scores:goa:food", job)
+    await scheduler.join()
+    assert end_turn(token) == []
+    metrics = render_metrics()
+    assert 'roammate_job_duration_seconds_count{job="place_scores"}' in metrics
+    assert "roammate_job_queue_depth 0" in metrics
+    await scheduler.drain()
+
+
+@pytest.mark.asyncio
+async def test_submit_after_drain_does_not_restart_workers():
+    from app.services.job_scheduler import JobScheduler
+    scheduler = JobScheduler(workers=1)
+    log: list[str] = []
+    scheduler.submit("c:1", _recorder(log, "before"))
+    await scheduler.drain(timeout=1)
+    # e.g. a stale-hit refresh scheduled while the lifespan is shutting down
+    assert not scheduler.submit("c:late", _recorder(log, "late"))
+    assert scheduler.stats()["workers"] == 1 and scheduler._worker_tasks == []
+    await asyncio.sleep(0.01)
+    assert log == ["before"]
+    # The next lifespan reopens it explicitly
+    scheduler.start(reopen=True)
+    assert scheduler.submit("c:again", _recorder(log, "again"))
+    await scheduler.join()
+    assert log == ["before", "again"]
+    await scheduler.drain()
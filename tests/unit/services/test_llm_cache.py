@@ -0,0 +1,87 @@
+"""Unit tests for the content-addressed LLM response cache."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests.unit.services.test_llm_gateway import _mock_session, _ok
+
+
+def test_cache_key_is_stable_and_sensitive_to_every_field():
+    from app.services.llm_cache import cache_key
+    msgs = [{"role": "user", "content": "Goa hooks"}]
+    base = cache_key("m", msgs, 300, 0.1)
+    assert base == cache_key("m", [{"content": "Goa hooks", "role": "user"}], 300, 0.1)
+    assert base.startswith("llm:")
+    assert base != cache_key("m2", msgs, 300, 0.1)
+    assert base != cache_key("m", msgs, 301, 0.1)
+    assert base != cache_key("m", msgs, 300, 0.2)
+    assert base != cache_key("m", [{"role": "user", "content": "Gokarna hooks"}], 300, 0.1)
+
+
+def test_ttl_for_unlisted_call_site_is_zero():
+    from app.services.llm_cache import ttl_for
+    assert ttl_for("responder") == 0
+    assert ttl_for("area_scale") > 0
+
+
+def test_lru_evicts_oldest_and_expires():
+    from app.services import llm_cache
+    llm_cache.clear_local_cache()
+    with patch.object(llm_cache, "LLM_CACHE_LRU_SIZE", 2):
+        llm_cache._lru_set("a", "1", 60)
+        llm_cache._lru_set("b", "2", 60)
+        llm_cache._lru_get("a")            # a is now most recent
+        llm_cache._lru_set("c", "3", 60)   # evicts b
+    assert llm_cache._lru_get("b") is None
+    assert llm_cache._lru_get("a") == "1"
+    llm_cache._lru_set("d", "4", -1)
+    assert llm_cache._lru_get("d") is None
+    llm_cache.clear_local_cache()
+
+
+@pytest.mark.asyncio
+async def test_redis_hit_is_promoted_to_lru():
+    from app.services import llm_cache
+    llm_cache.clear_local_cache()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=['{"scale": "small"}', 120])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    r = MagicMock()
+    r.pipeline = MagicMock(return_value=pipe)
+    with patch("app.services.llm_cache.get_redis", new_callable=AsyncMock, return_value=r):
+        assert await llm_cache.get_cached_completion("llm:x") == '{"scale": "small"}'
+    assert llm_cache._lru_get("llm:x") == '{"scale": "small"}'
+    llm_cache.clear_local_cache()
+
+
+@pytest.mark.asyncio
+async def test_gateway_serves_repeat_prompt_from_cache():
+    from app.services import llm_cache, llm_gateway
+    llm_cache.clear_local_cache()
+    session = _mock_session(_ok('{"scale": "medium"}'))
+    msgs = [{"role": "user", "content": "How big is Coorg?"}]
+    with patch("app.services.http_client.aiohttp.ClientSession", return_value=session), \
+         patch("app.services.llm_cache.get_redis", new_callable=AsyncMock, return_value=None):
+        first = await llm_gateway.complete_json(msgs, max_tokens=150, call_site="area_scale")
+        second = await llm_gateway.complete_json(msgs, max_tokens=150, call_site="area_scale")
+    assert first == second == {"scale": "medium"}
+    assert session.post.call_count == 1
+    stats = llm_gateway.llm_stats()["area_scale"]
+    assert stats["cache_hits"] >= 1 and stats["cache_misses"] >= 1
+    llm_cache.clear_local_cache()
+
+
+@pytest.mark.asyncio
+async def test_gateway_does_not_cache_unparseable_reply():
+    from app.services import llm_cache, llm_gateway
+    llm_cache.clear_local_cache()
+    session = _mock_session(_ok("Sorry, no idea."), _ok('{"adv": "Scuba at Grande Island"}'))
+    msgs = [{"role": "user", "content": "Goa vibe hooks"}]
+    with patch("app.services.http_client.aiohttp.ClientSession", return_value=session), \
+         patch("app.services.llm_cache.get_redis", new_callable=AsyncMock, return_value=None):
+        with pytest.raises(ValueError):
+            await llm_gateway.complete_json(msgs, expect=dict, call_site="vibe_hooks")
+        result = await llm_gateway.complete_json(msgs, expect=dict, call_site="vibe_hooks")
+    assert result == {"adv": "Scuba at Grande Island"}
+    assert session.post.call_count == 2
+    llm_cache.clear_local_cache()
@@ -0,0 +1,217 @@
+"""Unit tests for the shared Groq gateway."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+def _mock_session(*responses):
+    """Session whose post() yields the given (status, json_body) pairs in order."""
+    ctxs = []
+    for status, body in responses:
+        resp = MagicMock()
+        resp.status = status
+        resp.headers = {}
+        resp.json = AsyncMock(return_value=body)
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=resp)
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        ctxs.append(ctx)
+    session = MagicMock()
+    session.post = MagicMock(side_effect=ctxs)
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    return session
+
+
+def _ok(content, usage=None):
+    body = {"choices": [{"message": {"content": content}}]}
+    if usage:
+        body["usage"] = usage
+    return 200, body
+
+
+# ── extract_json ──────────────────────────────────────────────────────────────
+
+def test_extract_json_bare_object():
+    from app.services.llm_gateway import extract_json
+    assert extract_json('{"a": 1}') == {"a": 1}
+
+
+def test_extract_json_fenced_block():
+    from app.services.llm_gateway import extract_json
+    assert extract_json('```json\n[{"id": "x"}]\n```') == [{"id": "x"}]
+
+
+def test_extract_json_embedded_in_prose_with_trailing_text():
+    from app.services.llm_gateway import extract_json
+    text = 'Here you go: {"place_signals": {"Cafe": {"mention_count": 2}}} Hope this helps {x}'
+    assert extract_json(text, expect=dict) == {"place_signals": {"Cafe": {"mention_count": 2}}}
+
+
+def test_extract_json_expect_list_skips_objects():
+    from app.services.llm_gateway import extract_json
+    text = 'Queries: ["cafes in goa", "bars in goa"]'
+    assert extract_json(text, expect=list) == ["cafes in goa", "bars in goa"]
+
+
+def test_extract_json_raises_value_error_when_unparseable():
+    from app.services.llm_gateway import extract_json
+    with pytest.raises(ValueError):
+        extract_json("Sorry, I can't help with that.")
+
+
+# ── complete ──────────────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_complete_retries_on_429_then_succeeds():
+    from app.services import llm_gateway
+    session = _mock_session((429, {}), _ok("hello"))
+    with patch("app.services.http_client.aiohttp.ClientSession", return_value=session), \
+         patch("app.services.llm_gateway.asyncio.sleep", new_callable=AsyncMock) as sleep:
+        text = await llm_gateway.complete(
+            [{"role": "user", "content": "hi"}], max_tokens=10, call_site="test_retry"
+        )
+    assert text == "hello"
+    assert session.post.call_count == 2
+    sleep.assert_awaited()
+    assert llm_gateway.llm_stats()["test_retry"]["retries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_complete_raises_llm_error_after_exhausting_retries():
+    from app.services import llm_gateway
+    attempts = llm_gateway.GROQ_MAX_RETRIES + 1
+    session = _mock_session(*[(503, {})] * attempts)
+    with patch("app.services.http_client.aiohttp.ClientSession", return_value=session), \
+         patch("app.services.llm_gateway.asyncio.sleep", new_callable=AsyncMock):
+        with pytest.raises(llm_gateway.LLMError):
+            await llm_gateway.complete([{"role": "user", "content": "hi"}], call_site="test_exhaust")
+    assert session.post.call_count == attempts
+    assert llm_gateway.llm_stats()["test_exhaust"]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_complete_records_token_usage():
+    from app.services import llm_gateway
+    session = _mock_session(_ok("ok", usage={"prompt_tokens": 12, "completion_tokens": 3}))
+    with patch("app.services.http_client.aiohttp.ClientSession", return_value=session):
+        await llm_gateway.complete([{"role": "user", "content": "hi"}], call_site="test_usage")
+    stats = llm_gateway.llm_stats()["test_usage"]
+    assert stats["calls"] == 1
+    assert stats["prompt_tokens"] == 12 and stats["completion_tokens"] == 3
+
+
+@pytest.mark.asyncio
+async def test_complete_json_parses_fenced_reply():
+    from app.services import llm_gateway
+    session = _mock_session(_ok('```json\n{"beach_coast": ["Alibaug"]}\n```'))
+    with patch("app.services.http_client.aiohttp.ClientSession", return_value=session):
+        result = await llm_gateway.complete_json(
+            [{"role": "user", "content": "classify"}], expect=dict, call_site="test_json"
+        )
+    assert result == {"beach_coast": ["Alibaug"]}
+
+
+# ── token bucket ──────────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_when_exhausted():
+    from app.services.llm_gateway import _TokenBucket
+    bucket = _TokenBucket(per_minute=60)  # 1 token/s
+    bucket.tokens = 0.0
+    with patch("app.services.llm_gateway.asyncio.sleep", new_callable=AsyncMock) as sleep:
+        waited = await _simulate_refill(bucket, sleep)
+    assert waited == pytest.approx(1.0, abs=0.05)
+
+
+async def _simulate_refill(bucket, sleep):
+    """Advance the bucket's clock by the slept amount so acquire() can complete."""
+    async def fake_sleep(delay):
+        bucket.updated -= delay
+    sleep.side_effect = fake_sleep
+    return await bucket.acquire(1)
+
+
+# ── stream ────────────────────────────────────────────────────────────────────
+
+class _Lines:
+    """Async iterator over SSE body lines, like aiohttp's StreamReader."""
+
+    def __init__(self, lines):
+        self._lines = iter(lines)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._lines)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def _sse(*deltas):
+    import json
+    lines = [
+        f'data: {json.dumps({"choices": [{"delta": {"content": d}}]})}\n'.encode() for d in deltas
+    ]
+    return lines + [b"\n", b"data: [DONE]\n"]
+
+
+def _stream_session(*responses):
+    """Like _mock_session, but each response is (status, list_of_sse_lines)."""
+    session = _mock_session(*[(status, {}) for status, _ in responses])
+    ctxs = list(session.post.side_effect)
+    for ctx, (_, lines) in zip(ctxs, responses):
+        ctx.__aenter__.return_value.content = _Lines(lines)
+    session.post.side_effect = ctxs
+    return session
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_deltas_in_order():
+    from app.services import llm_gateway
+    session = _stream_session((200, _sse("Goa ", "is ", "sunny.")))
+    with patch("app.services.http_client.aiohttp.ClientSession", return_value=session):
+        chunks = [c async for c in llm_gateway.stream([{"role": "user", "content": "hi"}], call_site="test_stream")]
+    assert chunks == ["Goa ", "is ", "sunny."]
+    assert session.post.call_args[1]["json"]["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_stream_retries_before_first_chunk():
+    from app.services import llm_gateway
+    session = _stream_session((503, []), (200, _sse("ok")))
+    with patch("app.services.http_client.aiohttp.ClientSession", return_value=session), \
+         patch("app.services.llm_gateway.asyncio.sleep", new_callable=AsyncMock):
+        chunks = [c async for c in llm_gateway.stream([{"role": "user", "content": "hi"}], call_site="test_stream_retry")]
+    assert chunks == ["ok"]
+    assert session.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_releases_its_slot_before_a_slow_consumer_finishes():
+    import asyncio
+    from app.services import llm_gateway
+    session = _stream_session((200, _sse("a", "b", "c")))
+    with patch("app.services.http_client.aiohttp.ClientSession", return_value=session), \
+         patch.object(llm_gateway, "GROQ_MAX_CONCURRENCY", 1), \
+         patch.object(llm_gateway, "_semaphore", None):
+        gen = llm_gateway.stream([{"role": "user", "content": "hi"}], call_site="test_stream_slow")
+        assert await gen.__anext__() == "a"
+        # The consumer is still holding the generator, but Groq has finished sending
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert not llm_gateway._limiter().locked()
+        assert [c async for c in gen] == ["b", "c"]
+
+
+def test_limiter_is_created_for_each_event_loop():
+    import asyncio
+    from app.services import llm_gateway
+
+    async def limiter():
+        return llm_gateway._limiter()
+    with patch.object(llm_gateway, "_semaphore", None):
+        first = asyncio.run(limiter())
+        second = asyncio.run(limiter())
+    assert first is not second
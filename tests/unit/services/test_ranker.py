@@ -41,3 +41,84 @@ def test_rank_position_assigned():
     ranked = ranker.rank_places(mappings, TravelIntent())
     positions = [r.rank_position for r in ranked]
     assert positions == [1, 2, 3]
+
+
+def _random_mappings(rng, n: int) -> list[PlaceAreaMapping]:
+    vocab = ["Coffee", "chill", "street food", "temple", "museum", "nightlife", "beach", "hiking"]
+    return [
+        PlaceAreaMapping(
+            place=Place(
+                place_id=f"p{i}",
+                name=f"Place {i}",
+                place_type="attraction",
+                lat=0.0,
+                lon=0.0,
+                rating=rng.choice([None, 0, 5, rng.choice([3.5, 4.0, 4.5]), round(rng.uniform(1, 5), 1)]),
+                review_count=rng.choice([0, 7, 100, rng.randint(0, 5000)]),
+                tags=rng.sample(vocab, rng.randint(0, 4)),
+            )
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_batch_path_matches_scalar_path(seed):
+    """Vectorised ranking returns exactly what the per-place loop does."""
+    import random
+    from app.models import AreaScores, CrowdPreference, ScoreResult
+
+    rng = random.Random(seed)
+    mappings = _random_mappings(rng, 60)
+    intent = TravelIntent(
+        vibe=rng.sample(list(Vibe), rng.randint(0, 2)),
+        crowd_preference=rng.choice([None, *CrowdPreference]),
+        interests=rng.choice([[], ["coffee"], ["food", "TEMPLE", "food"], ["hik", "museum"]]),
+    )
+    area_scores = rng.choice([
+        None,
+        AreaScores(
+            crowd_score=ScoreResult(value=rng.random(), confidence=rng.random()),
+            authenticity_score=ScoreResult(value=rng.random(), confidence=rng.random()),
+        ),
+    ])
+    ranker = Ranker()
+    assert ranker._rank_places_batch(mappings, intent, area_scores) == \
+        ranker._rank_places_scalar(mappings, intent, area_scores)
+
+
+def test_large_candidate_sets_use_batch_path():
+    from unittest.mock import patch
+    from app.services import ranker as ranker_module
+
+    ranker = Ranker()
+    mappings = [_make_mapping(f"P{i}", 4.0) for i in range(ranker_module.BATCH_RANK_MIN_PLACES)]
+    with patch.object(Ranker, "_rank_places_scalar") as scalar:
+        ranked = ranker.rank_places(mappings, TravelIntent())
+    scalar.assert_not_called()
+    assert [r.rank_position for r in ranked] == list(range(1, len(mappings) + 1))
+
+
+@pytest.mark.parametrize("n", [5, 60])
+@pytest.mark.parametrize("top_k", [0, 1, 3, 6, 100])
+def test_top_k_matches_head_of_full_ranking(n, top_k):
+    """Heap (scalar) and argpartition (batch) selection keep ties in input order."""
+    import random
+
+    rng = random.Random(n * 100 + top_k)
+    mappings = _random_mappings(rng, n)
+    intent = TravelIntent(interests=["food", "temple"])
+    ranker = Ranker()
+    full = ranker.rank_places(mappings, intent)
+    assert ranker.rank_places(mappings, intent, top_k=top_k) == full[:top_k]
+
+
+def test_top_k_builds_objects_only_for_winners():
+    from unittest.mock import patch
+
+    ranker = Ranker()
+    mappings = [_make_mapping(f"P{i}", 3.0 + i / 50) for i in range(80)]
+    with patch.object(Ranker, "_build_ranked_place", wraps=ranker._build_ranked_place) as build:
+        ranked = ranker.rank_places(mappings, TravelIntent(), top_k=3)
+    assert build.call_count == 3
+    assert [r.place.name for r in ranked] == ["P79", "P78", "P77"]
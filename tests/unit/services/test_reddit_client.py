@@ -0,0 +1,113 @@
+"""Unit tests for the shared Reddit client, its request slots and rate-limit handling."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+def _submission(sid: str, load_delay: float = 0.0, tracker: dict | None = None):
+    sub = AsyncMock()
+    sub.id = sid
+    sub.title = f"post {sid}"
+    sub.selftext = ""
+    comment = MagicMock()
+    comment.body = "nice"
+    sub.comments = MagicMock()
+    sub.comments.replace_more = AsyncMock()
+    sub.comments.list = MagicMock(return_value=[comment])
+
+    async def _load():
+        if tracker is not None:
+            tracker["now"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["now"])
+        await asyncio.sleep(load_delay)
+        if tracker is not None:
+            tracker["now"] -= 1
+    sub.load = AsyncMock(side_effect=_load)
+    return sub
+
+
+def _mock_reddit(submissions, remaining=None):
+    subreddit = AsyncMock()
+
+    async def _gen(*a, **kw):
+        for s in submissions:
+            yield s
+    subreddit.search = _gen
+    reddit = AsyncMock()
+    reddit.subreddit = AsyncMock(return_value=subreddit)
+    reddit.auth = MagicMock()
+    reddit.auth.limits = {"remaining": remaining, "used": None if remaining is None else 10}
+    return reddit
+
+
+# ── reddit_slot ───────────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_submission_loads_run_concurrently_within_global_limit():
+    from app.services import reddit_client
+    from app.services.reddit_signals import _search_reddit
+
+    tracker = {"now": 0, "peak": 0}
+    subs = [_submission(f"s{i}", 0.02, tracker) for i in range(8)]
+    with patch.object(reddit_client, "REDDIT_MAX_CONCURRENCY", 3), \
+         patch.object(reddit_client, "_semaphore", None):
+        # Two searches at once still share the same 3 slots
+        results = await asyncio.gather(
+            _search_reddit(_mock_reddit(subs[:4]), "goa", limit=4),
+            _search_reddit(_mock_reddit(subs[4:]), "goa beach", limit=4),
+        )
+    assert [len(r) for r in results] == [4, 4]
+    assert tracker["peak"] == 3
+    assert results[0][0].startswith("TITLE: post s0")
+
+
+@pytest.mark.asyncio
+async def test_low_rate_limit_skips_comment_loads():
+    from app.services.reddit_signals import _search_reddit
+    sub = _submission("s1")
+    posts = await _search_reddit(_mock_reddit([sub], remaining=3), "goa")
+    sub.load.assert_not_called()
+    assert posts == ["TITLE: post s1\nTEXT: \nCOMMENTS: "]
+
+
+def test_slot_semaphore_is_created_for_each_event_loop():
+    from app.services import reddit_client
+
+    async def limiter():
+        return reddit_client._limiter()
+    with patch.object(reddit_client, "_semaphore", None):
+        first = asyncio.run(limiter())
+        second = asyncio.run(limiter())
+    assert first is not second
+
+
+# ── reddit_client ─────────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_shared_client_is_reused_and_closed_by_lifespan_only():
+    from app.services import reddit_client
+    client = AsyncMock()
+    with patch.object(reddit_client, "CLIENT_SECRET", "x"), \
+         patch("app.services.reddit_client.asyncpraw.Reddit", return_value=client) as cls:
+        await reddit_client.init_reddit_client()
+        async with reddit_client.reddit_client() as a:
+            pass
+        async with reddit_client.reddit_client() as b:
+            pass
+        assert a is b is client
+        client.close.assert_not_called()
+        await reddit_client.close_reddit_client()
+    cls.assert_called_once()
+    client.close.assert_awaited_once()
+    assert reddit_client.reddit_client_stats()["shared"] is False
+
+
+@pytest.mark.asyncio
+async def test_client_without_lifespan_is_closed_after_use():
+    from app.services import reddit_client
+    client = AsyncMock()
+    with patch("app.services.reddit_client.asyncpraw.Reddit", return_value=client):
+        async with reddit_client.reddit_client() as reddit:
+            assert reddit is client
+    client.close.assert_awaited_once()
@@ -0,0 +1,168 @@
+"""Unit tests for the destination-keyed Reddit signal store and incremental refresh."""
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+def _intent(city="Goa"):
+    from app.models import Destination, TravelIntent
+    return TravelIntent(destination=Destination(city=city))
+
+
+def _entry(age_s: float, **overrides) -> dict:
+    entry = {
+        "place_signals": {"Chapora Fort": {"sentiment_score": 0.8, "mention_count": 2}},
+        "raw_posts_text": "TITLE: old post",
+        "post_ids": ["a1", "a2"],
+        "crawled_at": time.time() - age_s,
+    }
+    entry.update(overrides)
+    return entry
+
+
+def _submission(sid: str, created_utc: float, title: str = "post"):
+    sub = AsyncMock()
+    sub.id = sid
+    sub.created_utc = created_utc
+    sub.title = title
+    sub.selftext = ""
+    sub.comments = MagicMock()
+    sub.comments.replace_more = AsyncMock()
+    sub.comments.list = MagicMock(return_value=[])
+    return sub
+
+
+def _mock_reddit(submissions, searches: list | None = None):
+    subreddit = AsyncMock()
+
+    async def _gen(*a, **kw):
+        if searches is not None:
+            searches.append(kw)
+        for s in submissions:
+            yield s
+    subreddit.search = _gen
+    reddit = AsyncMock()
+    reddit.subreddit = AsyncMock(return_value=subreddit)
+    return reddit
+
+
+# ── merge_entry ───────────────────────────────────────────────────────────────
+
+def test_merge_entry_combines_known_places_and_keeps_newest_first():
+    from app.services.reddit_store import merge_entry
+    stored = _entry(0, place_signals={
+        "Chapora Fort": {"sentiment_score": 0.8, "mention_count": 3, "crowd_signal": "high",
+                         "vibe_tags": ["views"], "review_highlights": ["sunset"]},
+    })
+    merged = merge_entry(
+        stored,
+        {
+            "chapora fort": {"sentiment_score": 0.4, "mention_count": 1, "crowd_signal": "low",
+                             "vibe_tags": ["views", "hike"], "review_highlights": ["windy"]},
+            "Thalassa": {"sentiment_score": 0.9, "mention_count": 2},
+            "junk": "not a dict",
+        },
+        "TITLE: new post",
+        ["b1"],
+        123.0,
+    )
+    fort = merged["place_signals"]["Chapora Fort"]
+    assert fort["sentiment_score"] == 0.7 and fort["mention_count"] == 4
+    assert fort["crowd_signal"] == "low"
+    assert fort["vibe_tags"] == ["views", "hike"]
+    assert fort["review_highlights"] == ["windy", "sunset"]
+    assert "Thalassa" in merged["place_signals"] and "junk" not in merged["place_signals"]
+    assert merged["raw_posts_text"].startswith("TITLE: new post")
+    assert merged["post_ids"] == ["b1", "a1", "a2"]
+    assert merged["crawled_at"] == 123.0
+
+
+# ── get_reddit_place_signals ──────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_fresh_entry_is_served_without_crawling():
+    from app.services import reddit_signals
+    with patch.object(reddit_signals, "get_stored", new_callable=AsyncMock, return_value=_entry(60)), \
+         patch.object(reddit_signals, "_crawl_destination", new_callable=AsyncMock) as crawl:
+        result = await reddit_signals.get_reddit_place_signals(_intent())
+    crawl.assert_not_called()
+    assert result == {"place_signals": _entry(0)["place_signals"], "raw_posts_text": "TITLE: old post"}
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_and_refreshed_in_background():
+    from app.services import reddit_signals
+    from app.services.job_scheduler import wait_for_jobs
+    from app.services.reddit_store import REDDIT_STORE_FRESH_S
+    stale = _entry(REDDIT_STORE_FRESH_S + 60)
+    with patch.object(reddit_signals, "get_stored", new_callable=AsyncMock, return_value=stale), \
+         patch.object(reddit_signals, "_crawl_destination", new_callable=AsyncMock) as crawl:
+        result = await reddit_signals.get_reddit_place_signals(_intent(), post_limit=8)
+        assert result["raw_posts_text"] == "TITLE: old post"
+        await wait_for_jobs()
+    crawl.assert_awaited_once()
+    assert crawl.await_args.args[1:] == ("Goa", 8, stale)
+
+
+@pytest.mark.asyncio
+async def test_miss_crawls_and_stores():
+    from app.services import reddit_signals
+    reddit = _mock_reddit([_submission("p1", time.time(), "Goa trip")])
+    with patch.object(reddit_signals, "get_stored", new_callable=AsyncMock, return_value=None), \
+         patch.object(reddit_signals, "put_stored", new_callable=AsyncMock) as put, \
+         patch.object(reddit_signals, "CLIENT_SECRET", "x"), \
+         patch("app.services.reddit_client.asyncpraw.Reddit", return_value=reddit), \
+         patch.object(reddit_signals, "_extract_place_signals", new_callable=AsyncMock,
+                      return_value={"place_signals": {"Thalassa": {"sentiment_score": 0.9}}}):
+        result = await reddit_signals.get_reddit_place_signals(_intent())
+    assert result["place_signals"] == {"Thalassa": {"sentiment_score": 0.9}}
+    stored = put.await_args.args[1]
+    assert stored["post_ids"] == ["p1"]
+    assert "Goa trip" in stored["raw_posts_text"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_loads_only_new_unseen_submissions():
+    from app.services import reddit_signals
+    stored = _entry(10_000)
+    old = _submission("a1", stored["crawled_at"] + 5, "seen already")
+    before = _submission("c0", stored["crawled_at"] - 5, "older than crawl")
+    new = _submission("c1", time.time(), "brand new")
+    after_cutoff = _submission("c2", stored["crawled_at"] - 10, "never reached")
+    searches: list[dict] = []
+    # sort="new": newest first, and the listing stops at the first post older than the crawl
+    reddit = _mock_reddit([new, old, before, after_cutoff], searches)
+    with patch.object(reddit_signals, "put_stored", new_callable=AsyncMock) as put, \
+         patch.object(reddit_signals, "CLIENT_SECRET", "x"), \
+         patch("app.services.reddit_client.asyncpraw.Reddit", return_value=reddit), \
+         patch.object(reddit_signals, "_extract_place_signals", new_callable=AsyncMock,
+                      return_value={"place_signals": {"Chapora Fort": {"sentiment_score": 0.2}}}) as extract:
+        entry = await reddit_signals._crawl_destination(_intent(), "Goa", 12, stored)
+    assert all(kw["sort"] == "new" for kw in searches)
+    old.load.assert_not_called()
+    before.load.assert_not_called()
+    after_cutoff.load.assert_not_called()
+    new.load.assert_awaited()
+    # Four queries share one seen-set, so the new post is loaded and extracted once
+    assert extract.await_args.args[0].count("brand new") == 1
+    assert entry["post_ids"] == ["c1", "a1", "a2"]
+    assert entry["place_signals"]["Chapora Fort"]["mention_count"] == 3
+    put.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_refresh_with_nothing_new_restarts_freshness_without_extracting():
+    from app.services import reddit_signals
+    from app.services.reddit_store import is_fresh
+    stored = _entry(10_000)
+    reddit = _mock_reddit([])
+    with patch.object(reddit_signals, "put_stored", new_callable=AsyncMock), \
+         patch.object(reddit_signals, "CLIENT_SECRET", "x"), \
+         patch("app.services.reddit_client.asyncpraw.Reddit", return_value=reddit), \
+         patch.object(reddit_signals, "_extract_place_signals", new_callable=AsyncMock) as extract:
+        entry = await reddit_signals._crawl_destination(_intent(), "Goa", 12, stored)
+    extract.assert_not_called()
+    assert is_fresh(entry)
+    assert entry["place_signals"] == stored["place_signals"]
+
@@ -0,0 +1,75 @@
+"""Unit tests for the shared Redis pool and area_cache batch helpers."""
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+@pytest.mark.asyncio
+async def test_get_redis_reuses_one_client():
+    from app.services import redis_pool
+    await redis_pool.close_redis_pool()
+    first = await redis_pool.get_redis()
+    second = await redis_pool.get_redis()
+    assert first is second
+    assert isinstance(first.connection_pool, redis_pool._InstrumentedPool)
+    await redis_pool.close_redis_pool()
+
+
+@pytest.mark.asyncio
+async def test_close_redis_pool_is_safe_when_never_opened():
+    from app.services import redis_pool
+    await redis_pool.close_redis_pool()
+    await redis_pool.close_redis_pool()  # must not raise
+
+
+def test_redis_pool_stats_shape():
+    from app.services.redis_pool import redis_pool_stats
+    stats = redis_pool_stats()
+    for key in ("max_connections", "in_use", "idle", "acquisitions", "timeouts", "wait_avg_ms", "wait_max_ms"):
+        assert key in stats
+
+
+@pytest.mark.asyncio
+async def test_get_cached_does_not_close_shared_client():
+    from app.services.area_cache import get_cached
+    mock_r = AsyncMock()
+    mock_r.get.return_value = json.dumps([{"id": "vagator"}])
+    with patch("app.services.area_cache._get_redis", return_value=mock_r):
+        await get_cached("area_cards:goa:beach_coast")
+    mock_r.aclose.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_many_cached_preserves_key_order():
+    from app.services.area_cache import get_many_cached
+    mock_r = AsyncMock()
+    mock_r.mget.return_value = [json.dumps([{"id": "a"}]), None, json.dumps([{"id": "c"}])]
+    with patch("app.services.area_cache._get_redis", return_value=mock_r):
+        result = await get_many_cached(["k1", "k2", "k3"])
+    mock_r.mget.assert_awaited_once_with(["k1", "k2", "k3"])
+    assert result == [[{"id": "a"}], None, [{"id": "c"}]]
+
+
+@pytest.mark.asyncio
+async def test_get_many_cached_all_misses_when_redis_unavailable():
+    from app.services.area_cache import get_many_cached
+    with patch("app.services.area_cache._get_redis", return_value=None):
+        result = await get_many_cached(["k1", "k2"])
+    assert result == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_set_many_cached_uses_one_pipeline():
+    from app.services.area_cache import set_many_cached
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    mock_r = MagicMock()
+    mock_r.pipeline = MagicMock(return_value=pipe)
+    with patch("app.services.area_cache._get_redis", new_callable=AsyncMock, return_value=mock_r):
+        await set_many_cached({"k1": [{"id": "a"}], "k2": [{"id": "b"}]}, ttl=600)
+    assert pipe.setex.call_count == 2
+    assert pipe.setex.call_args_list[0][0][:2] == ("k1", 600)
+    pipe.execute.assert_awaited_once()
@@ -21,3 +21,58 @@ def test_score_all_places_attaches_fields():
     result = score_all_places(places, {}, {})
     assert "social_score" in result[0]
     assert "reddit_crowd" in result[0]
+
+
+def _reference_social_score(place_name, reddit_signals, blog_signals):
+    """The original per-place scan, kept to check the index against."""
+    place_signals = reddit_signals.get("place_signals", {})
+    signal = place_signals.get(place_name)
+    if not signal:
+        for key in place_signals:
+            if key.lower() in place_name.lower() or place_name.lower() in key.lower():
+                signal = place_signals[key]
+                break
+    reddit_score, confidence, reddit_crowd = 0.5, 0.3, None
+    if signal:
+        reddit_score = float(signal.get("sentiment_score", 0.5))
+        reddit_crowd = signal.get("crowd_signal")
+        confidence = min(int(signal.get("mention_count", 1)) / 5, 1.0)
+    blog_hits = [
+        s.get("final_score", 0.5) for s in blog_signals.get("sources", [])
+        if place_name.lower() in s.get("snippet", "").lower()
+    ]
+    blog_score = sum(blog_hits) / len(blog_hits) if blog_hits else 0.3
+    return round(0.6 * reddit_score + 0.4 * blog_score, 3), confidence, reddit_crowd
+
+
+def test_signal_index_matches_per_place_scan():
+    import random
+
+    rng = random.Random(3)
+    words = ["Cafe", "Sunrise", "Fort", "Aguada", "Baga", "Beach", "Shack", "Ba", "Market", "Old", "Goa"]
+
+    def name():
+        return " ".join(rng.sample(words, rng.randint(1, 3)))
+
+    reddit = {"place_signals": {
+        name(): {"sentiment_score": rng.random(), "crowd_signal": rng.choice(["low", "high"]),
+                 "mention_count": rng.randint(1, 9)}
+        for _ in range(40)
+    }}
+    reddit["place_signals"]["Go"] = {"sentiment_score": 0.1, "mention_count": 2}
+    blog = {"sources": [
+        {"snippet": f"{name()} then {name()}, later {name().upper()}", "final_score": rng.random()}
+        for _ in range(8)
+    ]}
+    places = [{"name": name()} for _ in range(60)] + [{"name": ""}, {"name": "b"}, {"name": "zzz"}]
+
+    score_all_places(places, reddit, blog)
+    for p in places:
+        expected = _reference_social_score(p["name"], reddit, blog)
+        assert (p["social_score"], p["social_confidence"], p["reddit_crowd"]) == expected, p["name"]
+
+
+def test_empty_or_missing_place_name_does_not_crash():
+    assert score_all_places([{}], {"place_signals": {}}, {})[0]["reddit_crowd"] is None
+    reddit = {"place_signals": {"Cafe Sunrise": {"sentiment_score": 0.9, "crowd_signal": "low"}}}
+    assert _social_score("", reddit, {}) == _reference_social_score("", reddit, {})
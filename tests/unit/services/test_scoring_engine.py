@@ -33,3 +33,24 @@ def test_ranker_returns_sorted_results():
     intent = TravelIntent()
     ranked = ranker.rank_places(places, intent)
     assert ranked[0].rank_score >= ranked[1].rank_score
+
+
+def test_keyword_matcher_counts_shared_keywords_in_every_group():
+    from app.services.scoring_engine import KeywordMatcher
+    matcher = KeywordMatcher({"a": ["hidden gem", "quiet"], "b": ["Hidden Gem", "scam"], "c": ["busy"]})
+    assert matcher.count("a quiet hidden gem, hidden gem again") == {"a": 2, "b": 1, "c": 0}
+
+
+def test_reddit_keyword_counts_match_per_keyword_scan():
+    from app.services.scoring_engine import reddit_keyword_counts
+    text = "Tourist trap? No — a HIDDEN GEM, quiet and authentic. Touristy by noon, packed, overpriced."
+    lowered = text.lower()
+    expected = {
+        "crowd_high": sum(kw in lowered for kw in CrowdScorer.HIGH_CROWD_KEYWORDS),
+        "crowd_medium": sum(kw in lowered for kw in CrowdScorer.MEDIUM_CROWD_KEYWORDS),
+        "crowd_low": sum(kw in lowered for kw in CrowdScorer.LOW_CROWD_KEYWORDS),
+        "auth_high": sum(kw in lowered for kw in AuthenticityScorer.HIGH_AUTH_KEYWORDS),
+        "auth_low": sum(kw in lowered for kw in AuthenticityScorer.LOW_AUTH_KEYWORDS),
+    }
+    assert reddit_keyword_counts(text) == expected
+    assert expected["crowd_high"] == 2 and expected["auth_low"] == 3
@@ -0,0 +1,73 @@
+"""Unit tests for single-flight request coalescing."""
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_computation():
+    from app.services.single_flight import coalesce
+    calls = 0
+    gate = asyncio.Event()
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await gate.wait()
+        return [{"id": "vagator"}]
+
+    callers = [asyncio.create_task(coalesce("area_cards:goa:beach_coast", compute)) for _ in range(5)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*callers)
+    assert calls == 1
+    assert all(r == [{"id": "vagator"}] for r in results)
+
+
+@pytest.mark.asyncio
+async def test_key_is_released_after_completion():
+    from app.services.single_flight import coalesce, single_flight_stats
+    compute = AsyncMock(side_effect=[["first"], ["second"]])
+    assert await coalesce("k:release", compute) == ["first"]
+    assert await coalesce("k:release", compute) == ["second"]
+    assert single_flight_stats()["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_exception_propagates_to_every_waiter():
+    from app.services.single_flight import coalesce
+    gate = asyncio.Event()
+
+    async def compute():
+        await gate.wait()
+        raise RuntimeError("groq down")
+
+    callers = [asyncio.create_task(coalesce("k:boom", compute)) for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*callers, return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_remote_lock_holder_fills_cache_instead_of_recomputing():
+    from app.services import single_flight
+    compute = AsyncMock(return_value=["local"])
+    reread = AsyncMock(side_effect=[None, ["remote"]])
+    with patch.object(single_flight, "_acquire_lock", AsyncMock(return_value=False)), \
+         patch.object(single_flight, "_lock_held", AsyncMock(return_value=True)), \
+         patch.object(single_flight, "SINGLE_FLIGHT_POLL_INTERVAL", 0):
+        result = await single_flight.coalesce("k:remote", compute, reread=reread)
+    assert result == ["remote"]
+    compute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_redis_unavailable_falls_back_to_local_compute():
+    from app.services import single_flight
+    compute = AsyncMock(return_value=["local"])
+    with patch("app.services.single_flight.get_redis", new_callable=AsyncMock, return_value=None):
+        result = await single_flight.coalesce("k:noredis", compute, reread=AsyncMock(return_value=None))
+    assert result == ["local"]
+    compute.assert_awaited_once()
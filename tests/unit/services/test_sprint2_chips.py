@@ -163,6 +163,29 @@ async def test_fetch_suggestions_filters_by_12h_limit():
     assert cards[0]["name"] == "Lonavala"
 
 
+@pytest.mark.asyncio
+async def test_fetch_suggestions_prefilter_skips_routing_for_distant_candidates():
+    """A candidate beyond 12h even as the crow flies never reaches OSRM."""
+    from app.services import stage_machine
+
+    state = {
+        "experience_types": ["hills_nature"],
+        "destination_candidates": {"hills_nature": ["Leh", "Lonavala"]},
+    }
+    coords = {"Leh": {"lat": 34.15, "lng": 77.58}, "Lonavala": {"lat": 18.75, "lng": 73.41}}
+    mock_batch = AsyncMock(return_value=[{"distance_km": 83, "duration_mins": 90, "travel_time": "1h 30min"}])
+
+    with patch("app.services.stage_machine.resolve_origin_coords", new=AsyncMock(return_value={"lat": 19.076, "lng": 72.877, "name": "Mumbai"})), \
+         patch("app.services.stage_machine.geocode", new=AsyncMock(side_effect=lambda n: coords[n])), \
+         patch("app.services.stage_machine.batch_driving_times", new=mock_batch), \
+         patch("app.services.stage_machine._generate_destination_hooks", new=AsyncMock(return_value=["Great trek"])), \
+         patch("app.services.stage_machine.fetch_place_photos", new=AsyncMock(return_value=[])):
+        cards = await stage_machine.fetch_destination_suggestions(state)
+
+    assert mock_batch.call_args[0][1] == [coords["Lonavala"]]
+    assert [c["name"] for c in cards] == ["Lonavala"]
+
+
 @pytest.mark.asyncio
 async def test_fetch_suggestions_skips_filter_when_no_origin():
     """When resolve_origin_coords returns None, all geocoded candidates pass through."""
@@ -56,6 +56,68 @@ async def test_set_cached_is_silent_when_redis_unavailable():
         await set_cached("area_cards:goa:beach_coast", [{"id": "vagator"}])  # must not raise
 
 
+@pytest.mark.asyncio
+async def test_set_cached_with_hard_ttl_writes_value_and_fresh_marker():
+    from unittest.mock import MagicMock
+    from app.services.area_cache import set_cached
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    mock_r = MagicMock()
+    mock_r.pipeline = MagicMock(return_value=pipe)
+    with patch("app.services.area_cache._get_redis", new_callable=AsyncMock, return_value=mock_r):
+        await set_cached("area_cards:goa:beach_coast", [{"id": "vagator"}], ttl=100, hard_ttl=700)
+    calls = [c[0][:2] for c in pipe.setex.call_args_list]
+    assert calls == [("area_cards:goa:beach_coast", 700), ("area_cards:goa:beach_coast:fresh", 100)]
+
+
+@pytest.mark.asyncio
+async def test_get_cached_fresh_value_does_not_refresh():
+    from app.services.area_cache import get_cached
+    mock_r = AsyncMock()
+    mock_r.mget.return_value = [json.dumps([{"id": "vagator"}]), "1"]
+    revalidate = AsyncMock()
+    with patch("app.services.area_cache._get_redis", return_value=mock_r):
+        result = await get_cached("area_cards:goa:beach_coast", revalidate=revalidate)
+    assert result == [{"id": "vagator"}]
+    revalidate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_cached_stale_value_is_served_and_refreshed_in_background():
+    from app.services import area_cache
+    from app.services.job_scheduler import wait_for_jobs
+    mock_r = AsyncMock()
+    mock_r.mget.return_value = [json.dumps([{"id": "vagator"}]), None]
+    revalidate = AsyncMock(return_value=[{"id": "anjuna"}])
+    before = area_cache.area_cache_stats()
+    with patch("app.services.area_cache._get_redis", return_value=mock_r):
+        result = await area_cache.get_cached("area_cards:goa:beach_coast", revalidate=revalidate)
+        await wait_for_jobs()
+    after = area_cache.area_cache_stats()
+    assert result == [{"id": "vagator"}]
+    revalidate.assert_awaited_once()
+    assert after["stale_hits"] == before["stale_hits"] + 1
+    assert after["refresh_failures"] == before["refresh_failures"]
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_is_counted_and_keeps_stale_value():
+    from app.services import area_cache
+    from app.services.job_scheduler import wait_for_jobs
+    mock_r = AsyncMock()
+    mock_r.mget.return_value = [json.dumps([{"id": "vagator"}]), None]
+    revalidate = AsyncMock(side_effect=RuntimeError("tavily down"))
+    before = area_cache.area_cache_stats()["refresh_failures"]
+    with patch("app.services.area_cache._get_redis", return_value=mock_r):
+        result = await area_cache.get_cached("area_cards:goa:beach_coast", revalidate=revalidate)
+        await wait_for_jobs()
+    assert result == [{"id": "vagator"}]
+    assert area_cache.area_cache_stats()["refresh_failures"] == before + 1
+    mock_r.delete.assert_not_called()
+
+
 # ── fetch_vibe_cards ──────────────────────────────────────────────────────────
 
 @pytest.mark.asyncio
@@ -171,7 +233,8 @@ async def test_fetch_area_cards_uses_branch_b_vibe_ids_for_cache_key():
         state = {"destination": "Goa", "selected_vibe_ids": ["adv", "hid"]}
         result = await fetch_area_cards(state)
     # Cache key must use sorted vibe IDs when no experience_types
-    mock_get.assert_called_once_with("area_cards:goa:adv|hid")
+    mock_get.assert_called_once()
+    assert mock_get.call_args[0][0] == "area_cards:goa:adv|hid"
     assert result == cached
 
 
@@ -35,7 +35,7 @@ async def test_responder_persists_place_cards():
         "selected_place": None,
     }
     with patch("app.graph.nodes.responder._stage_determine_action", new_callable=AsyncMock) as mock_action, \
-         patch("app.graph.nodes.responder.aiohttp.ClientSession") as mock_session:
+         patch("app.services.http_client.aiohttp.ClientSession") as mock_session:
         mock_action.return_value = (None, None)
         mock_resp = AsyncMock()
         mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
@@ -60,7 +60,7 @@ async def test_responder_persists_selected_place():
         "selected_place": "chapora_fort",
     }
     with patch("app.graph.nodes.responder._stage_determine_action", new_callable=AsyncMock) as mock_action, \
-         patch("app.graph.nodes.responder.aiohttp.ClientSession") as mock_session:
+         patch("app.services.http_client.aiohttp.ClientSession") as mock_session:
         mock_action.return_value = (None, None)
         mock_resp = AsyncMock()
         mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
@@ -75,13 +75,55 @@ async def test_responder_persists_selected_place():
     assert result["selected_place"] == "chapora_fort"
 
 
+@pytest.mark.asyncio
+async def test_responder_runs_text_and_cards_concurrently():
+    import asyncio
+    from app.graph.nodes.responder import responder
+    started: list[str] = []
+    both_started = asyncio.Event()
+
+    async def fake_complete(messages, **kwargs):
+        started.append("text")
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return "Nice!"
+
+    async def fake_action(stage, state):
+        started.append("cards")
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return "show_area_cards", {"areas": []}
+
+    state: GraphState = {"destination": "Goa", "messages": [{"role": "user", "content": "hi"}]}
+    with patch("app.graph.nodes.responder.complete", side_effect=fake_complete), \
+         patch("app.graph.nodes.responder._stage_determine_action", side_effect=fake_action):
+        result = await responder(state)
+    assert sorted(started) == ["cards", "text"]
+    assert result["response"] == "Nice!"
+    assert result["action"] == "show_area_cards"
+
+
+@pytest.mark.asyncio
+async def test_responder_keeps_text_when_card_pipeline_fails():
+    from app.graph.nodes.responder import responder
+    state: GraphState = {"destination": "Goa", "messages": [{"role": "user", "content": "hi"}]}
+    with patch("app.graph.nodes.responder.complete", new_callable=AsyncMock, return_value="Nice!"), \
+         patch("app.graph.nodes.responder._stage_determine_action",
+               new_callable=AsyncMock, side_effect=RuntimeError("tavily down")):
+        result = await responder(state)
+    assert result["response"] == "Nice!"
+    assert result["action"] is None and result["payload"] is None
+
+
 # ── Task 2: get_area_reddit_signals ──────────────────────────────────────────
 
 @pytest.mark.asyncio
 async def test_get_area_reddit_signals_returns_expected_shape():
     """get_area_reddit_signals returns dict with place_signals and raw_posts_text."""
     from app.services.reddit_signals import get_area_reddit_signals
-    with patch("app.services.reddit_signals.asyncpraw.Reddit") as mock_reddit_cls, \
+    with patch("app.services.reddit_client.asyncpraw.Reddit") as mock_reddit_cls, \
          patch("app.services.reddit_signals._extract_place_signals", new_callable=AsyncMock) as mock_extract:
         mock_reddit = AsyncMock()
         mock_reddit.__aenter__ = AsyncMock(return_value=mock_reddit)
@@ -97,7 +139,7 @@ async def test_get_area_reddit_signals_returns_expected_shape():
 async def test_get_area_reddit_signals_on_failure_returns_empty():
     """get_area_reddit_signals returns empty dicts on any failure."""
     from app.services.reddit_signals import get_area_reddit_signals
-    with patch("app.services.reddit_signals.asyncpraw.Reddit", side_effect=Exception("no creds")):
+    with patch("app.services.reddit_client.asyncpraw.Reddit", side_effect=Exception("no creds")):
         result = await get_area_reddit_signals("Vagator", "Goa", [])
     assert result == {"place_signals": {}, "raw_posts_text": ""}
 
@@ -198,7 +240,7 @@ async def test_fetch_place_cards_returns_categories():
          patch("app.services.stage_machine.set_cached", new_callable=AsyncMock), \
          patch("app.services.stage_machine._groq_json", new_callable=AsyncMock) as mock_groq, \
          patch("app.services.stage_machine.search_places", new_callable=AsyncMock, return_value=mock_places), \
-         patch("asyncio.create_task"):
+         patch("app.services.stage_machine.schedule"):
         mock_groq.side_effect = [
             [{"label": "Beaches", "query": "beaches swimming"}],  # category call
             {"fort": "Panoramic views", "beach": "Hidden cove"},  # hooks call
@@ -227,7 +269,7 @@ async def test_fetch_place_cards_uses_cache_on_hit():
     }
     with patch("app.services.stage_machine.get_cached", new_callable=AsyncMock, return_value=cached), \
          patch("app.services.stage_machine.search_places", new_callable=AsyncMock) as mock_search, \
-         patch("asyncio.create_task"):
+         patch("app.services.stage_machine.schedule"):
         result = await fetch_place_cards(state)
     assert result == cached
     mock_search.assert_not_called()
@@ -249,7 +291,7 @@ async def test_fetch_place_cards_falls_back_to_defaults_on_groq_failure():
          patch("app.services.stage_machine.set_cached", new_callable=AsyncMock), \
          patch("app.services.stage_machine._groq_json", new_callable=AsyncMock, return_value=None), \
          patch("app.services.stage_machine.search_places", new_callable=AsyncMock, return_value=[]), \
-         patch("asyncio.create_task"):
+         patch("app.services.stage_machine.schedule"):
         result = await fetch_place_cards(state)
     assert isinstance(result, list)
 
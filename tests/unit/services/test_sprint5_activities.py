@@ -39,7 +39,7 @@ async def test_responder_persists_pending_activities():
         "pending_activities": {"chapora_fort": ["Sunrise Trek"]},
     }
     with patch("app.graph.nodes.responder._stage_determine_action", new_callable=AsyncMock) as mock_action, \
-         patch("app.graph.nodes.responder.aiohttp.ClientSession") as mock_session:
+         patch("app.services.http_client.aiohttp.ClientSession") as mock_session:
         mock_action.return_value = (None, None)
         mock_resp = AsyncMock()
         mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
@@ -64,7 +64,7 @@ async def test_responder_persists_activity_options():
         "activity_options": opts,
     }
     with patch("app.graph.nodes.responder._stage_determine_action", new_callable=AsyncMock) as mock_action, \
-         patch("app.graph.nodes.responder.aiohttp.ClientSession") as mock_session:
+         patch("app.services.http_client.aiohttp.ClientSession") as mock_session:
         mock_action.return_value = (None, None)
         mock_resp = AsyncMock()
         mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
@@ -87,7 +87,7 @@ async def test_responder_defaults_pending_activities_to_empty_dict():
         "messages": [{"role": "user", "content": "hi"}],
     }
     with patch("app.graph.nodes.responder._stage_determine_action", new_callable=AsyncMock) as mock_action, \
-         patch("app.graph.nodes.responder.aiohttp.ClientSession") as mock_session:
+         patch("app.services.http_client.aiohttp.ClientSession") as mock_session:
         mock_action.return_value = (None, None)
         mock_resp = AsyncMock()
         mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
@@ -150,7 +150,7 @@ async def test_build_activity_options_groq_success():
     ]
     with patch("app.services.activity_options.get_cached", new_callable=AsyncMock) as mock_get, \
          patch("app.services.activity_options.set_cached", new_callable=AsyncMock) as mock_set, \
-         patch("app.services.activity_options.aiohttp.ClientSession") as mock_session:
+         patch("app.services.http_client.aiohttp.ClientSession") as mock_session:
         mock_get.side_effect = [None, None]  # cache miss for activity_options, then area reddit
         mock_resp = AsyncMock()
         mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
@@ -174,7 +174,7 @@ async def test_build_activity_options_groq_failure_returns_defaults():
     from app.services.activity_options import build_activity_options, DEFAULT_ACTIVITIES
     with patch("app.services.activity_options.get_cached", new_callable=AsyncMock) as mock_get, \
          patch("app.services.activity_options.set_cached", new_callable=AsyncMock), \
-         patch("app.services.activity_options.aiohttp.ClientSession") as mock_session:
+         patch("app.services.http_client.aiohttp.ClientSession") as mock_session:
         mock_get.return_value = None
         mock_session.side_effect = Exception("Groq unreachable")
         result = await build_activity_options("chapora_fort", "Chapora Fort", "Goa", "north_goa", None, None)
@@ -206,7 +206,7 @@ async def test_build_activity_options_uses_reddit_context():
 
     with patch("app.services.activity_options.get_cached", new_callable=AsyncMock) as mock_get, \
          patch("app.services.activity_options.set_cached", new_callable=AsyncMock), \
-         patch("app.services.activity_options.aiohttp.ClientSession") as mock_session:
+         patch("app.services.http_client.aiohttp.ClientSession") as mock_session:
         mock_get.side_effect = [None, area_signals]
         mock_client = MagicMock()
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
@@ -239,7 +239,7 @@ async def test_build_activity_options_vibe_str_from_intent():
 
     with patch("app.services.activity_options.get_cached", new_callable=AsyncMock) as mock_get, \
          patch("app.services.activity_options.set_cached", new_callable=AsyncMock), \
-         patch("app.services.activity_options.aiohttp.ClientSession") as mock_session:
+         patch("app.services.http_client.aiohttp.ClientSession") as mock_session:
         mock_get.return_value = None
         mock_client = MagicMock()
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
@@ -106,7 +106,7 @@ _BASE_STATE = {
 async def test_generate_route_arcs_returns_groq_arcs():
     from app.services.day_planner import generate_route_arcs
     groq_arcs = [{"id": "north_to_south", "label": "North → South", "description": "Classic flow", "place_order": ["Chapora Fort"]}]
-    with patch("app.services.day_planner.aiohttp.ClientSession", _make_session_mock(json.dumps(groq_arcs))):
+    with patch("app.services.http_client.aiohttp.ClientSession", _make_session_mock(json.dumps(groq_arcs))):
         result = await generate_route_arcs(_BASE_STATE)
     assert isinstance(result, list) and len(result) >= 1
     assert result[0]["id"] == "north_to_south"
@@ -119,7 +119,7 @@ async def test_generate_route_arcs_fallback_on_groq_failure():
     bad_session = MagicMock()
     bad_session.__aenter__ = AsyncMock(side_effect=Exception("Groq down"))
     bad_session.__aexit__ = AsyncMock(return_value=False)
-    with patch("app.services.day_planner.aiohttp.ClientSession", MagicMock(return_value=bad_session)):
+    with patch("app.services.http_client.aiohttp.ClientSession", MagicMock(return_value=bad_session)):
         result = await generate_route_arcs(_BASE_STATE)
     assert len(result) == 2
     assert result[0]["id"] == "selection_order"
@@ -153,7 +153,7 @@ async def test_generate_route_arcs_filters_by_selected_places():
             {"id": "baga_beach", "name": "Baga Beach"},   # NOT selected
         ]}],
     }
-    with patch("app.services.day_planner.aiohttp.ClientSession", MagicMock(return_value=session)):
+    with patch("app.services.http_client.aiohttp.ClientSession", MagicMock(return_value=session)):
         await generate_route_arcs(state)
 
     assert captured, "Groq was never called"
@@ -175,7 +175,7 @@ async def test_generate_route_arcs_fallback_uses_all_place_cards_when_selected_p
     bad_session = MagicMock()
     bad_session.__aenter__ = AsyncMock(side_effect=Exception("Groq down"))
     bad_session.__aexit__ = AsyncMock(return_value=False)
-    with patch("app.services.day_planner.aiohttp.ClientSession", MagicMock(return_value=bad_session)):
+    with patch("app.services.http_client.aiohttp.ClientSession", MagicMock(return_value=bad_session)):
         result = await generate_route_arcs(state)
     assert result[0]["place_order"] == ["Chapora Fort", "Baga Beach"]
     assert result[1]["place_order"] == ["Baga Beach", "Chapora Fort"]
@@ -203,8 +203,8 @@ _GROQ_PLAN = json.dumps([
 @pytest.mark.asyncio
 async def test_generate_day_plan_returns_groq_plan():
     from app.services.day_planner import generate_day_plan
-    with patch("app.services.day_planner.get_cached", new_callable=AsyncMock, return_value=None), \
-         patch("app.services.day_planner.aiohttp.ClientSession", _make_session_mock(_GROQ_PLAN)):
+    with patch("app.services.day_planner.get_many_cached", new_callable=AsyncMock, return_value=[]), \
+         patch("app.services.http_client.aiohttp.ClientSession", _make_session_mock(_GROQ_PLAN)):
         result = await generate_day_plan(_PLAN_STATE)
     assert isinstance(result, list) and len(result) > 0
     assert result[0]["day"] == 1
@@ -219,8 +219,8 @@ async def test_generate_day_plan_fallback_distributes_evenly():
     bad_session = MagicMock()
     bad_session.__aenter__ = AsyncMock(side_effect=Exception("Groq down"))
     bad_session.__aexit__ = AsyncMock(return_value=False)
-    with patch("app.services.day_planner.get_cached", new_callable=AsyncMock, return_value=None), \
-         patch("app.services.day_planner.aiohttp.ClientSession", MagicMock(return_value=bad_session)):
+    with patch("app.services.day_planner.get_many_cached", new_callable=AsyncMock, return_value=[]), \
+         patch("app.services.http_client.aiohttp.ClientSession", MagicMock(return_value=bad_session)):
         result = await generate_day_plan(state)
     assert len(result) == 3
     assert all("day" in d and "activities" in d for d in result)
@@ -250,8 +250,8 @@ async def test_generate_day_plan_uses_cached_activity_objects():
     session.__aexit__ = AsyncMock(return_value=False)
     session.post = MagicMock(side_effect=fake_post)
 
-    with patch("app.services.day_planner.get_cached", new_callable=AsyncMock, return_value=cached_activities), \
-         patch("app.services.day_planner.aiohttp.ClientSession", MagicMock(return_value=session)):
+    with patch("app.services.day_planner.get_many_cached", new_callable=AsyncMock, return_value=[cached_activities]), \
+         patch("app.services.http_client.aiohttp.ClientSession", MagicMock(return_value=session)):
         await generate_day_plan(state)
 
     assert captured, "Groq was never called"
@@ -265,8 +265,8 @@ async def test_generate_day_plan_trip_duration_zero_defaults_to_one():
     bad_session = MagicMock()
     bad_session.__aenter__ = AsyncMock(side_effect=Exception("Groq down"))
     bad_session.__aexit__ = AsyncMock(return_value=False)
-    with patch("app.services.day_planner.get_cached", new_callable=AsyncMock, return_value=None), \
-         patch("app.services.day_planner.aiohttp.ClientSession", MagicMock(return_value=bad_session)):
+    with patch("app.services.day_planner.get_many_cached", new_callable=AsyncMock, return_value=[]), \
+         patch("app.services.http_client.aiohttp.ClientSession", MagicMock(return_value=bad_session)):
         result = await generate_day_plan(state)
     assert len(result) == 1  # trip_duration defaults to 1
     assert result[0]["day"] == 1
@@ -301,7 +301,7 @@ _GROQ_BRIEF = json.dumps({
 async def test_generate_destination_brief_returns_all_keys():
     from app.services.day_planner import generate_destination_brief
     with patch("app.services.day_planner.tavily_search", new_callable=AsyncMock, return_value=[]), \
-         patch("app.services.day_planner.aiohttp.ClientSession", _make_session_mock(_GROQ_BRIEF)):
+         patch("app.services.http_client.aiohttp.ClientSession", _make_session_mock(_GROQ_BRIEF)):
         result = await generate_destination_brief(_BRIEF_STATE)
     assert "weather" in result
     assert "language_tip" in result
@@ -318,7 +318,7 @@ async def test_generate_destination_brief_fallback_on_groq_failure():
     bad_session.__aenter__ = AsyncMock(side_effect=Exception("Groq down"))
     bad_session.__aexit__ = AsyncMock(return_value=False)
     with patch("app.services.day_planner.tavily_search", new_callable=AsyncMock, return_value=[]), \
-         patch("app.services.day_planner.aiohttp.ClientSession", MagicMock(return_value=bad_session)):
+         patch("app.services.http_client.aiohttp.ClientSession", MagicMock(return_value=bad_session)):
         result = await generate_destination_brief(_BRIEF_STATE)
     assert result["destination"] == "Goa"
     assert "note" in result
@@ -329,6 +329,6 @@ async def test_generate_destination_brief_proceeds_when_tavily_fails():
     """Tavily error does not raise — Groq uses own knowledge, brief is still returned."""
     from app.services.day_planner import generate_destination_brief
     with patch("app.services.day_planner.tavily_search", new_callable=AsyncMock, side_effect=Exception("Tavily down")), \
-         patch("app.services.day_planner.aiohttp.ClientSession", _make_session_mock(_GROQ_BRIEF)):
+         patch("app.services.http_client.aiohttp.ClientSession", _make_session_mock(_GROQ_BRIEF)):
         result = await generate_destination_brief(_BRIEF_STATE)
     assert "weather" in result  # brief still returned via Groq
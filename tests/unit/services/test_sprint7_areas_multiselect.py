@@ -85,6 +85,64 @@ async def test_determine_action_areas_selected_deduplicates_places():
     assert payload["places"][0]["id"] == "chapora_fort"
 
 
+@pytest.mark.asyncio
+async def test_determine_action_areas_selected_fetches_areas_concurrently():
+    import asyncio
+    from app.services.stage_machine import determine_action
+    state = {"destination": "Goa", "selected_areas": ["north_goa", "south_goa", "central_goa"]}
+    in_flight = peak = 0
+
+    async def fake_fetch(state_arg, area_id=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [{"label": area_id, "places": [{"id": area_id}]}]
+
+    with patch("app.services.stage_machine.fetch_place_cards", side_effect=fake_fetch), \
+         patch("app.services.stage_machine.PLACE_CARDS_AREA_CONCURRENCY", 2):
+        await determine_action("areas_selected", state)
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_determine_action_areas_selected_dedup_follows_selection_order():
+    import asyncio
+    from app.services.stage_machine import determine_action
+    state = {"destination": "Goa", "selected_areas": ["north_goa", "central_goa"]}
+    shared = {"id": "chapora_fort", "name": "Chapora Fort"}
+
+    async def fake_fetch(state_arg, area_id=None):
+        # First-selected area finishes last — its copy must still win
+        await asyncio.sleep(0.02 if area_id == "north_goa" else 0)
+        return [{"label": area_id, "places": [shared, {"id": f"{area_id}_only"}]}]
+
+    with patch("app.services.stage_machine.fetch_place_cards", side_effect=fake_fetch):
+        _, payload = await determine_action("areas_selected", state)
+
+    assert [c["label"] for c in state["place_cards"]] == ["north_goa", "central_goa"]
+    assert [p["id"] for p in payload["places"]] == ["chapora_fort", "north_goa_only", "central_goa_only"]
+
+
+@pytest.mark.asyncio
+async def test_determine_action_areas_selected_failed_area_does_not_drop_others():
+    from app.services.stage_machine import determine_action
+    state = {"destination": "Goa", "selected_areas": ["north_goa", "south_goa"]}
+
+    async def fake_fetch(state_arg, area_id=None):
+        if area_id == "north_goa":
+            raise RuntimeError("maps down")
+        return [{"label": "Peaceful", "places": [{"id": "palolem"}]}]
+
+    with patch("app.services.stage_machine.fetch_place_cards", side_effect=fake_fetch):
+        action, payload = await determine_action("areas_selected", state)
+
+    assert action == "show_place_cards"
+    assert [p["id"] for p in payload["places"]] == ["palolem"]
+
+
 @pytest.mark.asyncio
 async def test_determine_action_areas_selected_includes_pending_activities():
     from app.services.stage_machine import determine_action
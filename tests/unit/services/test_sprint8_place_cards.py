@@ -41,7 +41,7 @@ async def test_fetch_place_cards_includes_vibe_id_and_vibe_hint():
                side_effect=[mock_cats, mock_hooks]), \
          patch("app.services.stage_machine.search_places", new_callable=AsyncMock,
                return_value=mock_places), \
-         patch("app.services.stage_machine.asyncio.create_task"):
+         patch("app.services.stage_machine.schedule"):
         result = await fetch_place_cards(state, area_id="vagator")
 
     assert result, "Expected non-empty result"
@@ -77,7 +77,7 @@ async def test_fetch_place_cards_backwards_compat_flat_hook():
                side_effect=[mock_cats, mock_hooks]), \
          patch("app.services.stage_machine.search_places", new_callable=AsyncMock,
                return_value=mock_places), \
-         patch("app.services.stage_machine.asyncio.create_task"):
+         patch("app.services.stage_machine.schedule"):
         result = await fetch_place_cards(state, area_id="vagator")
 
     place = result[0]["places"][0]
@@ -118,7 +118,7 @@ async def test_fetch_place_cards_includes_area_name():
                side_effect=[mock_cats, mock_hooks]), \
          patch("app.services.stage_machine.search_places", new_callable=AsyncMock,
                return_value=mock_places), \
-         patch("app.services.stage_machine.asyncio.create_task"):
+         patch("app.services.stage_machine.schedule"):
         result = await fetch_place_cards(state, area_id="north_goa")
 
     assert result[0]["places"][0]["area"] == "North Goa"
@@ -144,10 +144,125 @@ async def test_fetch_place_cards_invalid_vibe_id_defaults_to_adv():
         ]),
         patch("app.services.stage_machine._rank_places_for_area",
               return_value=[{"id": "baga", "name": "Baga Beach", "photo_url": None}]),
-        patch("asyncio.create_task"),
+        patch("app.services.stage_machine.schedule"),
     ):
         result = await fetch_place_cards(state, area_id="north_goa")
 
     places = [p for cat in result for p in cat.get("places", [])]
     assert len(places) == 1
     assert places[0]["vibe_id"] == "adv", "Invalid vibe_id 'adventure' should fall back to 'adv'"
+
+
+# ── Pipelined place-card pipeline ─────────────────────────────────────────────
+
+def _pipeline_state() -> dict:
+    from app.models import TravelIntent, Destination
+    return {
+        "destination": "Goa",
+        "selected_vibe_ids": ["adv"],
+        "area_cards": [{"id": "vagator", "name": "Vagator"}],
+        "experience_types": [],
+        "travel_intent": TravelIntent(destination=Destination(city="Goa")),
+        "reddit_signals": {},
+        "blog_signals": {},
+    }
+
+
+@pytest.mark.asyncio
+async def test_likely_default_searches_overlap_the_category_call():
+    import asyncio
+    from app.services.stage_machine import PLACE_SPECULATIVE_SEARCHES, fetch_place_cards
+    searched: list[str] = []
+    llm_cats = [
+        {"label": "Cafés & Bars", "query": "beach shacks cafes"},      # same label as a default
+        {"label": "Forts", "query": "fort heritage ruins"},            # new search
+    ]
+
+    async def fake_search(location, query):
+        searched.append(query)
+        return [_make_place(query.split()[0], query.split()[0].title())]
+
+    async def fake_groq(prompt, max_tokens=500, call_site=""):
+        if call_site == "place_categories":
+            await asyncio.sleep(0)
+            # The speculative searches were already in flight while Groq was choosing
+            assert len(searched) == PLACE_SPECULATIVE_SEARCHES
+            return llm_cats
+        return {}
+
+    with patch("app.services.stage_machine.get_cached", new_callable=AsyncMock, return_value=None), \
+         patch("app.services.stage_machine.set_cached", new_callable=AsyncMock), \
+         patch("app.services.stage_machine._groq_json", side_effect=fake_groq), \
+         patch("app.services.stage_machine.search_places", side_effect=fake_search), \
+         patch("app.services.stage_machine.schedule"):
+        result = await fetch_place_cards(_pipeline_state(), area_id="vagator")
+
+    assert searched[:PLACE_SPECULATIVE_SEARCHES] == [
+        "cafes bars restaurants local food", "attractions activities things to do",
+    ]
+    # The overlapping category reused its speculative search; only Forts searched again
+    assert searched[PLACE_SPECULATIVE_SEARCHES:] == ["fort heritage ruins"]
+    assert [c["label"] for c in result] == ["Cafés & Bars", "Forts"]
+    assert result[0]["places"][0]["id"] == "cafes"
+
+
+@pytest.mark.asyncio
+async def test_groq_category_failure_falls_back_to_default_searches():
+    from app.services.stage_machine import DEFAULT_PLACE_CATEGORIES, fetch_place_cards
+    searched: list[str] = []
+
+    async def fake_search(location, query):
+        searched.append(query)
+        return [_make_place(f"p{len(searched)}", f"Place {len(searched)}")]
+
+    with patch("app.services.stage_machine.get_cached", new_callable=AsyncMock, return_value=None), \
+         patch("app.services.stage_machine.set_cached", new_callable=AsyncMock), \
+         patch("app.services.stage_machine._groq_json", new_callable=AsyncMock, return_value=None), \
+         patch("app.services.stage_machine.search_places", side_effect=fake_search), \
+         patch("app.services.stage_machine.schedule"):
+        result = await fetch_place_cards(_pipeline_state(), area_id="vagator")
+
+    # Speculative defaults are reused; each default is searched exactly once
+    assert sorted(searched) == sorted(c["query"] for c in DEFAULT_PLACE_CATEGORIES)
+    assert [c["label"] for c in result] == [c["label"] for c in DEFAULT_PLACE_CATEGORIES]
+
+
+@pytest.mark.asyncio
+async def test_categories_stream_before_the_last_hook_finishes():
+    import asyncio
+    from app.services.stage_machine import fetch_place_cards
+    llm_cats = [{"label": "Beaches", "query": "beach surf"}, {"label": "Forts", "query": "fort ruins"}]
+    hook_calls: list[str] = []
+    emitted: list[tuple] = []
+    beaches_streamed = asyncio.Event()
+
+    async def fake_search(location, query):
+        return [_make_place(query.split()[0], query.split()[0].title())]
+
+    async def fake_groq(prompt, max_tokens=500, call_site=""):
+        if call_site == "place_categories":
+            return llm_cats
+        hook_calls.append(prompt)
+        pid = "beach" if '"beach"' in prompt else "fort"
+        if pid == "fort":
+            # The Forts hook can't finish until Beaches has been streamed
+            await asyncio.wait_for(beaches_streamed.wait(), timeout=1)
+        return {pid: {"hook": f"{pid} hook", "vibe_id": "hid", "vibe_hint": "walks"}}
+
+    def fake_emit(event, data):
+        emitted.append((event, data))
+        if data["label"] == "Beaches":
+            beaches_streamed.set()
+
+    with patch("app.services.stage_machine.get_cached", new_callable=AsyncMock, return_value=None), \
+         patch("app.services.stage_machine.set_cached", new_callable=AsyncMock), \
+         patch("app.services.stage_machine._groq_json", side_effect=fake_groq), \
+         patch("app.services.stage_machine.search_places", side_effect=fake_search), \
+         patch("app.services.stage_machine.emit", side_effect=fake_emit), \
+         patch("app.services.stage_machine.schedule"):
+        result = await fetch_place_cards(_pipeline_state(), area_id="vagator")
+
+    assert len(hook_calls) == 2
+    assert [d["label"] for e, d in emitted if e == "place_category"] == ["Beaches", "Forts"]
+    assert result[0]["places"][0]["hook"] == "beach hook"
+    assert result[1]["places"][0]["hook"] == "fort hook"
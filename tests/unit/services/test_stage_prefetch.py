@@ -0,0 +1,146 @@
+"""Unit tests for speculative next-stage cache warming."""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+
+def _warm(log: list, name: str):
+    async def warm():
+        log.append(name)
+    return warm
+
+
+# ── prefetch / cancel_prefetch ────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_prefetch_warms_cold_keys_and_skips_cached_ones():
+    from app.services import stage_prefetch
+    from app.services.job_scheduler import wait_for_jobs
+    log: list[str] = []
+    targets = [
+        ("area_cards", "area_cards:goa:beach_coast", _warm(log, "goa")),
+        ("area_cards", "area_cards:gokarna:beach_coast", _warm(log, "gokarna")),
+    ]
+    with patch.object(stage_prefetch, "_budget", stage_prefetch._Budget(100)), \
+         patch.object(stage_prefetch, "is_cached", new_callable=AsyncMock,
+                      side_effect=lambda key: key.startswith("area_cards:goa:")):
+        assert stage_prefetch.prefetch("t-warm", targets) == 2
+        await wait_for_jobs()
+    assert log == ["gokarna"]
+    assert "t-warm" not in stage_prefetch._wanted
+
+
+@pytest.mark.asyncio
+async def test_cancel_drops_jobs_that_have_not_started():
+    from app.services import stage_prefetch
+    from app.services.job_scheduler import wait_for_jobs
+    log: list[str] = []
+    with patch.object(stage_prefetch, "_budget", stage_prefetch._Budget(100)), \
+         patch.object(stage_prefetch, "is_cached", new_callable=AsyncMock, return_value=False):
+        stage_prefetch.prefetch("t-cancel", [("place_cards", "place_cards:goa:vagator:adv", _warm(log, "vagator"))])
+        stage_prefetch.cancel_prefetch("t-cancel")
+        await wait_for_jobs()
+    assert log == []
+
+
+@pytest.mark.asyncio
+async def test_new_round_replaces_the_old_one_but_keeps_shared_keys():
+    from app.services import stage_prefetch
+    from app.services.job_scheduler import wait_for_jobs
+    log: list[str] = []
+    with patch.object(stage_prefetch, "_budget", stage_prefetch._Budget(100)), \
+         patch.object(stage_prefetch, "is_cached", new_callable=AsyncMock, return_value=False):
+        stage_prefetch.prefetch("t-round", [
+            ("activity_options", "activity_options:goa:a", _warm(log, "a")),
+            ("activity_options", "activity_options:goa:b", _warm(log, "b")),
+        ])
+        # The user picked place a: b is still a likely next tap, a is not
+        stage_prefetch.prefetch("t-round", [
+            ("activity_options", "activity_options:goa:b", _warm(log, "b-again")),
+            ("activity_options", "activity_options:goa:c", _warm(log, "c")),
+        ])
+        await wait_for_jobs()
+    assert sorted(log) == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_budget_caps_speculative_groq_calls():
+    from app.services import stage_prefetch
+    from app.services.job_scheduler import wait_for_jobs
+    log: list[str] = []
+    targets = [("place_cards", f"place_cards:goa:area{i}:adv", _warm(log, str(i))) for i in range(3)]
+    before = stage_prefetch.prefetch_stats()["over_budget"]
+    # Room for two place-card pipelines at 5 Groq calls each
+    with patch.object(stage_prefetch, "_budget", stage_prefetch._Budget(10)), \
+         patch.object(stage_prefetch, "is_cached", new_callable=AsyncMock, return_value=False):
+        stage_prefetch.prefetch("t-budget", targets)
+        await wait_for_jobs()
+    assert len(log) == 2
+    assert stage_prefetch.prefetch_stats()["over_budget"] == before + 1
+
+
+# ── stage_machine targets ─────────────────────────────────────────────────────
+
+def test_destination_chips_target_area_cards_for_top_destinations():
+    from app.services.stage_machine import _prefetch_targets
+    state = {"experience_types": ["beach_coast"], "trip_who": "couple"}
+    payload = {"destinations": [{"name": "Goa"}, {"name": "Gokarna"}, {"name": "Alibaug"}]}
+    targets = _prefetch_targets("show_destination_chips", payload, state)
+    assert [(k, key) for k, key, _ in targets] == [
+        ("area_cards", "area_cards:goa:beach_coast"),
+        ("area_cards", "area_cards:gokarna:beach_coast"),
+    ]
+    assert "destination" not in state
+
+
+def test_place_cards_target_activity_options_for_unpicked_places():
+    from app.services.stage_machine import _prefetch_targets
+    state = {"destination": "Goa", "selected_areas": ["vagator"], "pending_activities": {"p1": ["Trek"]}}
+    payload = {"places": [{"id": "p1", "name": "Fort"}, {"id": "p2", "name": "Cafe"}, {"id": "p3", "name": "Beach"}]}
+    targets = _prefetch_targets("show_place_cards", payload, state)
+    assert [key for _, key, _ in targets] == ["activity_options:goa:p2", "activity_options:goa:p3"]
+    assert _prefetch_targets("show_pace_options", {}, state) == []
+
+
+@pytest.mark.asyncio
+async def test_area_cards_payload_warms_place_cards_under_the_real_key():
+    from app.services import stage_machine, stage_prefetch
+    from app.services.job_scheduler import wait_for_jobs
+    state = {"destination": "Goa", "experience_types": ["beach_coast"]}
+    areas = [{"id": "vagator", "name": "Vagator"}, {"id": "anjuna", "name": "Anjuna"}, {"id": "palolem", "name": "Palolem"}]
+    with patch.object(stage_machine, "fetch_area_cards", new_callable=AsyncMock, return_value=areas), \
+         patch.object(stage_machine, "fetch_place_cards", new_callable=AsyncMock, return_value=[]) as places, \
+         patch.object(stage_prefetch, "_budget", stage_prefetch._Budget(100)), \
+         patch.object(stage_prefetch, "is_cached", new_callable=AsyncMock, return_value=False) as cached:
+        action, _ = await stage_machine.determine_action("destination_known", state)
+        await wait_for_jobs()
+    assert action == "show_area_cards"
+    assert [c.kwargs["area_id"] for c in places.await_args_list] == ["vagator", "anjuna"]
+    assert places.await_args_list[0].args[0]["area_cards"] == areas
+    assert [c.args[0] for c in cached.await_args_list] == [
+        "place_cards:goa:vagator:beach_coast", "place_cards:goa:anjuna:beach_coast",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rounds_are_scoped_by_the_thread_id_from_the_request():
+    from app.api.schemas import ChatRequest
+    from app.api.server import _build_state_input
+    from app.services import stage_machine, stage_prefetch
+    from app.services.job_scheduler import wait_for_jobs
+
+    def turn(thread_id: str) -> dict:
+        state = _build_state_input(ChatRequest(message="", thread_id=thread_id))
+        return {**state, "destination": "Goa", "experience_types": ["beach_coast"]}
+    areas = [{"id": "vagator", "name": "Vagator"}]
+    alice, bob = turn("thread-alice"), turn("thread-bob")
+    with patch.object(stage_machine, "fetch_area_cards", new_callable=AsyncMock, return_value=areas), \
+         patch.object(stage_machine, "fetch_place_cards", new_callable=AsyncMock, return_value=[]) as places, \
+         patch.object(stage_prefetch, "_budget", stage_prefetch._Budget(100)), \
+         patch.object(stage_prefetch, "is_cached", new_callable=AsyncMock, return_value=False):
+        await stage_machine.determine_action("destination_known", alice)
+        # Bob acting must not cancel Alice's queued round
+        await stage_machine.determine_action("destination_known", bob)
+        assert set(stage_prefetch._wanted) == {"thread-alice", "thread-bob"}
+        await wait_for_jobs()
+    assert places.await_count == 2
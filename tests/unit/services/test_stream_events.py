@@ -0,0 +1,66 @@
+"""Unit tests for the /chat/stream event channel."""
+import asyncio
+
+import pytest
+
+
+def test_emit_is_noop_without_bound_stream():
+    from app.services.stream_events import emit, is_streaming
+    assert is_streaming() is False
+    emit("token", {"text": "hi"})  # must not raise
+
+
+@pytest.mark.asyncio
+async def test_emit_reaches_queue_from_child_tasks():
+    from app.services.stream_events import bind_stream, emit, unbind_stream
+    queue: asyncio.Queue = asyncio.Queue()
+    token = bind_stream(queue)
+    try:
+        await asyncio.create_task(_emit_later(emit))
+    finally:
+        unbind_stream(token)
+    assert queue.get_nowait() == ("node", {"node": "responder"})
+    emit("node", {"node": "ignored"})
+    assert queue.empty()
+
+
+async def _emit_later(emit):
+    await asyncio.sleep(0)
+    emit("node", {"node": "responder"})
+
+
+@pytest.mark.asyncio
+async def test_responder_stream_forwards_tokens_and_assembles_text():
+    from unittest.mock import patch
+    from app.graph.nodes.responder import _stream_response
+    from app.services.stream_events import bind_stream, unbind_stream
+
+    async def fake_stream(messages, **kwargs):
+        for chunk in ["Head ", "to ", "**Vagator**."]:
+            yield chunk
+
+    queue: asyncio.Queue = asyncio.Queue()
+    token = bind_stream(queue)
+    try:
+        with patch("app.graph.nodes.responder.stream", fake_stream):
+            text = await _stream_response([{"role": "user", "content": "Goa"}])
+    finally:
+        unbind_stream(token)
+    assert text == "Head to **Vagator**."
+    tokens = [queue.get_nowait() for _ in range(queue.qsize())]
+    assert tokens == [("token", {"text": "Head "}), ("token", {"text": "to "}), ("token", {"text": "**Vagator**."})]
+
+
+@pytest.mark.asyncio
+async def test_responder_stream_keeps_partial_text_on_midstream_failure():
+    from unittest.mock import patch
+    from app.graph.nodes.responder import _stream_response
+    from app.services.llm_gateway import LLMError
+
+    async def flaky_stream(messages, **kwargs):
+        yield "Head to Vagator"
+        raise LLMError("connection reset")
+
+    with patch("app.graph.nodes.responder.stream", flaky_stream):
+        text = await _stream_response([{"role": "user", "content": "Goa"}])
+    assert text == "Head to Vagator"
@@ -0,0 +1,126 @@
+"""Unit tests for latency tracing and the Prometheus exposition."""
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+
+# ── span / traced ─────────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_traced_records_external_latency_and_turn_span():
+    from app.services.tracing import EXTERNAL_SECONDS, end_turn, start_turn, traced
+
+    @traced("tavily", "search_test")
+    async def fake_search(q):
+        await asyncio.sleep(0)
+        return [q]
+
+    token = start_turn()
+    assert await fake_search("goa") == ["goa"]
+    spans = end_turn(token)
+
+    assert [(s, op) for s, op, _ in spans] == [("tavily", "search_test")]
+    counts, _total = EXTERNAL_SECONDS._series[("tavily", "search_test")]
+    assert counts[-1] >= 1
+
+
+@pytest.mark.asyncio
+async def test_span_counts_errors_and_reraises():
+    from app.services.tracing import EXTERNAL_ERRORS, span
+
+    before = EXTERNAL_ERRORS.value("osrm", "route_test")
+    with pytest.raises(RuntimeError):
+        with span("osrm", "route_test"):
+            raise RuntimeError("boom")
+    assert EXTERNAL_ERRORS.value("osrm", "route_test") == before + 1
+
+
+@pytest.mark.asyncio
+async def test_spans_outside_a_turn_are_not_collected():
+    from app.services.tracing import _turn, span
+    with span("nominatim", "geocode_test"):
+        pass
+    assert _turn.get() is None
+
+
+@pytest.mark.asyncio
+async def test_turn_collects_spans_from_child_tasks():
+    from app.services.tracing import end_turn, span, start_turn
+
+    async def child(name):
+        with span("groq", name):
+            await asyncio.sleep(0)
+
+    token = start_turn()
+    await asyncio.gather(child("a"), child("b"))
+    spans = end_turn(token)
+    assert sorted(op for _, op, _ in spans) == ["a", "b"]
+
+
+# ── traced_node / builder ─────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_traced_node_records_node_histogram():
+    from app.services.tracing import NODE_SECONDS, traced_node
+
+    async def node(state):
+        return {"response": state["message"]}
+
+    wrapped = traced_node("node_test", node)
+    assert await wrapped({"message": "hi"}) == {"response": "hi"}
+    assert NODE_SECONDS._series[("node_test",)][0][-1] >= 1
+
+
+@pytest.mark.asyncio
+async def test_groq_latency_lands_in_external_histogram():
+    from app.services import llm_gateway
+    from app.services.tracing import EXTERNAL_SECONDS
+    llm_gateway._record_success("tracing_test", 0.0, 100, {}, 1)
+    assert ("groq", "tracing_test") in EXTERNAL_SECONDS._series
+
+
+# ── area_cache counters ───────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_area_cache_records_hit_and_miss_by_key_family():
+    from app.services import area_cache
+    from app.services.tracing import CACHE_LOOKUPS
+
+    redis = AsyncMock()
+    redis.get = AsyncMock(side_effect=['[{"id": "a"}]', None])
+    hits = CACHE_LOOKUPS.value("trace_cards", "hit")
+    misses = CACHE_LOOKUPS.value("trace_cards", "miss")
+    with patch.object(area_cache, "_get_redis", AsyncMock(return_value=redis)):
+        assert await area_cache.get_cached("trace_cards:goa") == [{"id": "a"}]
+        assert await area_cache.get_cached("trace_cards:pune") is None
+    assert CACHE_LOOKUPS.value("trace_cards", "hit") == hits + 1
+    assert CACHE_LOOKUPS.value("trace_cards", "miss") == misses + 1
+
+
+# ── exposition / summary ──────────────────────────────────────────────────────
+
+def test_render_metrics_is_prometheus_text():
+    from app.services.tracing import render_metrics, span
+    with span("mcp", 'google_maps/"quoted"'):
+        pass
+    text = render_metrics()
+    assert "# TYPE roammate_external_call_duration_seconds histogram" in text
+    assert 'op="google_maps/\\"quoted\\"",le="+Inf"}' in text
+    assert "roammate_external_call_duration_seconds_count{" in text
+    assert text.endswith("\n")
+
+
+def test_turn_summary_groups_and_sorts_by_total():
+    from app.services.tracing import turn_summary
+    spans = [
+        ("node", "responder", 1.2),
+        ("tavily", "search", 0.4),
+        ("tavily", "search", 0.5),
+        ("groq", "responder", 1.0),
+    ]
+    line = turn_summary(spans, 2.0)
+    assert line == (
+        "[timing] total=2000ms | node:responder=1200ms | groq:responder=1000ms"
+        " | tavily:search=900ms×2"
+    )